@@ -7,14 +7,18 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from tkinter import messagebox, ttk
 
+from dataset_service import get_dataset_service
+from startup_profiler import profile_phase
+
 
 def _load_json_file(path, default_payload):
     if not os.path.exists(path):
         return default_payload
 
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        with profile_phase("json", f"load {os.path.basename(path)}"):
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
     except (json.JSONDecodeError, OSError):
         return default_payload
 
@@ -209,7 +213,7 @@ class BuildPlannerApp:
         self.dataset_path = os.path.join(self.base_dir, "dataset.json")
         self.saved_builds_path = os.path.join(self.base_dir, self.SAVE_FILENAME)
 
-        self.dataset_payload = _load_json_file(self.dataset_path, {"heroesCore": {}, "items": {}})
+        self.dataset_payload = get_dataset_service().load(self.dataset_path, {"heroesCore": {}, "items": {}})
         self.heroes = self._load_heroes()
         self.items = self._load_items()
 
@@ -1,8 +1,9 @@
-import json
 import os
 import tkinter as tk
 from tkinter import ttk
 
+from dataset_service import get_dataset_service
+
 
 DEFAULT_INVENTORY_SLOTS = 6
 MAX_ATTRIBUTE_BONUS_POINTS = 7
@@ -286,8 +287,7 @@ class DatasetHeroApp:
         self.recalculate()
 
     def _load_heroes(self):
-        with open(self.dataset_path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = get_dataset_service().load(self.dataset_path, {"heroes": {}, "items": {}})
         self.dataset_payload = payload
         heroes = payload.get("heroes", {})
         if isinstance(heroes, dict):
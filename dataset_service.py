@@ -0,0 +1,207 @@
+"""Process-wide parsed JSON data files shared by every tab"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+
+from hero_name_matcher import HeroNameMatcher, normalize_compact_text, normalize_match_text
+from startup_profiler import profile_phase
+
+
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _intern_strings(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key) if isinstance(key, str) else key: _intern_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    return value
+
+
+def snapshot_path_for(path):
+    return f"{path}{SNAPSHOT_SUFFIX}"
+
+
+def read_snapshot(snapshot_path):
+    """Return (size, mtime_ns, digest, payload) from a marshal snapshot, or None if unreadable."""
+    try:
+        with open(snapshot_path, "rb") as handle:
+            record = marshal.loads(handle.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(record, tuple) or len(record) != 5 or record[0] != SNAPSHOT_FORMAT_VERSION:
+        return None
+    return record[1:]
+
+
+def write_snapshot(snapshot_path, size, mtime_ns, digest, payload):
+    """Atomically write a marshal snapshot; failures (read-only dirs etc.) are ignored."""
+    temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as handle:
+            marshal.dump((SNAPSHOT_FORMAT_VERSION, size, mtime_ns, digest, payload), handle)
+        os.replace(temp_path, snapshot_path)
+    except (OSError, ValueError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def build_hero_match_index(hero_names):
+    """Spaced and compact normalized hero-name lookups used for typed/voice hero matching."""
+    match_names = {
+        hero_name: normalize_match_text(hero_name)
+        for hero_name in hero_names
+    }
+    match_lookup = {
+        normalized_name: hero_name
+        for hero_name, normalized_name in match_names.items()
+        if normalized_name
+    }
+    compact_lookup = {
+        normalize_compact_text(hero_name): hero_name
+        for hero_name in hero_names
+        if normalize_compact_text(hero_name)
+    }
+    return {
+        "match_names": match_names,
+        "match_lookup": match_lookup,
+        "compact_lookup": compact_lookup,
+        "matcher": HeroNameMatcher(match_lookup, compact_lookup),
+    }
+
+
+class DatasetFile:
+    """One parsed JSON file plus the indexes derived from that exact parse."""
+
+    def __init__(self, path, payload, stat_key, digest):
+        self.path = path
+        self.payload = payload
+        self.stat_key = stat_key
+        self.digest = digest
+        self.indexes = {}
+
+
+class DatasetService:
+    """
+    Parse each JSON data file once and hand the same payload to every caller.
+
+    A file is re-read only when its mtime or size changes, and re-parsed only
+    when its content hash changes too; derived indexes are dropped with the
+    parse they were built from. Payloads and indexes are shared between tabs,
+    so callers must treat them as read-only and copy before editing.
+
+    With ``use_snapshots`` each parse is also stored as a marshal snapshot
+    (strings interned) next to the source file. A snapshot whose recorded
+    size and mtime match the source is loaded without touching the JSON; on
+    an mtime/size mismatch it is still used if the source hash matches.
+    """
+
+    def __init__(self, use_snapshots=True):
+        self.files = {}
+        self.lock = threading.RLock()
+        self.use_snapshots = use_snapshots
+
+    def load(self, path, default_payload):
+        """Return the shared parsed payload, or ``default_payload`` if the file is missing or invalid."""
+        entry = self._entry(path)
+        if entry is None:
+            return default_payload
+        if isinstance(default_payload, dict) and isinstance(entry.payload, dict):
+            return entry.payload
+        if isinstance(default_payload, list) and isinstance(entry.payload, list):
+            return entry.payload
+        return default_payload
+
+    def index(self, path, name, builder):
+        """
+        Return ``builder(payload)`` memoized per file parse under ``name``.
+
+        Returns None when the file is missing or invalid.
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        with self.lock:
+            if name not in entry.indexes:
+                entry.indexes[name] = builder(entry.payload)
+            return entry.indexes[name]
+
+    def hero_match_index(self, path, hero_names):
+        hero_names = tuple(hero_names)
+        return self.index(path, ("hero_match", hero_names), lambda _payload: build_hero_match_index(hero_names))
+
+    def invalidate(self, path=None):
+        with self.lock:
+            if path is None:
+                self.files = {}
+            else:
+                self.files.pop(os.path.abspath(path), None)
+
+    def _entry(self, path):
+        path = os.path.abspath(path)
+        with self.lock:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self.files.pop(path, None)
+                return None
+
+            entry = self.files.get(path)
+            stat_key = (stat.st_mtime_ns, stat.st_size)
+            if entry is not None and entry.stat_key == stat_key:
+                return entry
+
+            file_name = os.path.basename(path)
+            snapshot = None
+            if self.use_snapshots and entry is None:
+                with profile_phase("json", f"read snapshot {file_name}"):
+                    snapshot = read_snapshot(snapshot_path_for(path))
+            if snapshot is not None and (snapshot[1], snapshot[0]) == stat_key:
+                entry = DatasetFile(path, snapshot[3], stat_key, snapshot[2])
+                self.files[path] = entry
+                return entry
+
+            try:
+                with open(path, "rb") as handle:
+                    raw = handle.read()
+            except OSError:
+                return entry
+            digest = hashlib.sha1(raw).hexdigest()
+            if entry is not None and entry.digest == digest:
+                entry.stat_key = stat_key
+                return entry
+
+            if snapshot is not None and snapshot[2] == digest:
+                payload = snapshot[3]
+            else:
+                try:
+                    with profile_phase("json", f"parse {file_name}"):
+                        payload = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    self.files.pop(path, None)
+                    return None
+                if self.use_snapshots:
+                    payload = _intern_strings(payload)
+            if self.use_snapshots:
+                with profile_phase("json", f"write snapshot {file_name}"):
+                    write_snapshot(snapshot_path_for(path), stat.st_size, stat.st_mtime_ns, digest, payload)
+
+            entry = DatasetFile(path, payload, stat_key, digest)
+            self.files[path] = entry
+            return entry
+
+
+_shared_dataset_service = DatasetService()
+
+
+def get_dataset_service():
+    return _shared_dataset_service
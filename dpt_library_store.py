@@ -0,0 +1,267 @@
+"""Indexed, lazily decoded view of dpt_matchups_synergies.json for the DPT explorer"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+from startup_profiler import profile_phase
+
+
+RECORDS_SUFFIX = ".records"
+RECORDS_MAGIC = b"DPTREC1\n"
+RECORDS_HEADER_LENGTH = struct.Struct(">Q")
+DPT_RECORD_CACHE_SIZE = 32
+
+
+def records_path_for(path):
+    return f"{path}{RECORDS_SUFFIX}"
+
+
+def write_records_file(records_path, payload, size, mtime_ns, digest):
+    """
+    Write ``payload["heroes"]`` as one compact JSON body per hero-role after a
+    header of byte offsets. Failures (read-only dirs etc.) are ignored; the
+    caller keeps working from the parsed payload.
+    """
+    bodies = []
+    heroes_index = {}
+    offset = 0
+    for hero_name, hero_record in payload.get("heroes", {}).items():
+        if not isinstance(hero_record, dict):
+            continue
+        roles = hero_record.get("roles", {})
+        role_offsets = {}
+        for role_key, role_record in (roles.items() if isinstance(roles, dict) else ()):
+            body = json.dumps(role_record, separators=(",", ":")).encode("utf-8")
+            role_offsets[role_key] = [offset, len(body)]
+            bodies.append(body)
+            offset += len(body)
+        heroes_index[hero_name] = {
+            "meta": {key: value for key, value in hero_record.items() if key != "roles"},
+            "roles": role_offsets,
+        }
+
+    header = {
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "digest": digest,
+        "meta": {key: value for key, value in payload.items() if key != "heroes"},
+        "heroes": heroes_index,
+    }
+    return _write_records(records_path, header, bodies)
+
+
+def _write_records(records_path, header, bodies):
+    header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    temp_path = f"{records_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as handle:
+            handle.write(RECORDS_MAGIC)
+            handle.write(RECORDS_HEADER_LENGTH.pack(len(header)))
+            handle.write(header)
+            for body in bodies:
+                handle.write(body)
+        os.replace(temp_path, records_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+class DptLibraryStore:
+    """
+    Hero-role records of the DPT matchup/synergy library, decoded on demand.
+
+    The JSON library is converted once into a ``.records`` file next to it: a
+    header mapping hero -> role -> (offset, length), followed by one compact
+    JSON body per hero-role. The records file is memory-mapped, so opening
+    the store only parses the header; ``role_record`` decodes a single body
+    and keeps the last ``cache_size`` of them in an LRU. When the library's
+    size or mtime changes the records file is rebuilt, or only re-stamped
+    with the new size/mtime if the content hash still matches.
+    """
+
+    def __init__(self, path, cache_size=DPT_RECORD_CACHE_SIZE):
+        self.path = path
+        self.records_path = records_path_for(path)
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.status = "missing"
+        self.heroes = {}
+        self.meta = {}
+        self.fallback_heroes = None
+        self.data_offset = 0
+        self.mapping = None
+        self.records = OrderedDict()
+        self.stat_key = None
+
+    def load(self):
+        """
+        (Re)open the library. Sets ``status`` to "ok", "empty", "missing" or
+        "invalid" and returns it.
+        """
+        with self.lock:
+            self._close()
+            try:
+                stat = os.stat(self.path)
+            except OSError:
+                self.status = "missing"
+                return self.status
+            self.stat_key = (stat.st_size, stat.st_mtime_ns)
+
+            header = self._open_records()
+            if header is None or (header["size"], header["mtime_ns"]) != self.stat_key:
+                header = self._rebuild_records(stat, header)
+            if header is None:
+                return self.status
+
+            self.heroes = header["heroes"]
+            self.meta = header["meta"]
+            self.status = "ok" if self.heroes else "empty"
+            return self.status
+
+    def hero_names(self):
+        return list(self.heroes)
+
+    def has_hero(self, hero_name):
+        return hero_name in self.heroes
+
+    def role_keys(self, hero_name):
+        return list(self.heroes.get(hero_name, {}).get("roles", {}))
+
+    def role_record(self, hero_name, role_key):
+        """Return the decoded role record (shared; treat as read-only), or {} if absent."""
+        cache_key = (hero_name, role_key)
+        with self.lock:
+            record = self.records.get(cache_key)
+            if record is not None:
+                self.records.move_to_end(cache_key)
+                return record
+
+            if self.fallback_heroes is not None:
+                hero_record = self.fallback_heroes.get(hero_name, {})
+                roles = hero_record.get("roles", {}) if isinstance(hero_record, dict) else {}
+                record = roles.get(role_key, {}) if isinstance(roles, dict) else {}
+                return record if isinstance(record, dict) else {}
+
+            location = self.heroes.get(hero_name, {}).get("roles", {}).get(role_key)
+            if location is None or self.mapping is None:
+                return {}
+            start = self.data_offset + location[0]
+            try:
+                record = json.loads(self.mapping[start:start + location[1]].decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                return {}
+            if not isinstance(record, dict):
+                return {}
+
+            self.records[cache_key] = record
+            while len(self.records) > self.cache_size:
+                self.records.popitem(last=False)
+            return record
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+    def _close(self):
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+        self.records = OrderedDict()
+        self.fallback_heroes = None
+        self.heroes = {}
+        self.meta = {}
+
+    def _open_records(self):
+        try:
+            with open(self.records_path, "rb") as handle:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        header_start = len(RECORDS_MAGIC) + RECORDS_HEADER_LENGTH.size
+        try:
+            if mapping[:len(RECORDS_MAGIC)] != RECORDS_MAGIC:
+                raise ValueError("not a DPT records file")
+            (header_length,) = RECORDS_HEADER_LENGTH.unpack(mapping[len(RECORDS_MAGIC):header_start])
+            with profile_phase("json", f"read index {os.path.basename(self.records_path)}"):
+                header = json.loads(mapping[header_start:header_start + header_length].decode("utf-8"))
+            if not isinstance(header, dict) or not isinstance(header.get("heroes"), dict):
+                raise ValueError("invalid DPT records header")
+        except (ValueError, struct.error, UnicodeDecodeError):
+            mapping.close()
+            return None
+
+        self.mapping = mapping
+        self.data_offset = header_start + header_length
+        return header
+
+    def _restamp_records(self, stale_header, stat):
+        if self.mapping is None:
+            return None
+        bodies = [self.mapping[self.data_offset:]]
+        header = dict(stale_header, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        # Unmap before replacing the file; Windows refuses to replace a mapped file.
+        self.mapping.close()
+        self.mapping = None
+        with profile_phase("json", f"restamp index {os.path.basename(self.records_path)}"):
+            _write_records(self.records_path, header, bodies)
+        return self._open_records()
+
+    def _rebuild_records(self, stat, stale_header):
+        try:
+            with open(self.path, "rb") as handle:
+                raw = handle.read()
+        except OSError:
+            self.status = "missing"
+            return None
+        digest = hashlib.sha1(raw).hexdigest()
+        if stale_header is not None and stale_header.get("digest") == digest:
+            # Same content with a new mtime (copy, checkout, touch): restamp the
+            # records file so later launches pass the stat check without hashing.
+            restamped = self._restamp_records(stale_header, stat)
+            if restamped is not None:
+                return restamped
+
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+        try:
+            with profile_phase("json", f"parse {os.path.basename(self.path)}"):
+                payload = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            self.status = "invalid"
+            return None
+        if not isinstance(payload, dict) or not isinstance(payload.get("heroes", {}), dict):
+            self.status = "invalid"
+            return None
+
+        with profile_phase("json", f"write index {os.path.basename(self.records_path)}"):
+            written = write_records_file(self.records_path, payload, stat.st_size, stat.st_mtime_ns, digest)
+        header = self._open_records() if written else None
+        if header is None:
+            # Records file unavailable; serve this session from the parsed payload.
+            self.fallback_heroes = payload.get("heroes", {})
+            return {
+                "meta": {key: value for key, value in payload.items() if key != "heroes"},
+                "heroes": {
+                    hero_name: {
+                        "meta": {},
+                        "roles": {
+                            role_key: None
+                            for role_key in (hero_record.get("roles") if isinstance(hero_record.get("roles"), dict) else {})
+                        },
+                    }
+                    for hero_name, hero_record in self.fallback_heroes.items()
+                    if isinstance(hero_record, dict)
+                },
+            }
+        return header
@@ -7,27 +7,36 @@ import sys
 import threading
 import time
 import tkinter as tk
+from array import array
 from base64 import b64encode
-from difflib import get_close_matches
 from datetime import datetime
 from tkinter import messagebox, ttk
 from urllib.parse import quote
 
+from dataset_service import build_hero_match_index, get_dataset_service
+from dpt_library_store import DptLibraryStore
+from hero_icon_cache import HeroIconAtlas, HeroIconCache, center_crop_photoimage
+from hero_name_matcher import best_close_match
+from hero_prefix_trie import AliasPrefixTrie
+from startup_profiler import profile_phase
+from virtual_table import TableModel, VirtualTreeview
+
 try:
     from scripts.score_dpt_draft import (
         DRAFT_WEIGHTS as DPT_DRAFT_WEIGHTS,
-        score_candidate as score_dpt_candidate,
+        IncrementalDraftScorer as DptIncrementalDraftScorer,
         finalize_candidate_normalization as finalize_dpt_candidate_normalization,
     )
     DPT_SCORER_IMPORT_ERROR = None
 except Exception as exc:  # pragma: no cover - fallback keeps the UI usable.
     DPT_DRAFT_WEIGHTS = None
-    score_dpt_candidate = None
+    DptIncrementalDraftScorer = None
     finalize_dpt_candidate_normalization = None
     DPT_SCORER_IMPORT_ERROR = str(exc)
 
 
 ROLE_KEYS = ["1", "2", "3", "4", "5"]
+ROLE_INDEX = {role: index for index, role in enumerate(ROLE_KEYS)}
 SCORE_VALUES = [3, 2, 1, 0, -1, -2, -3]
 BOX_TYPES = ("synergy", "matchup")
 BOX_LABELS = {
@@ -105,6 +114,7 @@ VOICE_INITIAL_SILENCE_TIMEOUT_SECONDS = 3
 VOICE_BABBLE_TIMEOUT_SECONDS = 0.6
 VOICE_END_SILENCE_TIMEOUT_MS = 240
 VOICE_END_SILENCE_TIMEOUT_AMBIGUOUS_MS = 300
+SCORE_TEXT_HERO_IDS_CACHE_LIMIT = 4096
 DRAFT_ACTION_HOTKEYS = {
     "1": "ally:1",
     "2": "ally:2",
@@ -193,8 +203,9 @@ def _load_json_file(path, default_payload):
         return default_payload
 
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        with profile_phase("json", f"load {os.path.basename(path)}"):
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
     except (json.JSONDecodeError, OSError):
         return default_payload
 
@@ -235,7 +246,20 @@ class HeroDraftLibraryApp:
         self.dpt_library_path = os.path.join(self.base_dir, "dpt_matchups_synergies.json")
         self.dpt_scores_path = os.path.join(self.base_dir, "dpt_scores.json")
         self.hero_icons_dir = os.path.join(self.base_dir, "assets", "hero-icons")
+        self.hero_icon_cache = HeroIconCache(
+            os.path.join(self.base_dir, "assets", "hero-icon-cache"),
+            DRAFT_GRID_BUTTON_PIXEL_WIDTH,
+            DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
+        )
+        self.hero_icon_atlas = HeroIconAtlas.load(
+            os.path.join(self.base_dir, "assets", "hero-icon-atlas.json"),
+            DRAFT_GRID_BUTTON_PIXEL_WIDTH,
+            DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
+            DRAFT_BUTTON_STYLE_MAP,
+        )
+        self.hero_icon_atlas_image = None
 
+        self.dataset_service = get_dataset_service()
         self.heroes = self._load_heroes()
         self.hero_names = sorted(self.heroes.keys())
         self.hero_attributes = {
@@ -261,39 +285,41 @@ class HeroDraftLibraryApp:
             )
             for short, _ in ATTRIBUTE_ORDER
         }
-        self.hero_match_names = {
-            hero: _normalize_match_text(hero)
-            for hero in self.hero_names
-        }
-        self.hero_match_lookup = {
-            normalized: hero
-            for hero, normalized in self.hero_match_names.items()
-            if normalized
-        }
-        self.hero_compact_lookup = {
-            _normalize_compact_text(hero): hero
-            for hero in self.hero_names
-            if _normalize_compact_text(hero)
-        }
-        self.hero_match_choices = list(self.hero_match_lookup.keys())
-        self.hero_compact_choices = list(self.hero_compact_lookup.keys())
+        hero_match_index = self.dataset_service.hero_match_index(self.dataset_path, self.hero_names)
+        if hero_match_index is None:
+            hero_match_index = build_hero_match_index(self.hero_names)
+        self.hero_match_names = hero_match_index["match_names"]
+        self.hero_match_lookup = hero_match_index["match_lookup"]
+        self.hero_compact_lookup = hero_match_index["compact_lookup"]
+        self.hero_name_matcher = hero_match_index["matcher"]
         self.draft_voice_base_aliases = {
             hero_name: self._draft_voice_aliases_for_hero(hero_name)
             for hero_name in self.draft_hero_names
         }
+        self.draft_voice_prefix_trie = self._build_draft_voice_prefix_trie(compact=False)
+        self.draft_voice_compact_prefix_trie = self._build_draft_voice_prefix_trie(compact=True)
+        self.draft_typeahead_text = ""
+        self.draft_typeahead_frontier = self.draft_voice_prefix_trie.start()
         self.draft_voice_alias_lookup = self._build_draft_voice_alias_lookup()
-        self.draft_voice_prefix_lookup = self._build_draft_voice_prefix_lookup(compact=False)
-        self.draft_voice_compact_prefix_lookup = self._build_draft_voice_prefix_lookup(compact=True)
-        self.draft_voice_alias_token_choices = self._build_draft_voice_alias_token_choices()
         self.draft_voice_backend_path = shutil.which("powershell.exe")
 
         self.library_data = self._load_library_data()
+        self.hero_ids = {hero_name: hero_id for hero_id, hero_name in enumerate(self.hero_names)}
+        self.score_text_hero_ids = {}
+        self.library_score_index = {}
+        self.library_role_content = set()
+        self.library_score_matrix = {}
+        self.library_role_columns = {}
+        self.library_draft_sums = {}
+        self.library_zero_vector = array("h", bytes(2 * len(ROLE_KEYS) * len(self.hero_names)))
+        self._compile_library_score_index()
         self.saved_drafts_data = self._load_saved_drafts_data()
         self.app_state_data = self._load_app_state_data()
         self.dpt_library_load_error = ""
-        self.dpt_library_data = self._load_dpt_library_data()
+        self.dpt_library = self._load_dpt_library_data()
         self.dpt_scores_load_error = ""
         self.dpt_scores_data = self._load_dpt_scores_data()
+        self.dpt_draft_scorer = DptIncrementalDraftScorer(self.dpt_scores_data) if DptIncrementalDraftScorer else None
 
         self.current_edit_hero = None
         self.current_edit_attribute = "uni" if self.hero_attribute_data_missing else "str"
@@ -318,6 +344,8 @@ class HeroDraftLibraryApp:
         self.enemy_summary_var = tk.StringVar(value="Enemies: none")
         self.ally_summary_var = tk.StringVar(value="Allies: none")
         self.draft_single_grid_var = tk.BooleanVar(value=False)
+        self.draft_typeahead_var = tk.StringVar(value="")
+        self.draft_typeahead_status_var = tk.StringVar(value="")
         self.draft_voice_enabled_var = tk.BooleanVar(value=False)
         self.draft_voice_status_var = tk.StringVar(value="")
         self.dpt_candidate_filter_var = tk.StringVar(value="")
@@ -339,11 +367,18 @@ class HeroDraftLibraryApp:
         self.edit_score_vars = {}
         self.search_results = []
         self.draft_hero_buttons = {}
+        self.draft_hero_button_hosts = {}
+        self.draft_grid_layout_frames = {}
+        self.draft_button_visual_keys = {}
+        self.draft_button_styled_heroes = set()
+        self.edit_hero_buttons = {}
         self.draft_treeviews = {}
         self.draft_action_buttons = {}
         self.ally_mode_buttons = {}
         self.dpt_explorer_trees = {}
         self.dpt_explorer_tree_sort_state = {}
+        self.dpt_explorer_tree_models = {}
+        self.dpt_explorer_model_source = None
         self.latest_dpt_candidate_rows = []
         self.latest_dpt_candidate_lookup = {}
         self.tree_heading_tooltip_window = None
@@ -372,6 +407,7 @@ class HeroDraftLibraryApp:
         self._build_ui()
         self.draft_action_var.trace_add("write", lambda *_: self._refresh_draft_action_buttons())
         self.dpt_candidate_filter_var.trace_add("write", lambda *_: self._select_dpt_candidate_from_search())
+        self.draft_typeahead_var.trace_add("write", lambda *_: self._update_draft_typeahead())
         for tree_key, filter_var in self.dpt_matrix_filter_vars.items():
             filter_var.trace_add("write", lambda *_args, key=tree_key: self._select_dpt_matrix_row_from_search(key))
         self._bind_global_mousewheel()
@@ -383,7 +419,7 @@ class HeroDraftLibraryApp:
         self._refresh_draft_outputs()
 
     def _load_heroes(self):
-        payload = _load_json_file(self.dataset_path, {"heroes": {}, "heroesCore": {}})
+        payload = self.dataset_service.load(self.dataset_path, {"heroes": {}, "heroesCore": {}})
         for key in ("heroes", "heroesCore"):
             heroes = payload.get(key, {})
             if isinstance(heroes, dict) and heroes:
@@ -409,7 +445,7 @@ class HeroDraftLibraryApp:
         return "uni"
 
     def _load_library_data(self):
-        payload = _load_json_file(self.library_path, {"heroes": {}})
+        payload = self.dataset_service.load(self.library_path, {"heroes": {}})
         heroes_payload = payload.get("heroes", {})
         if not isinstance(heroes_payload, dict):
             heroes_payload = {}
@@ -462,24 +498,22 @@ class HeroDraftLibraryApp:
 
     def _load_dpt_library_data(self):
         self.dpt_library_load_error = ""
-        payload = _load_json_file(self.dpt_library_path, {"heroes": {}})
-        heroes_payload = payload.get("heroes", {})
-        if not isinstance(heroes_payload, dict):
+        library = DptLibraryStore(self.dpt_library_path)
+        status = library.load()
+        if status == "invalid":
             self.dpt_library_load_error = "dpt_matchups_synergies.json is invalid."
-            return {"heroes": {}}
-        if not heroes_payload:
-            if os.path.exists(self.dpt_library_path):
-                self.dpt_library_load_error = "dpt_matchups_synergies.json has no hero entries yet."
-            else:
-                self.dpt_library_load_error = "dpt_matchups_synergies.json was not found."
-        return payload
+        elif status == "empty":
+            self.dpt_library_load_error = "dpt_matchups_synergies.json has no hero entries yet."
+        elif status == "missing":
+            self.dpt_library_load_error = "dpt_matchups_synergies.json was not found."
+        return library
 
     def _save_app_state(self):
         self.app_state_data["draft"]["your_role"] = self.your_role_var.get()
         _write_json_file(self.app_state_path, self.app_state_data)
 
     def _default_dpt_explorer_hero(self):
-        raw_heroes = self.dpt_library_data.get("heroes", {}) if hasattr(self, "dpt_library_data") else {}
+        raw_heroes = self.dpt_library.hero_names() if hasattr(self, "dpt_library") else []
         score_heroes = self.dpt_scores_data.get("heroes", {}) if hasattr(self, "dpt_scores_data") else {}
         names = sorted(set(raw_heroes) | set(score_heroes))
         return names[0] if names else ""
@@ -993,11 +1027,18 @@ class HeroDraftLibraryApp:
             text="A-Z Grid",
             variable=self.draft_single_grid_var,
             command=self._rebuild_draft_hero_grid,
-        ).pack(anchor="w")
+        ).pack(side="left")
+        ttk.Label(grid_toggle_row, text="Type hero").pack(side="left", padx=(16, 0))
+        typeahead_entry = ttk.Entry(grid_toggle_row, textvariable=self.draft_typeahead_var, width=24)
+        typeahead_entry.pack(side="left", padx=(8, 8))
+        typeahead_entry.bind("<Return>", self._apply_draft_typeahead)
+        typeahead_entry.bind("<Escape>", lambda _event: self.draft_typeahead_var.set(""))
+        ttk.Label(grid_toggle_row, textvariable=self.draft_typeahead_status_var).pack(side="left")
 
         self.draft_grid_body = ttk.Frame(grid_frame)
         self.draft_grid_body.pack(fill="x")
         self._rebuild_draft_hero_grid()
+        self.parent.after_idle(self._start_draft_icon_prewarming)
 
         summary_notebook = ttk.Notebook(self.draft_content)
         summary_notebook.pack(fill="both", expand=True, pady=(0, 12))
@@ -1220,7 +1261,7 @@ class HeroDraftLibraryApp:
         tree_frame = ttk.Frame(tab)
         tree_frame.pack(fill="both", expand=True)
 
-        tree = ttk.Treeview(
+        tree = VirtualTreeview(
             tree_frame,
             columns=columns,
             show="headings",
@@ -1228,7 +1269,8 @@ class HeroDraftLibraryApp:
         )
         y_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
         x_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        tree.configure(xscrollcommand=x_scrollbar.set)
+        tree.set_yscroll_callback(y_scrollbar.set)
 
         for column in columns:
             tree.heading(
@@ -1249,7 +1291,7 @@ class HeroDraftLibraryApp:
         return tree
 
     def _get_dpt_explorer_hero_names(self):
-        raw_heroes = self.dpt_library_data.get("heroes", {})
+        raw_heroes = self.dpt_library.hero_names()
         score_heroes = self.dpt_scores_data.get("heroes", {})
         return sorted(set(raw_heroes) | set(score_heroes))
 
@@ -1276,7 +1318,7 @@ class HeroDraftLibraryApp:
 
     def _get_dpt_explorer_role_keys(self, hero_name):
         role_keys = set()
-        raw_roles = self.dpt_library_data.get("heroes", {}).get(hero_name, {}).get("roles", {})
+        raw_roles = self.dpt_library.role_keys(hero_name)
         score_roles = self.dpt_scores_data.get("heroes", {}).get(hero_name, {}).get("roles", {})
         role_keys.update(role for role in raw_roles if role in ROLE_KEYS)
         role_keys.update(role for role in score_roles if role in ROLE_KEYS)
@@ -1330,12 +1372,13 @@ class HeroDraftLibraryApp:
         role_key = self.dpt_explorer_role_var.get().split(" - ", 1)[0].strip()
         filter_text = self.dpt_explorer_filter_var.get().strip().lower()
 
-        raw_hero_data = self.dpt_library_data.get("heroes", {}).get(hero_name, {})
-        raw_role_data = raw_hero_data.get("roles", {}).get(role_key, {})
+        raw_role_data = self.dpt_library.role_record(hero_name, role_key)
         score_hero_data = self.dpt_scores_data.get("heroes", {}).get(hero_name, {})
         score_role_data = score_hero_data.get("roles", {}).get(role_key, {})
 
         if not hero_name:
+            self.dpt_explorer_tree_models = {}
+            self.dpt_explorer_model_source = None
             self.dpt_explorer_status_var.set(
                 self.dpt_library_load_error or self.dpt_scores_load_error or "No DPT explorer data available."
             )
@@ -1344,37 +1387,45 @@ class HeroDraftLibraryApp:
                 self._clear_tree_with_message(tree, "No DPT data available.")
             return
 
-        self.dpt_explorer_status_var.set(
-            f"{hero_name} | Role {role_key or '?'} {self._role_label(role_key) if role_key else ''}".strip()
-        )
-        self._set_readonly_text(
-            self.dpt_explorer_summary_text,
-            self._format_dpt_explorer_summary_text(hero_name, role_key, raw_role_data, score_role_data),
-        )
-        self._populate_dpt_explorer_raw_tree(
-            self.dpt_explorer_trees["matchups"],
-            raw_role_data.get("matchups", []),
-            filter_text,
-            empty_message="No matchup rows for this hero role.",
-        )
-        self._populate_dpt_explorer_raw_tree(
-            self.dpt_explorer_trees["synergies"],
-            raw_role_data.get("synergies", []),
-            filter_text,
-            empty_message="No synergy rows for this hero role.",
-        )
-        self._populate_dpt_explorer_pair_tree(
-            self.dpt_explorer_trees["vs_scores"],
-            score_role_data.get("pairs", {}).get("vs", {}),
-            filter_text,
-            empty_message="No VS score rows for this hero role.",
-        )
-        self._populate_dpt_explorer_pair_tree(
-            self.dpt_explorer_trees["with_scores"],
-            score_role_data.get("pairs", {}).get("with", {}),
-            filter_text,
-            empty_message="No WITH score rows for this hero role.",
-        )
+        # Filter-only changes reuse the row models built for this hero role.
+        previous_source = self.dpt_explorer_model_source
+        if not (
+            previous_source is not None
+            and previous_source[:2] == (hero_name, role_key)
+            and previous_source[2] is raw_role_data
+            and previous_source[3] is score_role_data
+        ):
+            self.dpt_explorer_model_source = (hero_name, role_key, raw_role_data, score_role_data)
+            self.dpt_explorer_status_var.set(
+                f"{hero_name} | Role {role_key or '?'} {self._role_label(role_key) if role_key else ''}".strip()
+            )
+            self._set_readonly_text(
+                self.dpt_explorer_summary_text,
+                self._format_dpt_explorer_summary_text(hero_name, role_key, raw_role_data, score_role_data),
+            )
+            self.dpt_explorer_tree_models = {
+                str(self.dpt_explorer_trees["matchups"]): (
+                    self._build_dpt_explorer_raw_model(raw_role_data.get("matchups", [])),
+                    "No matchup rows for this hero role.",
+                ),
+                str(self.dpt_explorer_trees["synergies"]): (
+                    self._build_dpt_explorer_raw_model(raw_role_data.get("synergies", [])),
+                    "No synergy rows for this hero role.",
+                ),
+                str(self.dpt_explorer_trees["vs_scores"]): (
+                    self._build_dpt_explorer_pair_model(score_role_data.get("pairs", {}).get("vs", {})),
+                    "No VS score rows for this hero role.",
+                ),
+                str(self.dpt_explorer_trees["with_scores"]): (
+                    self._build_dpt_explorer_pair_model(score_role_data.get("pairs", {}).get("with", {})),
+                    "No WITH score rows for this hero role.",
+                ),
+            }
+
+        for tree in self.dpt_explorer_trees.values():
+            model, _empty_message = self.dpt_explorer_tree_models[str(tree)]
+            model.set_filter(filter_text)
+            self._apply_dpt_explorer_tree_sort(tree)
 
     def _format_dpt_explorer_summary_text(self, hero_name, role_key, raw_role_data, score_role_data):
         if not raw_role_data and not score_role_data:
@@ -1427,83 +1478,72 @@ class HeroDraftLibraryApp:
 
         return "\n".join(lines)
 
-    def _populate_dpt_explorer_raw_tree(self, tree, rows, filter_text, empty_message):
-        filtered_rows = []
-        for row in rows:
-            hero_name = str(row.get("hero", ""))
-            role_label = str(row.get("role", ""))
-            haystack = f"{hero_name} {role_label}".lower()
-            if filter_text and filter_text not in haystack:
-                continue
-            filtered_rows.append(row)
-
-        filtered_rows.sort(
+    def _build_dpt_explorer_raw_model(self, rows):
+        rows = sorted(
+            rows,
             key=lambda row: (
                 -(int(row.get("matches") or 0)),
                 -(float(row.get("winrate") or 0.0)),
                 str(row.get("hero", "")),
-            )
+            ),
+        )
+        return TableModel(
+            [
+                (
+                    row.get("hero", ""),
+                    row.get("role", ""),
+                    self._format_optional_number(row.get("winrate"), digits=1),
+                    self._format_optional_number(row.get("laneAdvantage"), digits=1),
+                    int(row.get("matches") or 0),
+                )
+                for row in rows
+            ],
+            [f"{row.get('hero', '')} {row.get('role', '')}".lower() for row in rows],
+            self._dpt_explorer_value_sort_key,
         )
 
-        rows_to_insert = [
-            (
-                row.get("hero", ""),
-                row.get("role", ""),
-                self._format_optional_number(row.get("winrate"), digits=1),
-                self._format_optional_number(row.get("laneAdvantage"), digits=1),
-                int(row.get("matches") or 0),
-            )
-            for row in filtered_rows
-        ]
-        self._populate_tree_rows(tree, rows_to_insert, empty_message)
-
-    def _populate_dpt_explorer_pair_tree(self, tree, pair_payload, filter_text, empty_message):
-        rows = []
+    def _build_dpt_explorer_pair_model(self, pair_payload):
+        entries = []
         for target_hero, target_data in pair_payload.items():
             for role_key, role_data in target_data.get("roles", {}).items():
-                hero_and_role = f"{target_hero} {role_data.get('role', '')}".lower()
-                if filter_text and filter_text not in hero_and_role:
-                    continue
                 win_score = role_data.get("win", {})
                 lane_score = role_data.get("lane", {})
-                rows.append(
+                entries.append(
                     (
-                        target_hero,
-                        role_data.get("role", self._role_label(role_key)),
-                        self._format_optional_number(win_score.get("raw")),
-                        self._format_optional_number(win_score.get("normalized"), digits=2),
-                        self._format_optional_number(win_score.get("confidence"), digits=4),
-                        self._format_optional_number(lane_score.get("raw")),
-                        self._format_optional_number(lane_score.get("normalized"), digits=2),
-                        self._format_optional_number(lane_score.get("confidence"), digits=4),
+                        (
+                            target_hero,
+                            role_data.get("role", self._role_label(role_key)),
+                            self._format_optional_number(win_score.get("raw")),
+                            self._format_optional_number(win_score.get("normalized"), digits=2),
+                            self._format_optional_number(win_score.get("confidence"), digits=4),
+                            self._format_optional_number(lane_score.get("raw")),
+                            self._format_optional_number(lane_score.get("normalized"), digits=2),
+                            self._format_optional_number(lane_score.get("confidence"), digits=4),
+                        ),
+                        f"{target_hero} {role_data.get('role', '')}".lower(),
                     )
                 )
 
-        rows.sort(
-            key=lambda item: (
-                -(float(item[2]) if item[2] not in {"-", ""} else -999.0),
-                item[0],
-                item[1],
+        entries.sort(
+            key=lambda entry: (
+                -(float(entry[0][2]) if entry[0][2] not in {"-", ""} else -999.0),
+                entry[0][0],
+                entry[0][1],
             )
         )
-        self._populate_tree_rows(tree, rows, empty_message)
-
-    def _populate_tree_rows(self, tree, rows, empty_message):
-        for item_id in tree.get_children():
-            tree.delete(item_id)
-
-        if not rows:
-            self._clear_tree_with_message(tree, empty_message)
-            return
-
-        for row in rows:
-            tree.insert("", "end", values=row)
-        self._apply_dpt_explorer_tree_sort(tree)
+        return TableModel(
+            [row for row, _search_text in entries],
+            [search_text for _row, search_text in entries],
+            self._dpt_explorer_value_sort_key,
+        )
 
     def _clear_tree_with_message(self, tree, message):
+        values = [message] + [""] * (len(tree["columns"]) - 1)
+        if isinstance(tree, VirtualTreeview):
+            tree.set_rows([tuple(values)])
+            return
         for item_id in tree.get_children():
             tree.delete(item_id)
-        values = [message] + [""] * (len(tree["columns"]) - 1)
         tree.insert("", "end", values=tuple(values))
 
     def _format_optional_number(self, value, digits=4):
@@ -1530,6 +1570,11 @@ class HeroDraftLibraryApp:
         self._apply_dpt_explorer_tree_sort(tree)
 
     def _apply_dpt_explorer_tree_sort(self, tree):
+        model_entry = self.dpt_explorer_tree_models.get(str(tree))
+        if model_entry is not None:
+            self._show_dpt_explorer_model(tree, *model_entry)
+            return
+
         state = self.dpt_explorer_tree_sort_state.get(str(tree))
         if not state:
             return
@@ -1551,6 +1596,21 @@ class HeroDraftLibraryApp:
         for index, (_sort_key, item_id) in enumerate(values):
             tree.move(item_id, "", index)
 
+    def _show_dpt_explorer_model(self, tree, model, empty_message):
+        state = self.dpt_explorer_tree_sort_state.get(str(tree)) or {}
+        column = state.get("column")
+        columns = list(tree["columns"])
+        column_index = columns.index(column) if column in columns else None
+        rows = model.view(column_index, reverse=bool(state.get("reverse", False)))
+        if not rows:
+            self._clear_tree_with_message(tree, empty_message)
+            return
+        tree.set_rows(rows)
+
+    def _dpt_explorer_value_sort_key(self, value):
+        # Same ordering the tree-backed sort derives from the displayed cell text.
+        return self._dpt_explorer_tree_sort_key(str(value))
+
     def _dpt_explorer_tree_sort_key(self, value):
         text = str(value or "").strip()
         if text in {"", "-"}:
@@ -2012,23 +2072,21 @@ class HeroDraftLibraryApp:
         if self.tree_value_tooltip_tree == tree:
             self._hide_tree_value_tooltip()
 
-    def _build_draft_hero_button_grid(self, parent, heroes, columns=DRAFT_DEFAULT_GRID_COLUMNS):
-        for index, hero in enumerate(heroes):
+    def _create_draft_hero_buttons(self):
+        # Buttons live under draft_grid_body for the tab's lifetime and are gridded
+        # into whichever layout frame is showing (grid -in), so layout toggles never
+        # recreate widgets or reload icons.
+        for hero in self.draft_hero_names:
+            if hero in self.draft_hero_buttons:
+                continue
             button_host = tk.Frame(
-                parent,
+                self.draft_grid_body,
                 width=DRAFT_GRID_BUTTON_PIXEL_WIDTH,
                 height=DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
                 bd=0,
                 highlightthickness=0,
             )
             button_host.grid_propagate(False)
-            button_host.grid(
-                row=index // columns,
-                column=index % columns,
-                sticky="w",
-                padx=DRAFT_GRID_CELL_PADX,
-                pady=DRAFT_GRID_CELL_PADY,
-            )
 
             button = tk.Button(
                 button_host,
@@ -2042,9 +2100,24 @@ class HeroDraftLibraryApp:
                 command=lambda selected_hero=hero: self._handle_draft_hero_click(selected_hero),
             )
             button.place(x=0, y=0, relwidth=1, relheight=1)
+            self.draft_hero_button_hosts[hero] = button_host
             self.draft_hero_buttons[hero] = button
             self._apply_draft_button_visual(button, hero)
 
+    def _build_draft_hero_button_grid(self, parent, heroes, columns=DRAFT_DEFAULT_GRID_COLUMNS):
+        for index, hero in enumerate(heroes):
+            button_host = self.draft_hero_button_hosts.get(hero)
+            if button_host is None:
+                continue
+            button_host.grid(
+                in_=parent,
+                row=index // columns,
+                column=index % columns,
+                sticky="w",
+                padx=DRAFT_GRID_CELL_PADX,
+                pady=DRAFT_GRID_CELL_PADY,
+            )
+
         parent.grid_anchor("nw")
         for column in range(columns):
             parent.columnconfigure(column, weight=0)
@@ -2068,12 +2141,30 @@ class HeroDraftLibraryApp:
             self.draft_button_image_cache[cache_key] = base_image
             return base_image
 
-        tinted_image = self._tint_photoimage(
-            base_image,
-            overlay_rgb=overlay,
-            blend=float(style.get("blend", 0.0) or 0.0),
-            desaturate=float(style.get("desaturate", 0.0) or 0.0),
-        )
+        icon_path = self._draft_button_icon_path(hero_name)
+        tinted_image = self._atlas_draft_button_image(icon_path, state_key)
+        if tinted_image is not None:
+            self.draft_button_image_cache[cache_key] = tinted_image
+            return tinted_image
+
+        with profile_phase("icons", "tint hero icon", hero=hero_name, state=state_key):
+            variant_path = self.hero_icon_cache.ensure_variant(
+                icon_path,
+                state_key,
+                style,
+            )
+            if variant_path:
+                try:
+                    tinted_image = tk.PhotoImage(master=self.parent, file=variant_path)
+                except tk.TclError:
+                    tinted_image = None
+            if tinted_image is None:
+                tinted_image = self._tint_photoimage(
+                    base_image,
+                    overlay_rgb=overlay,
+                    blend=float(style.get("blend", 0.0) or 0.0),
+                    desaturate=float(style.get("desaturate", 0.0) or 0.0),
+                )
         self.draft_button_image_cache[cache_key] = tinted_image
         return tinted_image
 
@@ -2089,19 +2180,79 @@ class HeroDraftLibraryApp:
             self.draft_button_icon_missing.add(hero_name)
             return None
 
+        cropped_image = self._atlas_draft_button_image(icon_path, "default")
+        cached_path = None if cropped_image is not None else self.hero_icon_cache.base_path(icon_path)
+        if cached_path and os.path.exists(cached_path):
+            try:
+                with profile_phase("icons", "load cached hero icon", hero=hero_name):
+                    cropped_image = tk.PhotoImage(master=self.parent, file=cached_path)
+            except tk.TclError:
+                cropped_image = None
+
+        if cropped_image is None:
+            try:
+                with profile_phase("icons", "load hero icon", hero=hero_name):
+                    source_image = tk.PhotoImage(master=self.parent, file=icon_path)
+                    cropped_image = self._center_crop_photoimage(
+                        source_image,
+                        DRAFT_GRID_BUTTON_PIXEL_WIDTH,
+                        DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
+                    )
+            except tk.TclError:
+                self.draft_button_icon_missing.add(hero_name)
+                return None
+            self.hero_icon_cache.store_base(icon_path, cropped_image)
+
+        self.draft_button_base_image_cache[hero_name] = cropped_image
+        return cropped_image
+
+    def _atlas_draft_button_image(self, icon_path, state_key):
+        if self.hero_icon_atlas is None:
+            return None
+        position = self.hero_icon_atlas.cell(icon_path, state_key)
+        if position is None:
+            return None
         try:
-            source_image = tk.PhotoImage(master=self.parent, file=icon_path)
-            cropped_image = self._center_crop_photoimage(
-                source_image,
-                DRAFT_GRID_BUTTON_PIXEL_WIDTH,
-                DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
+            if self.hero_icon_atlas_image is None:
+                with profile_phase("icons", "load hero icon atlas"):
+                    self.hero_icon_atlas_image = tk.PhotoImage(
+                        master=self.parent,
+                        file=self.hero_icon_atlas.atlas_path,
+                    )
+            x, y = position
+            cell_image = tk.PhotoImage(
+                master=self.parent,
+                width=DRAFT_GRID_BUTTON_PIXEL_WIDTH,
+                height=DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
+            )
+            cell_image.tk.call(
+                str(cell_image),
+                "copy",
+                str(self.hero_icon_atlas_image),
+                "-from",
+                x,
+                y,
+                x + DRAFT_GRID_BUTTON_PIXEL_WIDTH,
+                y + DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
             )
         except tk.TclError:
-            self.draft_button_icon_missing.add(hero_name)
+            self.hero_icon_atlas = None
             return None
-
-        self.draft_button_base_image_cache[hero_name] = cropped_image
-        return cropped_image
+        return cell_image
+
+    def _start_draft_icon_prewarming(self):
+        # Base crops exist once the grid has drawn; tinted variants are built off the Tk thread.
+        icon_paths = [
+            icon_path
+            for icon_path in (self._draft_button_icon_path(hero_name) for hero_name in self.draft_hero_names)
+            if icon_path
+        ]
+        tinted_styles = {
+            state_key: style
+            for state_key, style in DRAFT_BUTTON_STYLE_MAP.items()
+            if state_key != "default" and style.get("overlay") is not None
+        }
+        self.hero_icon_cache.start_prewarming(icon_paths, tinted_styles)
 
     def _draft_button_icon_path(self, hero_name):
         filename = f"{str(hero_name).replace(' ', '_')}_icon_dota2_gameasset.png"
@@ -2111,49 +2262,7 @@ class HeroDraftLibraryApp:
         return None
 
     def _center_crop_photoimage(self, source_image, target_width, target_height):
-        source_width = int(source_image.width())
-        source_height = int(source_image.height())
-        subsample_factor = max(
-            1,
-            min(
-                max(1, source_width // max(1, int(target_width))),
-                max(1, source_height // max(1, int(target_height))),
-            ),
-        )
-        working_image = (
-            source_image.subsample(subsample_factor, subsample_factor)
-            if subsample_factor > 1
-            else source_image
-        )
-
-        source_width = int(working_image.width())
-        source_height = int(working_image.height())
-        copy_width = min(source_width, int(target_width))
-        copy_height = min(source_height, int(target_height))
-
-        source_x0 = max(0, (source_width - copy_width) // 2)
-        source_y0 = max(0, (source_height - copy_height) // 2)
-        source_x1 = source_x0 + copy_width
-        source_y1 = source_y0 + copy_height
-
-        target_x = max(0, (int(target_width) - copy_width) // 2)
-        target_y = max(0, (int(target_height) - copy_height) // 2)
-
-        cropped_image = tk.PhotoImage(master=self.parent, width=target_width, height=target_height)
-        cropped_image.tk.call(
-            str(cropped_image),
-            "copy",
-            str(working_image),
-            "-from",
-            source_x0,
-            source_y0,
-            source_x1,
-            source_y1,
-            "-to",
-            target_x,
-            target_y,
-        )
-        return cropped_image
+        return center_crop_photoimage(self.parent, source_image, target_width, target_height)
 
     def _tint_photoimage(self, source_image, overlay_rgb, blend, desaturate):
         width = int(source_image.width())
@@ -2212,13 +2321,21 @@ class HeroDraftLibraryApp:
             return f"A{ally_role} {hero_name}"
         return hero_name
 
+    def _draft_button_visual_key(self, hero_name):
+        return self._draft_button_state(hero_name), self._draft_button_text(hero_name)
+
     def _apply_draft_button_visual(self, button, hero_name):
-        state_key = self._draft_button_state(hero_name)
+        state_key, button_text = self._draft_button_visual_key(hero_name)
         style = DRAFT_BUTTON_STYLE_MAP.get(state_key, DRAFT_BUTTON_STYLE_MAP["default"])
         hero_image = self._get_draft_button_image(hero_name, state_key=state_key)
+        self.draft_button_visual_keys[hero_name] = (state_key, button_text)
+        if state_key == "default":
+            self.draft_button_styled_heroes.discard(hero_name)
+        else:
+            self.draft_button_styled_heroes.add(hero_name)
 
         button.configure(
-            text=self._draft_button_text(hero_name),
+            text=button_text,
             bg=style["background"],
             activebackground=style["activebackground"],
             fg=style["foreground"],
@@ -2246,31 +2363,40 @@ class HeroDraftLibraryApp:
         columns = DRAFT_GRID_COLUMNS_BY_ATTRIBUTE.get(attribute_key, DRAFT_DEFAULT_GRID_COLUMNS)
         self._build_draft_hero_button_grid(parent, heroes, columns=columns)
 
-    def _rebuild_draft_hero_grid(self):
-        self.draft_hero_buttons = {}
-
-        for child in self.draft_grid_body.winfo_children():
-            child.destroy()
-
-        if self.draft_single_grid_var.get():
-            alphabetical_frame = ttk.LabelFrame(
+    def _ensure_draft_grid_layout_frames(self):
+        if self.draft_grid_layout_frames:
+            return
+        # Layout frames are created before the buttons so the buttons stack above them.
+        self.draft_grid_layout_frames["az"] = ttk.LabelFrame(
+            self.draft_grid_body,
+            text="All Heroes (A-Z)",
+            padding=8,
+        )
+        for short_label, _full_label in ATTRIBUTE_ORDER:
+            self.draft_grid_layout_frames[short_label] = ttk.LabelFrame(
                 self.draft_grid_body,
-                text="All Heroes (A-Z)",
+                text=ATTRIBUTE_LABELS[short_label],
                 padding=8,
             )
-            alphabetical_frame.pack(fill="x")
+        self._create_draft_hero_buttons()
+
+    def _rebuild_draft_hero_grid(self):
+        self._ensure_draft_grid_layout_frames()
+        alphabetical_frame = self.draft_grid_layout_frames["az"]
+
+        if self.draft_single_grid_var.get():
+            for short_label, _full_label in ATTRIBUTE_ORDER:
+                self.draft_grid_layout_frames[short_label].grid_remove()
+            alphabetical_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
             self._build_draft_hero_button_grid(
                 alphabetical_frame,
                 self.draft_hero_names,
                 columns=DRAFT_AZ_GRID_COLUMNS,
             )
         else:
+            alphabetical_frame.grid_remove()
             for index, (short_label, _full_label) in enumerate(ATTRIBUTE_ORDER):
-                category_frame = ttk.LabelFrame(
-                    self.draft_grid_body,
-                    text=ATTRIBUTE_LABELS[short_label],
-                    padding=8,
-                )
+                category_frame = self.draft_grid_layout_frames[short_label]
                 category_frame.grid(
                     row=index // 2,
                     column=index % 2,
@@ -2280,23 +2406,25 @@ class HeroDraftLibraryApp:
                 )
                 self._build_draft_category_grid(category_frame, short_label)
 
-            self.draft_grid_body.grid_columnconfigure(0, weight=1, uniform="draft-hero-grid")
-            self.draft_grid_body.grid_columnconfigure(1, weight=1, uniform="draft-hero-grid")
-
-        self._refresh_draft_button_labels()
+        self.draft_grid_body.grid_columnconfigure(0, weight=1, uniform="draft-hero-grid")
+        self.draft_grid_body.grid_columnconfigure(1, weight=1, uniform="draft-hero-grid")
 
     def _rebuild_edit_hero_grids(self):
+        wanted_keys = set()
         for attribute_key, frame in self.edit_grid_frames.items():
-            for child in frame.winfo_children():
-                child.destroy()
-
             heroes = self.heroes_by_attribute.get(attribute_key, [])
             for index, hero in enumerate(heroes):
-                ttk.Button(
-                    frame,
-                    text=hero,
-                    command=lambda selected_hero=hero: self._open_edit_hero(selected_hero),
-                ).grid(
+                button_key = (attribute_key, hero)
+                wanted_keys.add(button_key)
+                button = self.edit_hero_buttons.get(button_key)
+                if button is None:
+                    button = ttk.Button(
+                        frame,
+                        text=hero,
+                        command=lambda selected_hero=hero: self._open_edit_hero(selected_hero),
+                    )
+                    self.edit_hero_buttons[button_key] = button
+                button.grid(
                     row=index // 4,
                     column=index % 4,
                     sticky="ew",
@@ -2307,6 +2435,9 @@ class HeroDraftLibraryApp:
             for column in range(4):
                 frame.columnconfigure(column, weight=1)
 
+        for button_key in set(self.edit_hero_buttons) - wanted_keys:
+            self.edit_hero_buttons.pop(button_key).destroy()
+
     def _handle_edit_attribute_tab_change(self, _event=None):
         current_tab_id = self.edit_attribute_notebook.select()
         current_index = self.edit_attribute_notebook.index(current_tab_id)
@@ -2408,6 +2539,7 @@ class HeroDraftLibraryApp:
         record["roles"][hero_role][box_type][target_role][score_key] = self.edit_score_vars[
             (hero_role, box_type, target_role, score_key)
         ].get()
+        self._compile_score_box(self.current_edit_hero, hero_role, box_type, target_role, score_key)
         self.edit_save_status_var.set(f"Saved {self.current_edit_hero} at {_timestamp()}.")
         self._queue_library_save()
         self._refresh_draft_outputs()
@@ -2443,27 +2575,7 @@ class HeroDraftLibraryApp:
         return [token.strip() for token in re.split(r"[,;\n]+", str(text or "")) if token.strip()]
 
     def _match_hero_name(self, token):
-        normalized = _normalize_match_text(token)
-        compact = _normalize_compact_text(token)
-        if not normalized and not compact:
-            return None
-
-        if normalized in self.hero_match_lookup:
-            return self.hero_match_lookup[normalized]
-        if compact in self.hero_compact_lookup:
-            return self.hero_compact_lookup[compact]
-
-        if normalized:
-            close_normalized = get_close_matches(normalized, self.hero_match_choices, n=1, cutoff=0.72)
-            if close_normalized:
-                return self.hero_match_lookup[close_normalized[0]]
-
-        if compact:
-            close_compact = get_close_matches(compact, self.hero_compact_choices, n=1, cutoff=0.78)
-            if close_compact:
-                return self.hero_compact_lookup[close_compact[0]]
-
-        return None
+        return self.hero_name_matcher.match(token)
 
     def _build_draft_voice_alias_lookup(self):
         alias_owners = {}
@@ -2557,43 +2669,14 @@ class HeroDraftLibraryApp:
         autocomplete_aliases.discard(normalized)
         return autocomplete_aliases
 
-    def _build_draft_voice_prefix_lookup(self, compact=False):
-        prefix_owners = {}
-
-        for hero_name, aliases in self.draft_voice_base_aliases.items():
-            for alias in aliases:
-                alias_text = _normalize_compact_text(alias) if compact else _normalize_match_text(alias)
-                if not alias_text:
-                    continue
-
-                seen_prefixes = set()
-                for length in range(1, len(alias_text) + 1):
-                    prefix = alias_text[:length].strip()
-                    signal_length = len(prefix) if compact else len(prefix.replace(" ", ""))
-                    if not prefix or signal_length < 4 or prefix in seen_prefixes:
-                        continue
-                    seen_prefixes.add(prefix)
-                    prefix_owners.setdefault(prefix, set()).add(hero_name)
-
-        return {
-            prefix: next(iter(heroes))
-            for prefix, heroes in prefix_owners.items()
-            if len(heroes) == 1
-        }
-
-    def _build_draft_voice_alias_token_choices(self):
-        token_choices = []
-        seen = set()
-
-        for hero_name, aliases in self.draft_voice_base_aliases.items():
-            for alias in aliases:
-                tokens = tuple(token for token in _normalize_match_text(alias).split() if token)
-                if not tokens or (hero_name, tokens) in seen:
-                    continue
-                seen.add((hero_name, tokens))
-                token_choices.append((hero_name, tokens))
-
-        return token_choices
+    def _build_draft_voice_prefix_trie(self, compact=False):
+        normalize = _normalize_compact_text if compact else _normalize_match_text
+        return AliasPrefixTrie(
+            {
+                hero_name: {normalize(alias) for alias in aliases}
+                for hero_name, aliases in self.draft_voice_base_aliases.items()
+            }
+        )
 
     def _draft_voice_base_alias_matching_heroes(self, text):
         normalized = _normalize_match_text(text)
@@ -2601,33 +2684,12 @@ class HeroDraftLibraryApp:
         if not normalized and not compact:
             return set()
 
-        spoken_tokens = [token for token in normalized.split() if token]
         matching_heroes = set()
-
-        for hero_name, aliases in self.draft_voice_base_aliases.items():
-            for alias in aliases:
-                alias_normalized = _normalize_match_text(alias)
-                alias_compact = _normalize_compact_text(alias)
-                if not alias_normalized and not alias_compact:
-                    continue
-
-                if normalized and alias_normalized.startswith(normalized):
-                    matching_heroes.add(hero_name)
-                    continue
-
-                if compact and alias_compact.startswith(compact):
-                    matching_heroes.add(hero_name)
-                    continue
-
-                alias_tokens = [token for token in alias_normalized.split() if token]
-                if spoken_tokens and len(spoken_tokens) <= len(alias_tokens):
-                    if all(
-                        alias_token.startswith(spoken_token)
-                        for spoken_token, alias_token in zip(spoken_tokens, alias_tokens)
-                    ):
-                        matching_heroes.add(hero_name)
-                        continue
-
+        if normalized:
+            matching_heroes.update(self.draft_voice_prefix_trie.prefix_owners(normalized))
+            matching_heroes.update(self.draft_voice_prefix_trie.token_prefix_owners(normalized.split()))
+        if compact:
+            matching_heroes.update(self.draft_voice_compact_prefix_trie.prefix_owners(compact))
         return matching_heroes
 
     def _match_draft_voice_prefix(self, text):
@@ -2635,12 +2697,12 @@ class HeroDraftLibraryApp:
         compact = _normalize_compact_text(text)
 
         if len(normalized.replace(" ", "")) >= 4:
-            prefix_match = self.draft_voice_prefix_lookup.get(normalized)
+            prefix_match = self.draft_voice_prefix_trie.unique_owner(normalized)
             if prefix_match:
                 return prefix_match
 
         if len(compact) >= 4:
-            compact_prefix_match = self.draft_voice_compact_prefix_lookup.get(compact)
+            compact_prefix_match = self.draft_voice_compact_prefix_trie.unique_owner(compact)
             if compact_prefix_match:
                 return compact_prefix_match
 
@@ -2659,17 +2721,59 @@ class HeroDraftLibraryApp:
             if len(tokens[0]) < 3 or joined_length < 6 or any(len(token) < 2 for token in tokens):
                 return None
 
-        matching_heroes = set()
-        for hero_name, alias_tokens in self.draft_voice_alias_token_choices:
-            if len(tokens) > len(alias_tokens):
-                continue
-            if all(alias_token.startswith(spoken_token) for spoken_token, alias_token in zip(tokens, alias_tokens)):
-                matching_heroes.add(hero_name)
-
+        matching_heroes = self.draft_voice_prefix_trie.token_prefix_owners(tokens)
         if len(matching_heroes) == 1:
             return next(iter(matching_heroes))
         return None
 
+    def _draft_typeahead_matches(self, text):
+        normalized = _normalize_match_text(text)
+        if normalized.startswith(self.draft_typeahead_text):
+            frontier = self.draft_typeahead_frontier
+            remaining = normalized[len(self.draft_typeahead_text):]
+        else:
+            frontier = self.draft_voice_prefix_trie.start()
+            remaining = normalized
+        for char in remaining:
+            if not frontier:
+                break
+            frontier = self.draft_voice_prefix_trie.advance(frontier, char)
+
+        self.draft_typeahead_text = normalized
+        self.draft_typeahead_frontier = frontier
+        if not normalized:
+            return set()
+        return self.draft_voice_prefix_trie.frontier_owners(frontier)
+
+    def _update_draft_typeahead(self):
+        text = self.draft_typeahead_var.get()
+        matching_heroes = self._draft_typeahead_matches(text)
+        if not text.strip():
+            self.draft_typeahead_status_var.set("")
+        elif len(matching_heroes) == 1:
+            self.draft_typeahead_status_var.set(f"Enter: {next(iter(matching_heroes))}")
+        elif matching_heroes:
+            self.draft_typeahead_status_var.set(f"{len(matching_heroes)} heroes match")
+        else:
+            fallback_hero = self._match_hero_name(text)
+            self.draft_typeahead_status_var.set(f"Enter: {fallback_hero}" if fallback_hero else "No match")
+
+    def _apply_draft_typeahead(self, _event=None):
+        text = self.draft_typeahead_var.get()
+        matching_heroes = self._draft_typeahead_matches(text)
+        if len(matching_heroes) == 1:
+            hero_name = next(iter(matching_heroes))
+        elif matching_heroes:
+            return "break"
+        else:
+            hero_name = self._match_hero_name(text)
+        if not hero_name:
+            return "break"
+
+        self.draft_typeahead_var.set("")
+        self._handle_draft_hero_click(hero_name)
+        return "break"
+
     def _match_draft_voice_hero(self, text):
         raw_text = str(text or "").strip()
         if not raw_text:
@@ -3109,8 +3213,19 @@ class HeroDraftLibraryApp:
         self._refresh_draft_action_buttons()
 
     def _refresh_draft_button_labels(self):
-        for hero_name, button in self.draft_hero_buttons.items():
-            self._apply_draft_button_visual(button, hero_name)
+        # Only heroes that are drafted now or were styled before can have changed visuals.
+        candidates = (
+            self.draft_button_styled_heroes
+            | self.banned_heroes
+            | set(self.enemy_assignments)
+            | set(self.ally_assignments.values())
+        )
+        for hero_name in candidates:
+            button = self.draft_hero_buttons.get(hero_name)
+            if button is None:
+                continue
+            if self.draft_button_visual_keys.get(hero_name) != self._draft_button_visual_key(hero_name):
+                self._apply_draft_button_visual(button, hero_name)
 
     def _find_ally_role(self, hero_name):
         for role, assigned_hero in self.ally_assignments.items():
@@ -3278,18 +3393,16 @@ class HeroDraftLibraryApp:
 
         normalized_choices = [normalized_hero for _item_id, _row, _hero_name, normalized_hero, _compact_hero in candidates if normalized_hero]
         if normalized_query and normalized_choices:
-            close_normalized = get_close_matches(normalized_query, normalized_choices, n=1, cutoff=0.52)
-            if close_normalized:
-                target_normalized = close_normalized[0]
+            target_normalized = best_close_match(normalized_query, normalized_choices, 0.52)
+            if target_normalized is not None:
                 for item_id, row, _hero_name, normalized_hero, _compact_hero in candidates:
                     if normalized_hero == target_normalized:
                         return item_id, row, "Closest"
 
         compact_choices = [compact_hero for _item_id, _row, _hero_name, _normalized_hero, compact_hero in candidates if compact_hero]
         if compact_query and compact_choices:
-            close_compact = get_close_matches(compact_query, compact_choices, n=1, cutoff=0.6)
-            if close_compact:
-                target_compact = close_compact[0]
+            target_compact = best_close_match(compact_query, compact_choices, 0.6)
+            if target_compact is not None:
                 for item_id, row, _hero_name, _normalized_hero, compact_hero in candidates:
                     if compact_hero == target_compact:
                         return item_id, row, "Closest"
@@ -3378,18 +3491,16 @@ class HeroDraftLibraryApp:
 
         normalized_choices = [normalized_hero for _item_id, _hero_name, normalized_hero, _compact_hero in candidates if normalized_hero]
         if normalized_query and normalized_choices:
-            close_normalized = get_close_matches(normalized_query, normalized_choices, n=1, cutoff=0.52)
-            if close_normalized:
-                target_normalized = close_normalized[0]
+            target_normalized = best_close_match(normalized_query, normalized_choices, 0.52)
+            if target_normalized is not None:
                 for item_id, hero_name, normalized_hero, _compact_hero in candidates:
                     if normalized_hero == target_normalized:
                         return item_id, hero_name, "Closest"
 
         compact_choices = [compact_hero for _item_id, _hero_name, _normalized_hero, compact_hero in candidates if compact_hero]
         if compact_query and compact_choices:
-            close_compact = get_close_matches(compact_query, compact_choices, n=1, cutoff=0.6)
-            if close_compact:
-                target_compact = close_compact[0]
+            target_compact = best_close_match(compact_query, compact_choices, 0.6)
+            if target_compact is not None:
                 for item_id, hero_name, _normalized_hero, compact_hero in candidates:
                     if compact_hero == target_compact:
                         return item_id, hero_name, "Closest"
@@ -3401,9 +3512,8 @@ class HeroDraftLibraryApp:
         totals = {}
 
         for hero_name, role in entries:
-            synergy_rows, matchup_rows = self._get_context_rows(hero_name, role, your_role)
-            self._apply_rows_to_totals(totals, synergy_rows, "synergy")
-            self._apply_rows_to_totals(totals, matchup_rows, "matchup")
+            for box_type in BOX_TYPES:
+                self._apply_box_to_totals(totals, hero_name, role, box_type, your_role)
 
         rows = []
         for hero_name, values in totals.items():
@@ -3420,71 +3530,202 @@ class HeroDraftLibraryApp:
         rows.sort(key=lambda item: (-item[3], -item[2], -item[1], item[0]))
         return rows
 
-    def _apply_rows_to_totals(self, totals, rows, key_name):
+    def _apply_box_to_totals(self, totals, hero_name, hero_role, box_type, target_role):
         for score in SCORE_VALUES:
             if score == 0:
                 continue
-            text = rows.get(_score_key(score), "")
-            mentioned_heroes = self._extract_mentioned_heroes(text)
-            for hero_name in mentioned_heroes:
-                hero_totals = totals.setdefault(hero_name, {"synergy": 0, "matchup": 0})
-                hero_totals[key_name] += score
+            hero_ids = self.library_score_index.get(
+                (hero_name, str(hero_role), box_type, str(target_role), _score_key(score)),
+                (),
+            )
+            for hero_id in hero_ids:
+                hero_totals = totals.setdefault(self.hero_names[hero_id], {"synergy": 0, "matchup": 0})
+                hero_totals[box_type] += score
 
     def _score_candidate_role(self, candidate_role):
-        rows = []
+        candidate_role = str(candidate_role)
+        return self._score_candidate_roles((candidate_role,))[candidate_role]
+
+    def _score_candidate_roles(self, candidate_roles=ROLE_KEYS):
+        """
+        Score every draftable candidate for each role in ``candidate_roles``.
+
+        The ally and enemy score vectors cover every (candidate role,
+        candidate hero) column, so extra roles only cost the row assembly and
+        sort.
+        """
         excluded_heroes = set(self.banned_heroes)
         excluded_heroes.update(self.enemy_assignments.keys())
         excluded_heroes.update(self.ally_assignments.values())
 
-        for hero_name in self.draft_hero_names:
-            if hero_name in excluded_heroes:
-                continue
-            if not self._hero_has_role_content(hero_name, candidate_role):
-                continue
-
-            synergy_total, matchup_total = self._score_single_candidate(hero_name, candidate_role)
-            total = synergy_total + matchup_total
+        synergy_vector = self._library_draft_vector("synergy", self.ally_assignments.items())
+        matchup_vector = self._library_draft_vector(
+            "matchup",
+            ((enemy_role, enemy_hero) for enemy_hero, enemy_role in self.enemy_assignments.items()),
+        )
 
-            rows.append((hero_name, synergy_total, matchup_total, total))
+        results = {}
+        for candidate_role in candidate_roles:
+            rows = [
+                (
+                    hero_name,
+                    synergy_vector[column],
+                    matchup_vector[column],
+                    synergy_vector[column] + matchup_vector[column],
+                )
+                for hero_name, column in self._library_role_columns(str(candidate_role))
+                if hero_name not in excluded_heroes
+            ]
+            rows.sort(key=lambda item: (-item[3], -item[2], -item[1], item[0]))
+            results[str(candidate_role)] = rows
+        return results
+
+    def _library_role_columns(self, candidate_role):
+        columns = self.library_role_columns.get(candidate_role)
+        if columns is None:
+            offset = ROLE_INDEX[candidate_role] * len(self.hero_names)
+            columns = [
+                (hero_name, offset + self.hero_ids[hero_name])
+                for hero_name in self.draft_hero_names
+                if (hero_name, candidate_role) in self.library_role_content
+            ]
+            self.library_role_columns[candidate_role] = columns
+        return columns
+
+    def _library_draft_vector(self, box_type, targets):
+        """
+        Running sum of the library score vectors for the current draft
+        ``targets`` ((target role, hero) pairs). Only targets added or removed
+        since the last call are added or subtracted.
+        """
+        targets = {(str(target_role), self.hero_ids.get(target_hero)) for target_role, target_hero in targets}
+        previous_targets, vector = self.library_draft_sums.get(box_type, (set(), None))
+        if vector is None:
+            vector = list(self.library_zero_vector)
+
+        for sign, changed_targets in ((-1, previous_targets - targets), (1, targets - previous_targets)):
+            for target_role, target_id in changed_targets:
+                target_vector = self.library_score_matrix.get((box_type, target_role, target_id))
+                if target_vector is None:
+                    continue
+                for column, value in enumerate(target_vector):
+                    if value:
+                        vector[column] += sign * value
 
-        rows.sort(key=lambda item: (-item[3], -item[2], -item[1], item[0]))
-        return rows
+        self.library_draft_sums[box_type] = (targets, vector)
+        return vector
 
     def _hero_has_role_content(self, hero_name, hero_role):
-        record = self._ensure_hero_record(hero_name)
-        role_record = record["roles"].get(str(hero_role), _blank_role_record())
-        for box_type in BOX_TYPES:
-            for target_role in ROLE_KEYS:
-                for value in role_record.get(box_type, {}).get(target_role, {}).values():
-                    if str(value).strip():
-                        return True
-        return False
+        return (hero_name, str(hero_role)) in self.library_role_content
 
     def _score_single_candidate(self, hero_name, hero_role):
-        record = self._ensure_hero_record(hero_name)
-        role_record = record["roles"].get(str(hero_role), _blank_role_record())
-
-        synergy_total = 0
-        for ally_role, ally_hero in self.ally_assignments.items():
-            synergy_rows = role_record["synergy"].get(str(ally_role), _blank_score_rows())
-            synergy_total += self._score_rows_for_selected_hero(synergy_rows, ally_hero)
+        column = ROLE_INDEX[str(hero_role)] * len(self.hero_names) + self.hero_ids[hero_name]
+        synergy_total = self._library_draft_vector("synergy", self.ally_assignments.items())[column]
+        matchup_total = self._library_draft_vector(
+            "matchup",
+            ((enemy_role, enemy_hero) for enemy_hero, enemy_role in self.enemy_assignments.items()),
+        )[column]
+        return synergy_total, matchup_total
 
-        matchup_total = 0
-        for enemy_hero, enemy_role in self.enemy_assignments.items():
-            matchup_rows = role_record["matchup"].get(str(enemy_role), _blank_score_rows())
-            matchup_total += self._score_rows_for_selected_hero(matchup_rows, enemy_hero)
+    def _compile_library_score_index(self):
+        """
+        Compile every library score box into hero-ID sets keyed by (hero,
+        role, box, target role, score key), then fold them into
+        ``library_score_matrix``: per (box type, target role, target hero ID),
+        a dense vector of net scores over (candidate role, candidate hero ID)
+        columns, i.e. the [candidate_role, candidate_hero, target_role,
+        target_hero] table stored target-major. Targets nobody mentions have
+        no vector.
+        """
+        self.score_text_hero_ids = {}
+        self.library_score_index = {}
+        self.library_role_content = set()
+        self.library_role_columns = {}
+        self.library_draft_sums = {}
+        self.library_score_matrix = {}
+        for hero_name, record in self.library_data.get("heroes", {}).items():
+            for hero_role, role_record in record.get("roles", {}).items():
+                for box_type in BOX_TYPES:
+                    for target_role, rows in role_record.get(box_type, {}).items():
+                        for score_key, text in rows.items():
+                            self._store_score_box(hero_name, hero_role, box_type, target_role, score_key, text)
+
+        for (hero_name, hero_role, box_type, target_role, _score_key_value), hero_ids in self.library_score_index.items():
+            self._refresh_score_matrix_cells(hero_name, hero_role, box_type, target_role, hero_ids)
+
+    def _refresh_score_matrix_cells(self, hero_name, hero_role, box_type, target_role, target_ids):
+        candidate_id = self.hero_ids.get(hero_name)
+        role_index = ROLE_INDEX.get(str(hero_role))
+        if candidate_id is None or role_index is None:
+            return
 
-        return synergy_total, matchup_total
+        column = role_index * len(self.hero_names) + candidate_id
+        for target_id in target_ids:
+            value = sum(
+                score
+                for score in SCORE_VALUES
+                if score != 0
+                and target_id in self.library_score_index.get(
+                    (hero_name, str(hero_role), box_type, str(target_role), _score_key(score)),
+                    (),
+                )
+            )
+            key = (box_type, str(target_role), target_id)
+            vector = self.library_score_matrix.get(key)
+            if vector is None:
+                if not value:
+                    continue
+                vector = array("h", self.library_zero_vector)
+                self.library_score_matrix[key] = vector
+            vector[column] = value
+
+    def _compile_score_box(self, hero_name, hero_role, box_type, target_role, score_key):
+        """Recompile one edited score box and its hero/role content flag."""
+        record = self.library_data.get("heroes", {}).get(hero_name, {})
+        role_record = record.get("roles", {}).get(str(hero_role), {})
+        text = role_record.get(box_type, {}).get(str(target_role), {}).get(score_key, "")
+        key = (hero_name, str(hero_role), box_type, str(target_role), score_key)
+        previous_ids = self.library_score_index.pop(key, frozenset())
+        self.library_role_content.discard((hero_name, str(hero_role)))
+        self.library_role_columns.pop(str(hero_role), None)
+        self.library_draft_sums = {}
+        self._store_score_box(hero_name, hero_role, box_type, target_role, score_key, text)
+        self._refresh_score_matrix_cells(
+            hero_name,
+            hero_role,
+            box_type,
+            target_role,
+            previous_ids | self.library_score_index.get(key, frozenset()),
+        )
+        if any(
+            str(value).strip()
+            for other_box_type in BOX_TYPES
+            for rows in role_record.get(other_box_type, {}).values()
+            for value in rows.values()
+        ):
+            self.library_role_content.add((hero_name, str(hero_role)))
 
-    def _score_rows_for_selected_hero(self, rows, selected_hero):
-        total = 0
-        for score in SCORE_VALUES:
-            if score == 0:
-                continue
-            mentioned_heroes = self._extract_mentioned_heroes(rows.get(_score_key(score), ""))
-            if selected_hero in mentioned_heroes:
-                total += score
-        return total
+    def _store_score_box(self, hero_name, hero_role, box_type, target_role, score_key, text):
+        text = str(text or "")
+        if not text.strip():
+            return
+        self.library_role_content.add((hero_name, str(hero_role)))
+        hero_ids = self._score_text_hero_ids(text)
+        if hero_ids:
+            self.library_score_index[(hero_name, str(hero_role), box_type, str(target_role), score_key)] = hero_ids
+
+    def _score_text_hero_ids(self, text):
+        hero_ids = self.score_text_hero_ids.get(text)
+        if hero_ids is None:
+            hero_ids = frozenset(
+                self.hero_ids[hero_name]
+                for hero_name in self._extract_mentioned_heroes(text)
+                if hero_name in self.hero_ids
+            )
+            if len(self.score_text_hero_ids) >= SCORE_TEXT_HERO_IDS_CACHE_LIMIT:
+                self.score_text_hero_ids.clear()
+            self.score_text_hero_ids[text] = hero_ids
+        return hero_ids
 
     def _extract_mentioned_heroes(self, text):
         token_matches = {
@@ -3524,7 +3765,7 @@ class HeroDraftLibraryApp:
         self.latest_dpt_candidate_rows = []
         self.latest_dpt_candidate_lookup = {}
 
-        if not score_dpt_candidate or not finalize_dpt_candidate_normalization:
+        if not self.dpt_draft_scorer or not finalize_dpt_candidate_normalization:
             return []
         if candidate_role not in ROLE_KEYS:
             return []
@@ -3550,18 +3791,12 @@ class HeroDraftLibraryApp:
         ]
 
         excluded_heroes = {hero_name for hero_name, _role in allies + enemies + bans}
+        self.dpt_draft_scorer.retain_targets(allies, enemies, bans)
         rows = []
         for hero_name in sorted(heroes_payload):
             if hero_name in excluded_heroes:
                 continue
-            candidate = score_dpt_candidate(
-                self.dpt_scores_data,
-                hero_name,
-                candidate_role,
-                allies,
-                enemies,
-                bans,
-            )
+            candidate = self.dpt_draft_scorer.score(hero_name, candidate_role, allies, enemies, bans)
             if candidate is not None:
                 rows.append(candidate)
 
@@ -0,0 +1,154 @@
+"""Per-hero talent combination x level stat tables for talent path and breakpoint lookups"""
+
+import itertools
+import threading
+from collections import OrderedDict
+
+from hero_core_engine import MAX_LEVEL, TALENT_TIERS
+
+
+BREAKPOINT_STAT_KEYS = (
+    "strength",
+    "agility",
+    "intelligence",
+    "health",
+    "health_regen",
+    "mana",
+    "mana_regen",
+    "armor",
+    "magic_resist",
+    "attack_damage",
+    "attack_speed",
+    "move_speed",
+)
+BREAKPOINT_STAT_INDEX = {stat_key: index for index, stat_key in enumerate(BREAKPOINT_STAT_KEYS)}
+BREAKPOINT_CACHE_HEROES = 24
+
+
+class HeroTalentBreakpoints:
+    """
+    Stat table for one hero: ``stats[combo][level - 1]`` is a tuple of
+    BREAKPOINT_STAT_KEYS values, where ``combo`` is one talent choice per
+    tier in TALENT_TIERS order. Talents without stat effects collapse onto
+    "none", so most heroes need far fewer than 3**4 combos.
+    """
+
+    def __init__(self, hero_name, tier_choices, stats):
+        self.hero_name = hero_name
+        self.tier_choices = tier_choices
+        self.stats = stats
+
+    def value(self, combo, level, stat_key):
+        return self.stats[self.stat_combo(combo)][level - 1][BREAKPOINT_STAT_INDEX[stat_key]]
+
+    def stat_combo(self, talents):
+        """Map a full talent pick (combo tuple or tier dict) onto its stat-equivalent combo."""
+        if isinstance(talents, dict):
+            talents = tuple(talents.get(tier, "none") for tier in TALENT_TIERS)
+        return tuple(
+            choice if choice in choices else "none"
+            for choice, choices in zip(talents, self.tier_choices)
+        )
+
+    def best_combo(self, stat_key, level):
+        """Return (combo, value) maximizing ``stat_key`` at ``level``."""
+        stat_index = BREAKPOINT_STAT_INDEX[stat_key]
+        return max(
+            ((combo, rows[level - 1][stat_index]) for combo, rows in self.stats.items()),
+            key=lambda entry: entry[1],
+        )
+
+    def talent_gains(self, talents, stat_key):
+        """Return [(tier level, gain over no talents)] at each talent tier's level."""
+        combo = self.stat_combo(talents)
+        base_combo = tuple("none" for _tier in TALENT_TIERS)
+        return [
+            (int(tier), self.value(combo, int(tier), stat_key) - self.value(base_combo, int(tier), stat_key))
+            for tier in TALENT_TIERS
+        ]
+
+
+class TalentBreakpointCache:
+    """
+    LRU of HeroTalentBreakpoints tables, bounded to ``max_heroes`` heroes.
+
+    Tables are built with plain dict states so they bypass the engine's
+    per-row stat memo instead of flooding it. ``start_warming`` fills the
+    cache on a daemon thread; ``get`` builds a missing table on demand.
+    """
+
+    def __init__(self, engine, max_heroes=BREAKPOINT_CACHE_HEROES):
+        self.engine = engine
+        self.max_heroes = max(1, int(max_heroes))
+        self.tables = OrderedDict()
+        self.lock = threading.Lock()
+        self.warm_stop_event = threading.Event()
+
+    def get(self, hero_name):
+        with self.lock:
+            table = self.tables.get(hero_name)
+            if table is not None:
+                self.tables.move_to_end(hero_name)
+                return table
+
+        if hero_name not in self.engine.heroes:
+            return None
+
+        table = self._build_table(hero_name)
+        with self.lock:
+            self.tables[hero_name] = table
+            self.tables.move_to_end(hero_name)
+            while len(self.tables) > self.max_heroes:
+                self.tables.popitem(last=False)
+        return table
+
+    def start_warming(self, hero_names):
+        """Build tables for ``hero_names`` (up to the LRU size) on a background thread."""
+        self.warm_stop_event.set()
+        self.warm_stop_event = threading.Event()
+        stop_event = self.warm_stop_event
+        hero_names = list(hero_names)[:self.max_heroes]
+
+        def warm():
+            for hero_name in hero_names:
+                if stop_event.is_set():
+                    return
+                with self.lock:
+                    cached = hero_name in self.tables
+                if not cached:
+                    self.get(hero_name)
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    def stop_warming(self):
+        self.warm_stop_event.set()
+
+    def _tier_stat_choices(self, hero_data, tier):
+        tier_data = hero_data.get("talents", {}).get(tier, {})
+        if not isinstance(tier_data, dict):
+            return ("none",)
+        return ("none",) + tuple(
+            side
+            for side in ("left", "right")
+            if str(tier_data.get(side, "") or "").strip()
+            and self.engine.talent_changes_stats(str(tier_data.get(side)).strip())
+        )
+
+    def _build_table(self, hero_name):
+        hero_data = self.engine.heroes.get(hero_name, {})
+        tier_choices = tuple(self._tier_stat_choices(hero_data, tier) for tier in TALENT_TIERS)
+        base_state = self.engine.default_hero_state()
+
+        stats = {}
+        for combo in itertools.product(*tier_choices):
+            talents = dict(zip(TALENT_TIERS, combo))
+            rows = []
+            for level in range(1, MAX_LEVEL + 1):
+                computed = self.engine.compute_hero_stats(
+                    hero_name,
+                    hero_data,
+                    dict(base_state, level=level, talents=talents),
+                )
+                rows.append(tuple(computed[stat_key] for stat_key in BREAKPOINT_STAT_KEYS))
+            stats[combo] = rows
+        return HeroTalentBreakpoints(hero_name, tier_choices, stats)
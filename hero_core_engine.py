@@ -0,0 +1,1501 @@
+"""Headless hero core stat, item, talent and target math shared by the table UI and batch tools"""
+
+import json
+import math
+import os
+import re
+import uuid
+from datetime import datetime
+
+from attack_calculations import (
+    apply_magic_resistance,
+    apply_physical_reduction,
+    calculate_attack_rate,
+    calculate_dps,
+    calculate_hits_to_kill,
+    calculate_physical_reduction,
+    calculate_time_to_kill,
+)
+from modifiers import Modifier
+from startup_profiler import profile_phase
+from utils import safe_eval
+
+
+INVENTORY_SLOTS = 6
+MAX_LEVEL = 30
+TALENT_TIERS = ("10", "15", "20", "25")
+TARGET_SPELL_DAMAGE_TYPES = ("Physical", "Magical", "Pure")
+TARGET_SNAPSHOT_CACHE_LIMIT = 64
+TARGET_SPELL_CACHE_LIMIT = 256
+HERO_STATS_CACHE_LIMIT = 4096
+ITEM_RANKING_METRICS = ("ttk", "dps", "ehp")
+BULK_EDIT_OPERATIONS = ("level_delta", "set_level", "add_item", "remove_item", "set_talent")
+HERO_CORE_MODIFIER_TYPES = tuple(
+    modifier_type
+    for modifier_type in (
+        "Flat Damage",
+        "Percentage Damage",
+        "Strength",
+        "Agility",
+        "Intelligence",
+        "Armor",
+        "Magic Resistance",
+        "Attack Speed",
+        "BAT Reduction %",
+        "HP",
+        "Mana",
+        "HP Regen Flat",
+        "Mana Regen Flat",
+        "Movespeed Flat",
+        "Movespeed Percent",
+    )
+    if modifier_type in Modifier.get_available_types()
+)
+HERO_CORE_MODIFIER_TYPE_SET = set(HERO_CORE_MODIFIER_TYPES)
+
+
+def _load_json_file(path, default_payload):
+    if not os.path.exists(path):
+        return default_payload
+
+    try:
+        with profile_phase("json", f"load {os.path.basename(path)}"):
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return default_payload
+
+    if isinstance(default_payload, dict) and isinstance(payload, dict):
+        return payload
+    if isinstance(default_payload, list) and isinstance(payload, list):
+        return payload
+    return default_payload
+
+
+def _to_float(value, default=0.0):
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = str(value or "").strip()
+    if not text:
+        return default
+
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _normalize_choice(value, choices):
+    text = str(value or "").strip()
+    if not text:
+        return ""
+    return next((choice for choice in choices if choice.lower() == text.lower()), "")
+
+
+def _split_tokens(text):
+    return [token.strip() for token in re.split(r"[,;\n|]+", str(text or "")) if token.strip()]
+
+
+def _empty_modifiers():
+    return {
+        "strength": 0.0,
+        "agility": 0.0,
+        "intelligence": 0.0,
+        "health_flat": 0.0,
+        "health_pct": 0.0,
+        "health_regen_flat": 0.0,
+        "mana_flat": 0.0,
+        "mana_pct": 0.0,
+        "mana_regen_flat": 0.0,
+        "armor_flat": 0.0,
+        "magic_resist_flat": 0.0,
+        "attack_damage_flat": 0.0,
+        "attack_speed_flat": 0.0,
+        "attack_speed_pct": 0.0,
+        "move_speed_flat": 0.0,
+        "move_speed_pct": 0.0,
+        "attack_range_flat": 0.0,
+        "projectile_speed_flat": 0.0,
+        "max_hp_regen_pct": 0.0,
+        "bat_reduction_pct": 0.0,
+    }
+
+
+def _merge_modifiers(target, source):
+    for key in target:
+        target[key] += source.get(key, 0.0)
+
+
+def _first_numeric_value(value_text):
+    text = str(value_text or "").strip()
+    if not text:
+        return None, False
+
+    is_percent = "%" in text
+    match = re.search(r"[+-]?\d+(?:\.\d+)?", text)
+    if not match:
+        return None, is_percent
+    return float(match.group(0)), is_percent
+
+
+def _timestamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _as_bool(value, default=False):
+    if isinstance(value, bool):
+        return value
+    lowered = str(value or "").strip().lower()
+    if lowered in {"1", "true", "yes", "on"}:
+        return True
+    if lowered in {"0", "false", "no", "off", ""}:
+        return False
+    return default
+
+
+class HeroState(tuple):
+    """
+    Immutable hero row state, shared between duplicated rows.
+
+    Stored as (level, items, talent choices, frozen modifiers) so states
+    hash and compare by value. Reads mirror the plain dict layout
+    (state["items"], state.get("modifiers"), dict(state)); edits build a new
+    state through HeroCoreEngine.freeze_hero_state or apply_state_edit.
+    """
+
+    __slots__ = ()
+    _fields = ("level", "items", "talents", "modifiers")
+
+    def __new__(cls, level, items, talent_choices, frozen_modifiers):
+        return tuple.__new__(cls, (level, tuple(items), tuple(talent_choices), tuple(frozen_modifiers)))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, _memo):
+        return self
+
+    def __getitem__(self, key):
+        if key == "level":
+            return tuple.__getitem__(self, 0)
+        if key == "items":
+            return tuple.__getitem__(self, 1)
+        if key == "talents":
+            return dict(zip(TALENT_TIERS, tuple.__getitem__(self, 2)))
+        if key == "modifiers":
+            return [
+                {"type": type_name, "values": dict(value_pairs)}
+                for type_name, value_pairs in tuple.__getitem__(self, 3)
+            ]
+        if isinstance(key, str):
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self._fields else default
+
+    def keys(self):
+        return list(self._fields)
+
+    def as_dict(self):
+        payload = {key: self[key] for key in self._fields}
+        payload["items"] = list(payload["items"])
+        return payload
+
+    def __repr__(self):
+        return f"HeroState({self.as_dict()!r})"
+
+
+class HeroCoreEngine:
+    """Compute hero core rows and target metrics from dataset.json without any Tk state."""
+
+    def __init__(self, heroes, items):
+        self.heroes = heroes if isinstance(heroes, dict) else {}
+        self.items = items if isinstance(items, dict) else {}
+        self.hero_names = sorted(self.heroes.keys())
+        self.item_names = [""] + sorted(self.items.keys())
+        self.item_name_lookup = {}
+        for item_name in reversed(self.item_names):
+            self.item_name_lookup[item_name.lower()] = item_name
+        self.item_modifier_cache = {}
+        self.item_build_cache = {}
+        self.talent_bonus_cache = {}
+        self.primary_attribute_cache = {}
+        self.target_spell_cache = {}
+        self.target_snapshot_cache = {}
+        self.hero_stats_cache = {}
+
+    @classmethod
+    def from_dataset_file(cls, dataset_path):
+        payload = _load_json_file(dataset_path, {"heroesCore": {}, "items": {}})
+        return cls(payload.get("heroesCore", {}), payload.get("items", {}))
+
+    def load_saved_targets(self, targets_path):
+        payload = _load_json_file(targets_path, {"targets": []})
+        return self.normalize_saved_target_records(payload.get("targets", []))
+
+    def normalize_saved_target_records(self, source_targets):
+        if not isinstance(source_targets, list):
+            return []
+
+        targets = []
+        seen_ids = set()
+        for record in source_targets:
+            normalized = self.normalize_saved_target_record(record)
+            if not normalized:
+                continue
+            if normalized["id"] in seen_ids:
+                normalized["id"] = uuid.uuid4().hex
+            seen_ids.add(normalized["id"])
+            targets.append(normalized)
+        return targets
+
+    def compute_hero_rows(self, row_specs, target_snapshot=None):
+        """
+        Evaluate many (hero_name, state) pairs in one pass.
+
+        Item builds, talent bonuses and primary attributes are memoized on the
+        engine, so sweeping the same builds across levels or heroes only pays
+        the parsing cost once.
+        """
+        results = []
+        for hero_name, state in row_specs:
+            hero_data = self.heroes.get(hero_name, {})
+            computed = self.compute_hero_stats(hero_name, hero_data, state)
+            computed.update(self.compute_target_metrics(computed, target_snapshot))
+            results.append(computed)
+        return results
+
+    def parse_target_items_display(self, items_display):
+        items = []
+        for token in _split_tokens(items_display):
+            item_name = str(token or "").strip()
+            if not item_name or item_name == "-":
+                continue
+            items.append(item_name)
+        return items
+
+    def parse_target_talent_codes(self, talents_display, strict=False):
+        """Parse "10L, 15R"-style codes; with ``strict`` an unparseable token raises ValueError."""
+        talents = {tier: "none" for tier in TALENT_TIERS}
+        for token in _split_tokens(talents_display):
+            match = re.match(r"^(10|15|20|25)\s*([lLrR])$", str(token or "").strip())
+            if not match:
+                if strict and token != "-":
+                    raise ValueError(f"Unknown talent code {token!r} (expected e.g. \"10L, 15R\")")
+                continue
+            talents[match.group(1)] = "left" if match.group(2).lower() == "l" else "right"
+        return talents
+
+    def build_saved_target_state_from_record(self, record):
+        state_source = record.get("state")
+        if isinstance(state_source, (dict, HeroState)):
+            return self.copy_hero_state(state_source)
+
+        items_source = record.get("items")
+        if not isinstance(items_source, list):
+            items_source = self.parse_target_items_display(record.get("items_display"))
+
+        talents_source = record.get("talents")
+        if not isinstance(talents_source, dict):
+            talents_source = self.parse_target_talent_codes(record.get("talents_display"))
+
+        return self.copy_hero_state(
+            {
+                "level": record.get("level", 1),
+                "items": items_source,
+                "talents": talents_source,
+            }
+        )
+
+    def normalize_target_spell_payload(self, spell_data):
+        if not isinstance(spell_data, dict):
+            return None
+
+        damage_type = str(
+            spell_data.get("damage_type")
+            or spell_data.get("type")
+            or TARGET_SPELL_DAMAGE_TYPES[0]
+        ).strip().title()
+        if damage_type == "Magic":
+            damage_type = "Magical"
+        if damage_type not in TARGET_SPELL_DAMAGE_TYPES:
+            damage_type = TARGET_SPELL_DAMAGE_TYPES[0]
+
+        return {
+            "label": str(spell_data.get("label") or spell_data.get("name") or "").strip(),
+            "damage": str(spell_data.get("damage") or spell_data.get("value") or "").strip(),
+            "damage_type": damage_type,
+            "enabled": _as_bool(spell_data.get("enabled"), default=True),
+        }
+
+    def copy_target_spell_payloads(self, spells):
+        if not isinstance(spells, list):
+            return []
+
+        normalized_spells = []
+        for spell_data in spells:
+            normalized_spell = self.normalize_target_spell_payload(spell_data)
+            if normalized_spell:
+                normalized_spells.append(normalized_spell)
+        return normalized_spells
+
+    def normalize_saved_target_record(self, record):
+        if not isinstance(record, dict):
+            return None
+
+        hero_name = _normalize_choice(record.get("hero_name"), self.hero_names)
+        if not hero_name:
+            return None
+
+        state = self.build_saved_target_state_from_record(record)
+
+        return {
+            "id": str(record.get("id") or uuid.uuid4().hex),
+            "name": str(record.get("name") or "Saved Target").strip() or "Saved Target",
+            "hero_name": hero_name,
+            "state": state,
+            "incoming_spells": self.copy_target_spell_payloads(
+                record.get("incoming_spells")
+                if isinstance(record.get("incoming_spells"), list)
+                else record.get("spells")
+            ),
+            "source_row_label": str(record.get("source_row_label") or record.get("row_label") or "").strip(),
+            "saved_at": str(record.get("saved_at") or _timestamp()).strip() or _timestamp(),
+        }
+
+    def compile_target_spell(self, spell_payload):
+        """
+        Normalize a spell payload and evaluate its damage expression once.
+
+        Returns (normalized_spell, raw_damage), cached by the payload's
+        contents so an edited spell row simply misses the cache.
+        """
+        if not isinstance(spell_payload, dict):
+            return None, None
+
+        cache_key = json.dumps(spell_payload, sort_keys=True, default=str)
+        cached = self.target_spell_cache.get(cache_key)
+        if cached is None:
+            normalized_spell = self.normalize_target_spell_payload(spell_payload)
+            raw_damage = safe_eval(normalized_spell.get("damage", ""), None)
+            cached = (normalized_spell, None if raw_damage is None else float(raw_damage))
+            if len(self.target_spell_cache) >= TARGET_SPELL_CACHE_LIMIT:
+                self.target_spell_cache.clear()
+            self.target_spell_cache[cache_key] = cached
+        return cached
+
+    def evaluate_target_spell(self, spell_payload, target_snapshot):
+        normalized_spell, raw_damage = self.compile_target_spell(spell_payload)
+        if not normalized_spell or not normalized_spell.get("enabled", True):
+            return None
+
+        if raw_damage is None:
+            return {
+                "label": normalized_spell["label"],
+                "damage": normalized_spell["damage"],
+                "damage_type": normalized_spell["damage_type"],
+                "raw_damage": None,
+                "effective_damage": None,
+            }
+
+        damage_type = normalized_spell["damage_type"]
+        if damage_type == "Physical":
+            effective_damage = apply_physical_reduction(raw_damage, _to_float(target_snapshot.get("armor"), default=0.0))
+        elif damage_type == "Magical":
+            effective_damage = apply_magic_resistance(
+                raw_damage,
+                _to_float(target_snapshot.get("magic_resist"), default=0.0) / 100.0,
+            )
+        else:
+            effective_damage = raw_damage
+
+        return {
+            "label": normalized_spell["label"],
+            "damage": normalized_spell["damage"],
+            "damage_type": damage_type,
+            "raw_damage": raw_damage,
+            "effective_damage": effective_damage,
+        }
+
+    def evaluate_target_spells(self, spell_payloads, target_snapshot):
+        entries = []
+        total_raw_damage = 0.0
+        total_effective_damage = 0.0
+
+        for spell_payload in spell_payloads or []:
+            entry = self.evaluate_target_spell(spell_payload, target_snapshot)
+            if not entry:
+                continue
+            entries.append(entry)
+            if entry["raw_damage"] is not None:
+                total_raw_damage += entry["raw_damage"]
+            if entry["effective_damage"] is not None:
+                total_effective_damage += entry["effective_damage"]
+
+        return {
+            "incoming_spell_entries": entries,
+            "incoming_spell_count": len(entries),
+            "incoming_spell_raw_damage": total_raw_damage,
+            "incoming_spell_effective_damage": total_effective_damage,
+        }
+
+    def build_target_snapshot_from_template(self, target_record, source_type):
+        """
+        Build the combined target snapshot shared by every row in a refresh.
+
+        Snapshots are cached by the record's contents, so repeated refreshes
+        reuse one object until the target or its spell rows are edited.
+        Callers must treat the returned snapshot as read-only.
+        """
+        if not isinstance(target_record, dict):
+            return None
+
+        cache_key = (source_type, json.dumps(target_record, sort_keys=True, default=str))
+        if cache_key in self.target_snapshot_cache:
+            return self.target_snapshot_cache[cache_key]
+
+        snapshot = self._build_target_snapshot_uncached(target_record, source_type)
+        if len(self.target_snapshot_cache) >= TARGET_SNAPSHOT_CACHE_LIMIT:
+            self.target_snapshot_cache.clear()
+        self.target_snapshot_cache[cache_key] = snapshot
+        return snapshot
+
+    def _build_target_snapshot_uncached(self, target_record, source_type):
+        hero_name = _normalize_choice(target_record.get("hero_name"), self.hero_names)
+        if not hero_name or hero_name not in self.heroes:
+            return None
+
+        state = self.copy_hero_state(target_record.get("state"))
+        incoming_spells = self.copy_target_spell_payloads(target_record.get("incoming_spells"))
+        hero_data = self.heroes.get(hero_name, {})
+        computed = self.compute_hero_stats(hero_name, hero_data, state)
+
+        snapshot = {
+            "id": str(target_record.get("id") or ""),
+            "name": str(target_record.get("name") or "Saved Target").strip() or "Saved Target",
+            "hero_name": hero_name,
+            "row_label": str(target_record.get("source_row_label") or "").strip(),
+            "level": state["level"],
+            "health": computed["health"],
+            "health_regen": computed["health_regen"],
+            "armor": computed["armor"],
+            "magic_resist": computed["magic_resist"],
+            "evasion": 0.0,
+            "items_display": computed["items_display"],
+            "talents_display": computed["talents_display"],
+            "state": state,
+            "incoming_spells": incoming_spells,
+            "saved_at": str(target_record.get("saved_at") or "").strip(),
+            "_source_type": source_type,
+        }
+        spell_totals = self.evaluate_target_spells(incoming_spells, snapshot)
+        snapshot.update(spell_totals)
+        snapshot["remaining_health_after_spells"] = max(
+            0.0,
+            snapshot["health"] - snapshot["incoming_spell_effective_damage"],
+        )
+        return snapshot
+
+    def default_hero_state(self):
+        return {
+            "level": 1,
+            "items": ["" for _ in range(INVENTORY_SLOTS)],
+            "talents": {tier: "none" for tier in TALENT_TIERS},
+            "modifiers": [],
+        }
+
+    def normalize_modifier_payload(self, modifier_data):
+        if not isinstance(modifier_data, dict):
+            return None
+
+        type_name = str(modifier_data.get("type") or "").strip()
+        if type_name not in HERO_CORE_MODIFIER_TYPE_SET:
+            return None
+
+        values = modifier_data.get("values", {})
+        if not isinstance(values, dict):
+            values = {}
+
+        normalized_values = {}
+        for key, value in values.items():
+            key_text = str(key or "").strip()
+            if not key_text.endswith("_var"):
+                continue
+            if isinstance(value, bool):
+                normalized_values[key_text] = value
+            else:
+                normalized_values[key_text] = str(value)
+
+        return {
+            "type": type_name,
+            "values": normalized_values,
+        }
+
+    def freeze_hero_state(self, state=None):
+        """Normalize a state like copy_hero_state and return it as a HeroState."""
+        if isinstance(state, HeroState):
+            return state
+
+        normalized = self.copy_hero_state(state)
+        return HeroState(
+            normalized["level"],
+            normalized["items"],
+            [normalized["talents"][tier] for tier in TALENT_TIERS],
+            [
+                (modifier["type"], tuple(sorted(modifier["values"].items())))
+                for modifier in normalized["modifiers"]
+            ],
+        )
+
+    def copy_hero_state(self, state=None):
+        if isinstance(state, HeroState):
+            return state.as_dict()
+
+        source = state or self.default_hero_state()
+        items = [str(item or "").strip() for item in list(source.get("items", []))[:INVENTORY_SLOTS]]
+        if len(items) < INVENTORY_SLOTS:
+            items.extend([""] * (INVENTORY_SLOTS - len(items)))
+
+        talent_source = source.get("talents", {})
+        if not isinstance(talent_source, dict):
+            talent_source = {}
+
+        modifier_source = source.get("modifiers", [])
+        if not isinstance(modifier_source, list):
+            modifier_source = []
+
+        normalized_modifiers = []
+        for modifier_data in modifier_source:
+            normalized_modifier = self.normalize_modifier_payload(modifier_data)
+            if normalized_modifier:
+                normalized_modifiers.append(normalized_modifier)
+
+        return {
+            "level": self.parse_level_value(source.get("level", 1)),
+            "items": items,
+            "talents": {
+                tier: (
+                    str(talent_source.get(tier, "none")).strip().lower()
+                    if str(talent_source.get(tier, "none")).strip().lower() in {"none", "left", "right"}
+                    else "none"
+                )
+                for tier in TALENT_TIERS
+            },
+            "modifiers": normalized_modifiers,
+        }
+
+    def apply_state_edit(self, state, operation, value):
+        """
+        Apply one bulk edit operation to a row state.
+
+        ``value`` is an int delta for level_delta, a level for set_level, an
+        item name for add_item/remove_item and a (tier, choice) pair for
+        set_talent. Returns the edited HeroState, or ``state`` itself when
+        the edit changes nothing.
+        """
+        frozen = self.freeze_hero_state(state)
+        changes = {}
+        if operation == "level_delta":
+            changes["level"] = max(1, min(MAX_LEVEL, frozen["level"] + int(value)))
+        elif operation == "set_level":
+            changes["level"] = self.parse_level_value(value)
+        elif operation == "add_item":
+            item_name = self.normalize_item_name(value)
+            if item_name and "" in frozen["items"]:
+                items = list(frozen["items"])
+                items[items.index("")] = item_name
+                changes["items"] = items
+        elif operation == "remove_item":
+            item_name = self.normalize_item_name(value)
+            if item_name:
+                changes["items"] = ["" if slot_item == item_name else slot_item for slot_item in frozen["items"]]
+        elif operation == "set_talent":
+            tier, choice = value
+            tier = str(tier).strip()
+            choice = str(choice or "none").strip().lower()
+            if tier not in TALENT_TIERS or choice not in {"none", "left", "right"}:
+                raise ValueError(f"Unsupported talent edit: {value!r}")
+            changes["talents"] = dict(frozen["talents"], **{tier: choice})
+        else:
+            raise ValueError(f"Unsupported bulk edit operation: {operation!r}")
+
+        if not changes:
+            return state
+        edited = self.freeze_hero_state(dict(frozen, **changes))
+        return state if edited == frozen else edited
+
+    def modifier_payload_enabled(self, modifier_payload):
+        values = modifier_payload.get("values", {})
+        return _as_bool(values.get("enabled_var"), default=True)
+
+    def modifier_payload_label(self, modifier_payload):
+        values = modifier_payload.get("values", {})
+        return str(values.get("label_var") or modifier_payload.get("type") or "Modifier").strip() or "Modifier"
+
+    def modifier_payload_value(self, modifier_payload, key="value_var", default=0.0):
+        values = modifier_payload.get("values", {})
+        raw_value = values.get(key, "")
+        parsed = safe_eval(str(raw_value or ""), None)
+        return default if parsed is None else float(parsed)
+
+    def modifier_payloads_summary_text(self, modifier_payloads):
+        labels = [
+            self.modifier_payload_label(modifier_payload)
+            for modifier_payload in modifier_payloads
+            if self.modifier_payload_enabled(modifier_payload)
+        ]
+        return ", ".join(labels) if labels else "-"
+
+    def normalize_hero_name(self, value):
+        return _normalize_choice(value, self.hero_names)
+
+    def normalize_item_name(self, value):
+        return self.item_name_lookup.get(str(value or "").strip().lower(), "")
+
+    def parse_level_value(self, value):
+        try:
+            parsed = int(float(str(value or "").strip()))
+        except ValueError:
+            parsed = 1
+        return max(1, min(MAX_LEVEL, parsed))
+
+    def compute_target_metrics(self, computed, target_snapshot):
+        metrics = {
+            "target_damage_per_hit": None,
+            "target_dps": None,
+            "target_attacks_to_kill": None,
+            "target_time_to_kill": None,
+            "target_name": target_snapshot.get("name") if target_snapshot else "",
+            "incoming_spell_raw_damage": target_snapshot.get("incoming_spell_raw_damage", 0.0) if target_snapshot else 0.0,
+            "incoming_spell_effective_damage": target_snapshot.get("incoming_spell_effective_damage", 0.0) if target_snapshot else 0.0,
+            "remaining_health_after_spells": target_snapshot.get("remaining_health_after_spells", 0.0) if target_snapshot else 0.0,
+        }
+        if not target_snapshot:
+            return metrics
+
+        attack_speed = _to_float(computed.get("attack_speed"), default=0.0)
+        bat = _to_float(computed.get("bat"), default=0.0)
+        attack_rate = calculate_attack_rate(attack_speed, bat)
+
+        raw_attack_damage = _to_float(computed.get("attack_damage"), default=0.0)
+        target_armor = _to_float(target_snapshot.get("armor"), default=0.0)
+        evasion = max(0.0, _to_float(target_snapshot.get("evasion"), default=0.0)) / 100.0
+        target_health = _to_float(target_snapshot.get("health"), default=None)
+        target_regen = _to_float(target_snapshot.get("health_regen"), default=0.0)
+        incoming_spell_damage = _to_float(target_snapshot.get("incoming_spell_effective_damage"), default=0.0)
+
+        reduced_damage = apply_physical_reduction(raw_attack_damage, target_armor)
+        reduced_damage *= max(0.0, 1.0 - evasion)
+
+        metrics["target_damage_per_hit"] = reduced_damage
+        metrics["target_dps"] = calculate_dps(reduced_damage, attack_rate)
+
+        if target_health is not None and target_health > 0:
+            remaining_health = max(0.0, target_health - incoming_spell_damage)
+            if remaining_health <= 0:
+                metrics["target_attacks_to_kill"] = 0
+                metrics["target_time_to_kill"] = 0
+                return metrics
+            metrics["target_attacks_to_kill"] = calculate_hits_to_kill(
+                remaining_health,
+                reduced_damage,
+                target_regen,
+                attack_rate,
+            )
+            metrics["target_time_to_kill"] = calculate_time_to_kill(
+                remaining_health,
+                reduced_damage,
+                attack_rate,
+                target_regen,
+            )
+
+        return metrics
+
+    def infer_primary_attribute(self, hero_name, hero_data):
+        cached = self.primary_attribute_cache.get(hero_name)
+        if cached is None or cached[0] is not hero_data:
+            cached = (hero_data, self._infer_primary_attribute_uncached(hero_data))
+            self.primary_attribute_cache[hero_name] = cached
+        return cached[1]
+
+    def _infer_primary_attribute_uncached(self, hero_data):
+        explicit_candidates = [
+            hero_data.get("primary_attribute"),
+            hero_data.get("primaryAttribute"),
+            hero_data.get("attribute_type"),
+            hero_data.get("general", {}).get("primary_attribute") if isinstance(hero_data.get("general"), dict) else "",
+        ]
+        for candidate in explicit_candidates:
+            normalized = self._normalize_primary_attribute(candidate)
+            if normalized != "unknown":
+                return normalized
+
+        attribute_gains = hero_data.get("attributeGains", {})
+        stat_gains = hero_data.get("statGains", {})
+        main_attack_damage = stat_gains.get("mainAttackDamage")
+
+        if main_attack_damage is not None:
+            main_attack_damage = _to_float(main_attack_damage, default=None)
+            if main_attack_damage is not None:
+                strength_gain = _to_float(attribute_gains.get("strength"))
+                agility_gain = _to_float(attribute_gains.get("agility"))
+                intelligence_gain = _to_float(attribute_gains.get("intelligence"))
+                universal_gain = 0.45 * (strength_gain + agility_gain + intelligence_gain)
+                scores = {
+                    "strength": abs(main_attack_damage - strength_gain),
+                    "agility": abs(main_attack_damage - agility_gain),
+                    "intelligence": abs(main_attack_damage - intelligence_gain),
+                    "universal": abs(main_attack_damage - universal_gain),
+                }
+                return min(scores, key=scores.get)
+
+        ranked_gains = sorted(
+            [
+                ("strength", _to_float(attribute_gains.get("strength"))),
+                ("agility", _to_float(attribute_gains.get("agility"))),
+                ("intelligence", _to_float(attribute_gains.get("intelligence"))),
+            ],
+            key=lambda item: (item[1], item[0]),
+            reverse=True,
+        )
+        if ranked_gains and ranked_gains[0][1] > 0:
+            return ranked_gains[0][0]
+        return "unknown"
+
+    def _normalize_primary_attribute(self, value):
+        lowered = str(value or "").strip().lower()
+        mapping = {
+            "str": "strength",
+            "strength": "strength",
+            "agi": "agility",
+            "agility": "agility",
+            "int": "intelligence",
+            "intelligence": "intelligence",
+            "uni": "universal",
+            "universal": "universal",
+        }
+        return mapping.get(lowered, "unknown")
+
+    def _collect_state_custom_modifiers(self, state):
+        modifiers = _empty_modifiers()
+        damage_modifiers = []
+        active_labels = []
+
+        for modifier_payload in state.get("modifiers", []):
+            normalized_modifier = self.normalize_modifier_payload(modifier_payload)
+            if not normalized_modifier or not self.modifier_payload_enabled(normalized_modifier):
+                continue
+
+            type_name = normalized_modifier["type"]
+            label = self.modifier_payload_label(normalized_modifier)
+            value = self.modifier_payload_value(normalized_modifier)
+
+            if type_name == "Flat Damage":
+                if abs(value) > 1e-9:
+                    damage_modifiers.append({"kind": "flat", "value": value})
+                    active_labels.append(label)
+                continue
+
+            if type_name == "Percentage Damage":
+                pct = value / 100.0
+                if abs(pct) > 1e-9:
+                    damage_modifiers.append(
+                        {
+                            "kind": "pct",
+                            "value": pct,
+                            "apply_to_total": _as_bool(
+                                normalized_modifier.get("values", {}).get("apply_to_total_var"),
+                                default=True,
+                            ),
+                        }
+                    )
+                    active_labels.append(label)
+                continue
+
+            applied = False
+            if type_name == "Strength":
+                modifiers["strength"] += value
+                applied = True
+            elif type_name == "Agility":
+                modifiers["agility"] += value
+                applied = True
+            elif type_name == "Intelligence":
+                modifiers["intelligence"] += value
+                applied = True
+            elif type_name == "Armor":
+                modifiers["armor_flat"] += value
+                applied = True
+            elif type_name == "Magic Resistance":
+                modifiers["magic_resist_flat"] += value
+                applied = True
+            elif type_name == "Attack Speed":
+                modifiers["attack_speed_flat"] += value
+                applied = True
+            elif type_name == "BAT Reduction %":
+                modifiers["bat_reduction_pct"] += value / 100.0
+                applied = True
+            elif type_name == "HP":
+                modifiers["health_flat"] += value
+                applied = True
+            elif type_name == "Mana":
+                modifiers["mana_flat"] += value
+                applied = True
+            elif type_name == "HP Regen Flat":
+                modifiers["health_regen_flat"] += value
+                applied = True
+            elif type_name == "Mana Regen Flat":
+                modifiers["mana_regen_flat"] += value
+                applied = True
+            elif type_name == "Movespeed Flat":
+                modifiers["move_speed_flat"] += value
+                applied = True
+            elif type_name == "Movespeed Percent":
+                modifiers["move_speed_pct"] += value / 100.0
+                applied = True
+
+            if applied and abs(value) > 1e-9:
+                active_labels.append(label)
+
+        return modifiers, damage_modifiers, active_labels
+
+    def _apply_attack_damage_modifier_chain(self, base_damage, damage_modifiers):
+        damage = float(base_damage)
+        for modifier in damage_modifiers:
+            if modifier.get("kind") == "flat":
+                damage += modifier.get("value", 0.0)
+                continue
+            if modifier.get("kind") == "pct":
+                pct = modifier.get("value", 0.0)
+                if modifier.get("apply_to_total", True):
+                    damage *= max(0.0, 1 + pct)
+                else:
+                    damage += base_damage * pct
+        return damage
+
+    def compute_hero_stats(self, hero_name, hero_data, state):
+        """
+        Compute a row's stats. HeroState rows are memoized by (hero, state),
+        so duplicated variants and unchanged rows are computed once.
+        """
+        if not isinstance(state, HeroState) or hero_data is not self.heroes.get(hero_name):
+            return self._compute_hero_stats_uncached(hero_name, hero_data, state)
+
+        cache_key = (hero_name, state)
+        cached = self.hero_stats_cache.get(cache_key)
+        if cached is None:
+            cached = self._compute_hero_stats_uncached(hero_name, hero_data, state)
+            if len(self.hero_stats_cache) >= HERO_STATS_CACHE_LIMIT:
+                self.hero_stats_cache.clear()
+            self.hero_stats_cache[cache_key] = cached
+        return dict(cached)
+
+    def _compute_hero_stats_uncached(self, hero_name, hero_data, state):
+        level = state["level"]
+        stats = hero_data.get("stats", {})
+        attributes = hero_data.get("attributes", {})
+        attribute_gains = hero_data.get("attributeGains", {})
+        stat_gains = hero_data.get("statGains", {})
+        primary_attribute = self.infer_primary_attribute(hero_name, hero_data)
+
+        item_modifiers, selected_items = self._collect_state_item_modifiers(state)
+        networth = sum(self.item_cost_value(item_name) for item_name in selected_items)
+        talent_modifiers, selected_talent_codes, applied_talent_labels = self._collect_state_talent_modifiers(
+            hero_data,
+            state,
+            level,
+        )
+        custom_modifiers, custom_damage_modifiers, custom_modifier_labels = self._collect_state_custom_modifiers(state)
+
+        total_modifiers = _empty_modifiers()
+        _merge_modifiers(total_modifiers, item_modifiers)
+        _merge_modifiers(total_modifiers, talent_modifiers)
+        _merge_modifiers(total_modifiers, custom_modifiers)
+
+        strength_base = _to_float(attributes.get("strength"))
+        agility_base = _to_float(attributes.get("agility"))
+        intelligence_base = _to_float(attributes.get("intelligence"))
+        strength_gain = _to_float(attribute_gains.get("strength"))
+        agility_gain = _to_float(attribute_gains.get("agility"))
+        intelligence_gain = _to_float(attribute_gains.get("intelligence"))
+        level_factor = max(0, level - 1)
+
+        strength = strength_base + (strength_gain * level_factor) + total_modifiers["strength"]
+        agility = agility_base + (agility_gain * level_factor) + total_modifiers["agility"]
+        intelligence = intelligence_base + (intelligence_gain * level_factor) + total_modifiers["intelligence"]
+
+        health = _to_float(stats.get("health")) + (_to_float(stat_gains.get("health")) * level_factor)
+        health += 22.0 * total_modifiers["strength"]
+        health += total_modifiers["health_flat"]
+        if total_modifiers["health_pct"]:
+            health *= max(0.0, 1 + total_modifiers["health_pct"])
+
+        health_regen = _to_float(stats.get("healthRegen")) + (_to_float(stat_gains.get("healthRegen")) * level_factor)
+        health_regen += 0.1 * total_modifiers["strength"]
+        health_regen += total_modifiers["health_regen_flat"]
+        if total_modifiers["max_hp_regen_pct"]:
+            health_regen += health * total_modifiers["max_hp_regen_pct"]
+
+        mana = _to_float(stats.get("mana")) + (_to_float(stat_gains.get("mana")) * level_factor)
+        mana += 12.0 * total_modifiers["intelligence"]
+        mana += total_modifiers["mana_flat"]
+        if total_modifiers["mana_pct"]:
+            mana *= max(0.0, 1 + total_modifiers["mana_pct"])
+
+        mana_regen = _to_float(stats.get("manaRegen")) + (_to_float(stat_gains.get("manaRegen")) * level_factor)
+        mana_regen += 0.05 * total_modifiers["intelligence"]
+        mana_regen += total_modifiers["mana_regen_flat"]
+
+        armor = _to_float(stats.get("armor")) + (_to_float(stat_gains.get("armor")) * level_factor)
+        armor += total_modifiers["agility"] / 6.0
+        armor += total_modifiers["armor_flat"]
+
+        magic_resist = _to_float(stats.get("magicResistance")) + (_to_float(stat_gains.get("magicResistance")) * level_factor)
+        magic_resist += total_modifiers["magic_resist_flat"]
+
+        attack_damage_bonus = self._base_attack_damage_gain(hero_data, primary_attribute) * level_factor
+        attack_damage_bonus += self._bonus_attribute_damage(primary_attribute, total_modifiers)
+        attack_damage_bonus += total_modifiers["attack_damage_flat"]
+
+        attack_damage = _to_float(stats.get("damageAverage")) + attack_damage_bonus
+        damage_min = _to_float(stats.get("damageMin"), default=None)
+        if damage_min is not None:
+            damage_min += attack_damage_bonus
+        damage_max = _to_float(stats.get("damageMax"), default=None)
+        if damage_max is not None:
+            damage_max += attack_damage_bonus
+
+        attack_damage = self._apply_attack_damage_modifier_chain(attack_damage, custom_damage_modifiers)
+        if damage_min is not None:
+            damage_min = self._apply_attack_damage_modifier_chain(damage_min, custom_damage_modifiers)
+        if damage_max is not None:
+            damage_max = self._apply_attack_damage_modifier_chain(damage_max, custom_damage_modifiers)
+
+        attack_speed = _to_float(stats.get("totalAttackSpeed", stats.get("attackSpeed")))
+        attack_speed += _to_float(stat_gains.get("attackSpeed")) * level_factor
+        attack_speed += total_modifiers["agility"]
+        attack_speed += total_modifiers["attack_speed_flat"]
+        if total_modifiers["attack_speed_pct"]:
+            attack_speed *= max(0.0, 1 + total_modifiers["attack_speed_pct"])
+
+        move_speed = _to_float(stats.get("moveSpeed")) + total_modifiers["move_speed_flat"]
+        if total_modifiers["move_speed_pct"]:
+            move_speed *= max(0.0, 1 + total_modifiers["move_speed_pct"])
+
+        attack_range = _to_float(stats.get("attackRange")) + total_modifiers["attack_range_flat"]
+        projectile_speed = stats.get("projectileSpeed")
+        if isinstance(projectile_speed, (int, float)):
+            projectile_speed = float(projectile_speed) + total_modifiers["projectile_speed_flat"]
+        else:
+            projectile_speed = str(projectile_speed or "")
+        bat = _to_float(stats.get("bat"))
+        if total_modifiers["bat_reduction_pct"]:
+            bat *= max(0.05, 1 - min(0.95, max(0.0, total_modifiers["bat_reduction_pct"])))
+
+        return {
+            "primary_attribute": primary_attribute,
+            "strength": strength,
+            "strength_gain": strength_gain,
+            "agility": agility,
+            "agility_gain": agility_gain,
+            "intelligence": intelligence,
+            "intelligence_gain": intelligence_gain,
+            "health": health,
+            "health_regen": health_regen,
+            "mana": mana,
+            "mana_regen": mana_regen,
+            "armor": armor,
+            "magic_resist": magic_resist,
+            "attack_damage": attack_damage,
+            "damage_min": damage_min,
+            "damage_max": damage_max,
+            "attack_speed": attack_speed,
+            "move_speed": move_speed,
+            "attack_range": attack_range,
+            "projectile_speed": projectile_speed,
+            "bat": bat,
+            "animation_point": _to_float(stats.get("animationPoint"), default=None),
+            "animation_backswing": _to_float(stats.get("animationBackswing"), default=None),
+            "turn_rate": _to_float(stats.get("turnRate")),
+            "collision_size": _to_float(stats.get("collisionSize"), default=None),
+            "vision_day": _to_float(stats.get("visionDay"), default=None),
+            "vision_night": _to_float(stats.get("visionNight"), default=None),
+            "networth": networth,
+            "talents_display": ", ".join(selected_talent_codes) if selected_talent_codes else "-",
+            "items_display": ", ".join(selected_items) if selected_items else "-",
+            "applied_talent_labels": applied_talent_labels,
+            "custom_modifier_labels": custom_modifier_labels,
+            "selected_items": selected_items,
+        }
+
+    def _base_attack_damage_gain(self, hero_data, primary_attribute):
+        stat_gains = hero_data.get("statGains", {})
+        explicit_gain = stat_gains.get("mainAttackDamage")
+        if explicit_gain is not None:
+            return _to_float(explicit_gain)
+
+        attribute_gains = hero_data.get("attributeGains", {})
+        if primary_attribute == "strength":
+            return _to_float(attribute_gains.get("strength"))
+        if primary_attribute == "agility":
+            return _to_float(attribute_gains.get("agility"))
+        if primary_attribute == "intelligence":
+            return _to_float(attribute_gains.get("intelligence"))
+        if primary_attribute == "universal":
+            return 0.45 * (
+                _to_float(attribute_gains.get("strength"))
+                + _to_float(attribute_gains.get("agility"))
+                + _to_float(attribute_gains.get("intelligence"))
+            )
+        return 0.0
+
+    def _bonus_attribute_damage(self, primary_attribute, modifiers):
+        if primary_attribute == "strength":
+            return modifiers["strength"]
+        if primary_attribute == "agility":
+            return modifiers["agility"]
+        if primary_attribute == "intelligence":
+            return modifiers["intelligence"]
+        if primary_attribute == "universal":
+            return 0.45 * (modifiers["strength"] + modifiers["agility"] + modifiers["intelligence"])
+        return 0.0
+
+    def _collect_state_item_modifiers(self, state):
+        build_key = tuple(state["items"])
+        cached = self.item_build_cache.get(build_key)
+        if cached is not None:
+            return cached[0], list(cached[1])
+
+        modifiers = _empty_modifiers()
+        selected_items = []
+
+        for item_name in state["items"]:
+            normalized_name = self.normalize_item_name(item_name)
+            if not normalized_name or normalized_name not in self.items:
+                continue
+            selected_items.append(normalized_name)
+            _merge_modifiers(modifiers, self.get_item_modifiers(normalized_name))
+
+        self.item_build_cache[build_key] = (modifiers, tuple(selected_items))
+        return modifiers, selected_items
+
+    def rank_items_by_value(self, hero_name, state, target_snapshot=None, metric="ttk", levels=None):
+        """
+        Rank every purchasable item by metric gain per gold for one row.
+
+        metric is "ttk" (seconds of time to kill saved), "dps" (target DPS
+        gained) or "ehp" (physical effective HP gained); the first two need a
+        target snapshot. Each candidate goes into the first empty slot, or an
+        extra slot when the inventory is full, and is scored at every level in
+        ``levels`` (default: the row's level). Results are sorted by mean gain
+        per gold, best first.
+        """
+        if metric not in ITEM_RANKING_METRICS:
+            raise ValueError(f"Unsupported item ranking metric: {metric!r}")
+        if metric != "ehp" and not target_snapshot:
+            return []
+
+        hero_data = self.heroes.get(hero_name, {})
+        levels = sorted({self.parse_level_value(level) for level in (levels or [state["level"]])})
+        base_items = list(state["items"])
+        free_slot = base_items.index("") if "" in base_items else None
+
+        def metric_value(candidate_state):
+            computed = self.compute_hero_stats(hero_name, hero_data, candidate_state)
+            if metric == "ehp":
+                reduction = calculate_physical_reduction(computed["armor"])
+                return computed["health"] / (1 - reduction) if reduction < 1 else math.inf
+            metrics = self.compute_target_metrics(computed, target_snapshot)
+            value = metrics["target_time_to_kill" if metric == "ttk" else "target_dps"]
+            return math.inf if value is None else float(value)
+
+        baselines = {}
+        level_states = {}
+        for level in levels:
+            level_state = dict(state, level=level)
+            level_states[level] = level_state
+            baselines[level] = metric_value(level_state)
+
+        rankings = []
+        for item_name in self.item_names:
+            cost = self.item_cost_value(item_name)
+            if cost <= 0:
+                continue
+
+            candidate_items = list(base_items)
+            if free_slot is None:
+                candidate_items.append(item_name)
+            else:
+                candidate_items[free_slot] = item_name
+
+            level_results = {}
+            for level in levels:
+                value = metric_value(dict(level_states[level], items=candidate_items))
+                baseline = baselines[level]
+                gain = baseline - value if metric == "ttk" else value - baseline
+                if math.isnan(gain):
+                    gain = 0.0
+                level_results[level] = {"baseline": baseline, "value": value, "gain": gain}
+
+            mean_gain = sum(result["gain"] for result in level_results.values()) / len(level_results)
+            rankings.append(
+                {
+                    "item": item_name,
+                    "cost": cost,
+                    "gain": mean_gain,
+                    "gain_per_gold": mean_gain / cost,
+                    "levels": level_results,
+                }
+            )
+
+        rankings.sort(key=lambda ranking: (-ranking["gain_per_gold"], ranking["item"]))
+        return rankings
+
+    def item_cost_value(self, item_name):
+        if not item_name or item_name not in self.items:
+            return 0.0
+
+        item_data = self.items.get(item_name, {})
+        parsed_cost = _to_float(item_data.get("cost"), default=None)
+        if parsed_cost is None:
+            return 0.0
+        return parsed_cost
+
+    def get_item_modifiers(self, item_name):
+        if item_name in self.item_modifier_cache:
+            cached = self.item_modifier_cache[item_name]
+            fresh = _empty_modifiers()
+            _merge_modifiers(fresh, cached)
+            return fresh
+
+        item_data = self.items.get(item_name, {})
+        modifiers = _empty_modifiers()
+        has_explicit_stats = False
+
+        stats_payload = item_data.get("stats")
+        if isinstance(stats_payload, dict) and stats_payload:
+            has_explicit_stats = self._apply_stats_payload(modifiers, stats_payload)
+
+        if not has_explicit_stats:
+            parsed_passive_modifiers = self._parse_item_passive_bonuses(item_data)
+            if self._modifiers_have_value(parsed_passive_modifiers):
+                _merge_modifiers(modifiers, parsed_passive_modifiers)
+                if not self._passive_stats_are_complete(item_data):
+                    self._merge_recipe_modifiers(modifiers, item_data.get("recipe"), seen={item_name})
+            else:
+                self._merge_recipe_modifiers(modifiers, item_data.get("recipe"), seen={item_name})
+
+        self.item_modifier_cache[item_name] = modifiers
+        fresh = _empty_modifiers()
+        _merge_modifiers(fresh, modifiers)
+        return fresh
+
+    def _merge_recipe_modifiers(self, modifiers, recipe_payload, seen):
+        if not isinstance(recipe_payload, list):
+            return
+
+        for recipe_item_name in recipe_payload:
+            if recipe_item_name in seen or recipe_item_name not in self.items:
+                continue
+            seen.add(recipe_item_name)
+            _merge_modifiers(modifiers, self.get_item_modifiers(recipe_item_name))
+
+    def _apply_stats_payload(self, modifiers, stats_payload):
+        applied = False
+        for stat_name, stat_value in stats_payload.items():
+            if self._apply_named_stat_bonus(modifiers, stat_name, stat_value):
+                applied = True
+        return applied
+
+    def _apply_named_stat_bonus(self, modifiers, stat_name, stat_value):
+        value, is_percent = _first_numeric_value(stat_value)
+        if value is None:
+            return False
+
+        normalized_name = str(stat_name or "").strip().lower()
+        normalized_name = normalized_name.replace("+", "").replace("  ", " ")
+
+        if normalized_name in {"strength", "bonus strength"}:
+            modifiers["strength"] += value
+            return True
+        if normalized_name in {"agility", "bonus agility"}:
+            modifiers["agility"] += value
+            return True
+        if normalized_name in {"intelligence", "bonus intelligence"}:
+            modifiers["intelligence"] += value
+            return True
+        if normalized_name in {"all attributes", "attributes"}:
+            modifiers["strength"] += value
+            modifiers["agility"] += value
+            modifiers["intelligence"] += value
+            return True
+        if normalized_name in {"health", "bonus health"}:
+            if is_percent:
+                modifiers["health_pct"] += value / 100.0
+            else:
+                modifiers["health_flat"] += value
+            return True
+        if normalized_name in {"mana"}:
+            if is_percent:
+                modifiers["mana_pct"] += value / 100.0
+            else:
+                modifiers["mana_flat"] += value
+            return True
+        if normalized_name in {"health regeneration", "health regen"}:
+            modifiers["health_regen_flat"] += value
+            return True
+        if normalized_name in {"mana regeneration", "mana regen"}:
+            modifiers["mana_regen_flat"] += value
+            return True
+        if normalized_name in {"armor", "bonus armor", "bonus magic resistance"}:
+            if normalized_name in {"armor", "bonus armor"}:
+                modifiers["armor_flat"] += value
+            else:
+                modifiers["magic_resist_flat"] += value
+            return True
+        if normalized_name in {"magic resistance"}:
+            modifiers["magic_resist_flat"] += value
+            return True
+        if normalized_name in {"attack damage", "bonus attack damage"}:
+            modifiers["attack_damage_flat"] += value
+            return True
+        if normalized_name in {"attack speed"}:
+            if is_percent:
+                modifiers["attack_speed_pct"] += value / 100.0
+            else:
+                modifiers["attack_speed_flat"] += value
+            return True
+        if normalized_name in {"base attack speed"}:
+            modifiers["attack_speed_pct"] += value / 100.0
+            return True
+        if normalized_name in {"move speed", "bonus move speed"}:
+            if is_percent:
+                modifiers["move_speed_pct"] += value / 100.0
+            else:
+                modifiers["move_speed_flat"] += value
+            return True
+        if normalized_name == "attack range":
+            modifiers["attack_range_flat"] += value
+            return True
+        if normalized_name == "projectile speed":
+            modifiers["projectile_speed_flat"] += value
+            return True
+        if normalized_name == "max hp health regen":
+            modifiers["max_hp_regen_pct"] += value / 100.0
+            return True
+
+        return False
+
+    def _parse_item_passive_bonuses(self, item_data):
+        modifiers = _empty_modifiers()
+        abilities = item_data.get("abilities", [])
+        if not isinstance(abilities, list):
+            return modifiers
+
+        for ability in abilities:
+            if not isinstance(ability, dict):
+                continue
+            if str(ability.get("type", "")).strip().lower() != "passive":
+                continue
+
+            description = str(ability.get("description", "") or "").strip()
+            if not description:
+                continue
+
+            if description.startswith("+"):
+                for value_text, label in re.findall(
+                    r"([+-]\d+(?:\.\d+)?%?)\s+([A-Za-z][A-Za-z ]+?)(?=(?:\s+[+-]\d)|[.;]|$)",
+                    description,
+                ):
+                    self._apply_named_stat_bonus(modifiers, label.strip(), value_text)
+                continue
+
+            for label, modifier_key, as_percent in (
+                ("Armor Bonus", "armor_flat", False),
+                ("Attack Speed Bonus", "attack_speed_flat", False),
+                ("Mana Regeneration Bonus", "mana_regen_flat", False),
+                ("Health Regeneration Bonus", "health_regen_flat", False),
+                ("Move Speed Bonus", "move_speed_pct", True),
+                ("Agility Bonus", "agility", False),
+                ("Strength Bonus", "strength", False),
+                ("Intelligence Bonus", "intelligence", False),
+                ("Attack Range Bonus", "attack_range_flat", False),
+            ):
+                for match in re.finditer(
+                    rf"{re.escape(label)}:\s*([+-]?\d+(?:\.\d+)?)%?",
+                    description,
+                    flags=re.IGNORECASE,
+                ):
+                    value = _to_float(match.group(1), default=None)
+                    if value is None:
+                        continue
+                    if as_percent:
+                        modifiers[modifier_key] += value / 100.0
+                    else:
+                        modifiers[modifier_key] += value
+
+        return modifiers
+
+    def _passive_stats_are_complete(self, item_data):
+        abilities = item_data.get("abilities", [])
+        if not isinstance(abilities, list):
+            return False
+        return any(
+            str(ability.get("type", "")).strip().lower() == "passive"
+            and str(ability.get("description", "") or "").strip().startswith("+")
+            for ability in abilities
+            if isinstance(ability, dict)
+        )
+
+    def _modifiers_have_value(self, modifiers):
+        return any(abs(value) > 1e-9 for value in modifiers.values())
+
+    def _collect_state_talent_modifiers(self, hero_data, state, level):
+        modifiers = _empty_modifiers()
+        selected_codes = []
+        applied_labels = []
+        talent_payload = hero_data.get("talents", {})
+
+        for tier in TALENT_TIERS:
+            selection = state["talents"].get(tier, "none")
+            if selection not in {"left", "right"}:
+                continue
+
+            selected_codes.append(f"{tier}{selection[0].upper()}")
+            if level < int(tier):
+                continue
+
+            label = str(talent_payload.get(tier, {}).get(selection, "") or "").strip()
+            if not label:
+                continue
+
+            talent_modifiers, parsed_text = self.talent_stat_bonus(label)
+            if self._modifiers_have_value(talent_modifiers):
+                _merge_modifiers(modifiers, talent_modifiers)
+                applied_labels.append(parsed_text)
+
+        return modifiers, selected_codes, applied_labels
+
+    def talent_stat_bonus(self, label):
+        """Return the cached (modifiers, parsed text) stat bonus for a talent label."""
+        cached = self.talent_bonus_cache.get(label)
+        if cached is None:
+            cached = self.talent_bonus_cache[label] = self._parse_talent_stat_bonus(label)
+        return cached
+
+    def talent_changes_stats(self, label):
+        return self._modifiers_have_value(self.talent_stat_bonus(label)[0])
+
+    def _parse_talent_stat_bonus(self, label):
+        modifiers = _empty_modifiers()
+        text = str(label or "").strip()
+        if not text:
+            return modifiers, ""
+
+        match = re.match(r"^([+-])\s*(\d+(?:\.\d+)?)(%?)\s*(.+)$", text)
+        if not match:
+            return modifiers, ""
+
+        sign = -1.0 if match.group(1) == "-" else 1.0
+        value = sign * _to_float(match.group(2))
+        is_percent = bool(match.group(3))
+        remainder = match.group(4).strip().lower()
+
+        if "all attributes" in remainder:
+            modifiers["strength"] += value
+            modifiers["agility"] += value
+            modifiers["intelligence"] += value
+            return modifiers, text
+        if "health regen" in remainder or "health regeneration" in remainder:
+            modifiers["health_regen_flat"] += value
+            return modifiers, text
+        if "mana regen" in remainder or "mana regeneration" in remainder:
+            modifiers["mana_regen_flat"] += value
+            return modifiers, text
+        if "attack speed" in remainder:
+            modifiers["attack_speed_flat"] += value
+            return modifiers, text
+        if "attack damage" in remainder or "attack damage bonus" in remainder:
+            modifiers["attack_damage_flat"] += value
+            return modifiers, text
+        if "move speed" in remainder and "slow" not in remainder:
+            if is_percent:
+                modifiers["move_speed_pct"] += value / 100.0
+            else:
+                modifiers["move_speed_flat"] += value
+            return modifiers, text
+        if "magic resistance" in remainder and "reduction" not in remainder:
+            modifiers["magic_resist_flat"] += value
+            return modifiers, text
+        if "armor" in remainder and "reduction" not in remainder and "reduced" not in remainder and "steal" not in remainder:
+            modifiers["armor_flat"] += value
+            return modifiers, text
+        if "strength" in remainder and "damage" not in remainder:
+            modifiers["strength"] += value
+            return modifiers, text
+        if "agility" in remainder and "damage" not in remainder:
+            modifiers["agility"] += value
+            return modifiers, text
+        if "intelligence" in remainder and "damage" not in remainder:
+            modifiers["intelligence"] += value
+            return modifiers, text
+        if self._is_direct_health_talent(remainder):
+            if is_percent:
+                modifiers["health_pct"] += value / 100.0
+            else:
+                modifiers["health_flat"] += value
+            return modifiers, text
+        if self._is_direct_mana_talent(remainder):
+            if is_percent:
+                modifiers["mana_pct"] += value / 100.0
+            else:
+                modifiers["mana_flat"] += value
+            return modifiers, text
+        if "attack range" in remainder:
+            modifiers["attack_range_flat"] += value
+            return modifiers, text
+
+        return modifiers, ""
+
+    def _is_direct_health_talent(self, remainder):
+        if "health" not in remainder:
+            return False
+        if any(
+            blocked in remainder
+            for blocked in (
+                "regen",
+                "threshold",
+                "restore",
+                "restore amp",
+                "health/damage",
+                "max health as damage",
+                "missing health",
+                "kill threshold",
+                "damage",
+            )
+        ):
+            return False
+        return remainder == "health" or remainder.endswith(" health") or "max health" in remainder
+
+    def _is_direct_mana_talent(self, remainder):
+        if "mana" not in remainder:
+            return False
+        if any(
+            blocked in remainder
+            for blocked in (
+                "regen",
+                "cost",
+                "void",
+                "shock",
+                "break",
+                "restore",
+                "damage",
+                "radius",
+            )
+        ):
+            return False
+        return remainder == "mana" or remainder.endswith(" mana") or "max mana" in remainder
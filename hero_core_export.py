@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""Export hero core table metrics across heroes, levels, builds and talents without the GUI."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+
+from hero_core_engine import (
+    MAX_LEVEL,
+    TALENT_TIERS,
+    HeroCoreEngine,
+)
+
+
+REPO_ROOT = Path(__file__).resolve().parent
+DEFAULT_DATASET_PATH = REPO_ROOT / "dataset.json"
+DEFAULT_TARGETS_PATH = REPO_ROOT / "hero-core-targets.json"
+EXPORT_FORMATS = ("csv", "jsonl")
+
+EXPORT_KEY_FIELDS = ["hero", "level", "build", "talents", "target"]
+EXPORT_STAT_FIELDS = [
+    "networth",
+    "primary_attribute",
+    "strength",
+    "agility",
+    "intelligence",
+    "health",
+    "health_regen",
+    "mana",
+    "mana_regen",
+    "armor",
+    "magic_resist",
+    "attack_damage",
+    "damage_min",
+    "damage_max",
+    "attack_speed",
+    "bat",
+    "move_speed",
+    "attack_range",
+    "items_display",
+    "talents_display",
+]
+EXPORT_TARGET_FIELDS = [
+    "target_damage_per_hit",
+    "target_dps",
+    "target_attacks_to_kill",
+    "target_time_to_kill",
+    "incoming_spell_effective_damage",
+    "remaining_health_after_spells",
+]
+EXPORT_FIELDS = EXPORT_KEY_FIELDS + EXPORT_STAT_FIELDS + EXPORT_TARGET_FIELDS
+
+_worker_engine = None
+_worker_plan = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compute hero core stats and target metrics for every hero x level x build x talent "
+            "combination in a JSON spec and stream them to CSV or JSON Lines."
+        )
+    )
+    parser.add_argument("spec", help="Path to the export spec JSON file.")
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Output file path, or - for stdout. Default: -",
+    )
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default=None,
+        help="Output format. Default: inferred from --output, falling back to csv.",
+    )
+    parser.add_argument(
+        "--dataset",
+        default=str(DEFAULT_DATASET_PATH),
+        help=f"Path to dataset.json. Default: {DEFAULT_DATASET_PATH}",
+    )
+    parser.add_argument(
+        "--targets",
+        default=str(DEFAULT_TARGETS_PATH),
+        help=f"Path to saved targets JSON. Default: {DEFAULT_TARGETS_PATH}",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes to split heroes across. Use 0 for one per CPU. Default: 1",
+    )
+    return parser.parse_args()
+
+
+def _parse_level_range(levels_spec) -> list[int]:
+    if levels_spec is None:
+        return list(range(1, MAX_LEVEL + 1))
+    if isinstance(levels_spec, list):
+        levels = levels_spec
+    elif isinstance(levels_spec, dict):
+        start = int(levels_spec.get("min", 1))
+        stop = int(levels_spec.get("max", MAX_LEVEL))
+        step = max(1, int(levels_spec.get("step", 1)))
+        levels = range(start, stop + 1, step)
+    else:
+        levels = [levels_spec]
+    return sorted({max(1, min(MAX_LEVEL, int(level))) for level in levels})
+
+
+def _parse_talent_pick(pick, engine: HeroCoreEngine) -> tuple[str, dict]:
+    if isinstance(pick, dict):
+        picks = pick.get("picks", pick.get("talents", {}))
+        if isinstance(picks, str):
+            talents = engine.parse_target_talent_codes(picks, strict=True)
+        elif isinstance(picks, dict):
+            talents = {tier: "none" for tier in TALENT_TIERS}
+            for tier, side in picks.items():
+                side_key = str(side or "none").strip().lower()
+                if str(tier) not in talents or side_key not in {"none", "left", "right"}:
+                    raise ValueError(f"Unknown talent pick in export spec: {tier!r}: {side!r}")
+                talents[str(tier)] = side_key
+        else:
+            raise ValueError(f"Talent picks in export spec must be a string or object: {picks!r}")
+        name = str(pick.get("name") or "").strip()
+    else:
+        talents = engine.parse_target_talent_codes(pick, strict=True)
+        name = ""
+    codes = [f"{tier}{talents[tier][0].upper()}" for tier in TALENT_TIERS if talents[tier] != "none"]
+    return name or (", ".join(codes) if codes else "-"), talents
+
+
+def build_export_plan(spec: dict, engine: HeroCoreEngine, saved_targets: list[dict]) -> dict:
+    """Resolve a raw export spec into concrete heroes, levels, builds, talents and targets."""
+    hero_spec = spec.get("heroes", "all")
+    if hero_spec in (None, "all", "*"):
+        heroes = list(engine.hero_names)
+    else:
+        heroes = []
+        for value in hero_spec if isinstance(hero_spec, list) else [hero_spec]:
+            hero_name = engine.normalize_hero_name(value)
+            if not hero_name:
+                raise ValueError(f"Unknown hero in export spec: {value!r}")
+            if hero_name not in heroes:
+                heroes.append(hero_name)
+
+    builds = []
+    for index, build in enumerate(spec.get("builds") or [{"name": "No Items", "items": []}]):
+        if isinstance(build, list):
+            build = {"items": build}
+        items = [engine.normalize_item_name(item_name) for item_name in build.get("items", [])]
+        unknown = [item_name for item_name, normalized in zip(build.get("items", []), items) if item_name and not normalized]
+        if unknown:
+            raise ValueError(f"Unknown item(s) in export spec build {index + 1}: {', '.join(map(str, unknown))}")
+        builds.append((str(build.get("name") or f"Build {index + 1}"), items))
+
+    talents = [_parse_talent_pick(pick, engine) for pick in spec.get("talents") or [{"name": "-", "picks": {}}]]
+
+    target_spec = spec.get("targets") or []
+    if target_spec in ("all", "*"):
+        targets = list(saved_targets)
+    else:
+        targets = []
+        for value in target_spec if isinstance(target_spec, list) else [target_spec]:
+            key = str(value or "").strip().lower()
+            target = next(
+                (
+                    saved_target for saved_target in saved_targets
+                    if key in {saved_target["id"].lower(), saved_target["name"].lower()}
+                ),
+                None,
+            )
+            if target is None:
+                raise ValueError(f"Unknown saved target in export spec: {value!r}")
+            targets.append(target)
+
+    target_snapshots = [
+        engine.build_target_snapshot_from_template(target, source_type="saved")
+        for target in targets
+    ]
+    return {
+        "heroes": heroes,
+        "levels": _parse_level_range(spec.get("levels")),
+        "builds": builds,
+        "talents": talents,
+        "targets": [snapshot for snapshot in target_snapshots if snapshot] or [None],
+    }
+
+
+def iter_hero_export_rows(engine: HeroCoreEngine, plan: dict, hero_name: str):
+    for build_name, items in plan["builds"]:
+        for talent_name, talents in plan["talents"]:
+            row_specs = [
+                (hero_name, engine.copy_hero_state({"level": level, "items": items, "talents": talents}))
+                for level in plan["levels"]
+            ]
+            for target_snapshot in plan["targets"]:
+                target_name = target_snapshot["name"] if target_snapshot else ""
+                computed_rows = engine.compute_hero_rows(row_specs, target_snapshot)
+                for (_hero_name, state), computed in zip(row_specs, computed_rows):
+                    row = {
+                        "hero": hero_name,
+                        "level": state["level"],
+                        "build": build_name,
+                        "talents": talent_name,
+                        "target": target_name,
+                    }
+                    for field in EXPORT_STAT_FIELDS + EXPORT_TARGET_FIELDS:
+                        row[field] = computed.get(field)
+                    yield row
+
+
+def _init_export_worker(dataset_path: str, plan: dict) -> None:
+    global _worker_engine, _worker_plan
+    _worker_engine = HeroCoreEngine.from_dataset_file(dataset_path)
+    _worker_plan = plan
+
+
+def _export_hero_rows(hero_name: str) -> list[dict]:
+    return list(iter_hero_export_rows(_worker_engine, _worker_plan, hero_name))
+
+
+def iter_export_rows(
+    spec: dict,
+    dataset_path: str | Path = DEFAULT_DATASET_PATH,
+    targets_path: str | Path = DEFAULT_TARGETS_PATH,
+    processes: int = 1,
+):
+    """
+    Return an iterator of export rows, one per hero x level x build x talent pick x target.
+
+    With processes != 1 each worker loads its own engine and computes whole
+    heroes at a time; rows are still yielded in spec order. The spec is
+    resolved before this returns, so spec errors raise ValueError here
+    rather than partway through iteration.
+    """
+    engine = HeroCoreEngine.from_dataset_file(str(dataset_path))
+    plan = build_export_plan(spec, engine, engine.load_saved_targets(str(targets_path)))
+    return _iter_plan_rows(engine, plan, dataset_path, processes)
+
+
+def _iter_plan_rows(engine: HeroCoreEngine, plan: dict, dataset_path: str | Path, processes: int):
+    if processes == 1 or len(plan["heroes"]) <= 1:
+        for hero_name in plan["heroes"]:
+            yield from iter_hero_export_rows(engine, plan, hero_name)
+        return
+
+    with multiprocessing.Pool(
+        processes=processes or None,
+        initializer=_init_export_worker,
+        initargs=(str(dataset_path), plan),
+    ) as pool:
+        for rows in pool.imap(_export_hero_rows, plan["heroes"]):
+            yield from rows
+
+
+def write_export_rows(rows, handle, output_format: str = "csv") -> int:
+    count = 0
+    if output_format == "jsonl":
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=True) + "\n")
+            count += 1
+        return count
+
+    writer = csv.DictWriter(handle, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({field: "" if row.get(field) is None else row.get(field) for field in EXPORT_FIELDS})
+        count += 1
+    return count
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        spec = json.loads(Path(args.spec).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as error:
+        print(f"Could not read export spec from {args.spec}: {error}", file=sys.stderr)
+        return 1
+    if not isinstance(spec, dict):
+        print(f"Export spec {args.spec} must be a JSON object.", file=sys.stderr)
+        return 1
+
+    output_format = args.format or ("jsonl" if args.output.endswith((".jsonl", ".ndjson")) else "csv")
+    try:
+        rows = iter_export_rows(spec, args.dataset, args.targets, processes=args.processes)
+    except ValueError as error:
+        print(str(error), file=sys.stderr)
+        return 1
+
+    if args.output == "-":
+        try:
+            count = write_export_rows(rows, sys.stdout, output_format)
+        except ValueError as error:
+            print(str(error), file=sys.stderr)
+            return 1
+    else:
+        # Write beside the target and swap it in, so a bad spec never truncates an existing export.
+        temp_path = f"{args.output}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="") as handle:
+                count = write_export_rows(rows, handle, output_format)
+            os.replace(temp_path, args.output)
+        except (OSError, ValueError) as error:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            print(str(error), file=sys.stderr)
+            return 1
+
+    if args.output != "-":
+        print(f"Wrote {count} row(s) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
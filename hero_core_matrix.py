@@ -0,0 +1,151 @@
+"""Hero row x saved target metric matrix, partitioned across a process pool for large tables"""
+
+import json
+import multiprocessing
+
+from hero_core_engine import HeroCoreEngine, HeroState
+
+
+MATRIX_METRIC_KEYS = (
+    "target_damage_per_hit",
+    "target_dps",
+    "target_attacks_to_kill",
+    "target_time_to_kill",
+)
+PARALLEL_ROW_THRESHOLD = 2048
+MATRIX_CHUNK_SIZE = 256
+
+_worker_engine = None
+
+
+def _state_signature(hero_name, state):
+    if isinstance(state, HeroState):
+        return (hero_name, state)
+    return json.dumps([hero_name, state], sort_keys=True, separators=(",", ":"))
+
+
+def _target_signature(target_record):
+    return json.dumps(
+        {key: value for key, value in target_record.items() if key != "saved_at"},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _compute_matrix_chunk(engine, row_specs, target_snapshots):
+    results = []
+    for hero_name, state in row_specs:
+        computed = engine.compute_hero_stats(hero_name, engine.heroes.get(hero_name, {}), state)
+        cells = []
+        for target_snapshot in target_snapshots:
+            metrics = engine.compute_target_metrics(computed, target_snapshot)
+            cells.append(tuple(metrics[key] for key in MATRIX_METRIC_KEYS))
+        results.append(cells)
+    return results
+
+
+def _init_matrix_worker(heroes, items):
+    global _worker_engine
+    _worker_engine = HeroCoreEngine(heroes, items)
+
+
+def _run_matrix_chunk(job):
+    chunk_index, row_specs, target_snapshots = job
+    return chunk_index, _compute_matrix_chunk(_worker_engine, row_specs, target_snapshots)
+
+
+class TargetMatrixCache:
+    """
+    Memoize matrix cells per (row state, target template) signature.
+
+    A cell stays valid until its row's hero/state or the target template
+    changes, because either edit produces a new signature.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.cells = {}
+
+    def clear(self):
+        self.cells = {}
+
+    def compute(self, rows, targets, processes=None, progress=None):
+        """
+        Evaluate every row against every saved target.
+
+        ``rows`` is a list of (row_id, hero_name, state) and ``targets`` a list
+        of saved target records. Returns {"targets": [...snapshots],
+        "rows": {row_id: [metrics dict per target]}}. ``progress`` is called
+        as progress(done_rows, total_rows) after each finished chunk.
+        """
+        target_snapshots = []
+        target_signatures = []
+        for target in targets:
+            snapshot = self.engine.build_target_snapshot_from_template(target, source_type="saved")
+            if snapshot:
+                target_snapshots.append(snapshot)
+                target_signatures.append(_target_signature(target))
+
+        row_signatures = [_state_signature(hero_name, state) for _row_id, hero_name, state in rows]
+        live_keys = set()
+        pending_rows = []
+        for row_index, row_signature in enumerate(row_signatures):
+            row_keys = [(row_signature, target_signature) for target_signature in target_signatures]
+            live_keys.update(row_keys)
+            if any(key not in self.cells for key in row_keys):
+                pending_rows.append(row_index)
+
+        total_rows = len(rows)
+        done_rows = total_rows - len(pending_rows)
+        if progress:
+            progress(done_rows, total_rows)
+
+        chunks = [
+            pending_rows[start:start + MATRIX_CHUNK_SIZE]
+            for start in range(0, len(pending_rows), MATRIX_CHUNK_SIZE)
+        ]
+        jobs = [
+            (
+                chunk_index,
+                [(rows[row_index][1], rows[row_index][2]) for row_index in chunk],
+                target_snapshots,
+            )
+            for chunk_index, chunk in enumerate(chunks)
+        ]
+
+        def store(chunk_index, chunk_results):
+            for row_index, cells in zip(chunks[chunk_index], chunk_results):
+                for target_signature, cell in zip(target_signatures, cells):
+                    self.cells[(row_signatures[row_index], target_signature)] = cell
+
+        use_pool = processes != 1 and len(pending_rows) >= PARALLEL_ROW_THRESHOLD and len(jobs) > 1
+        if use_pool:
+            # Spawn, never fork: the caller is the Tk main thread with worker threads running.
+            with multiprocessing.get_context("spawn").Pool(
+                processes=processes,
+                initializer=_init_matrix_worker,
+                initargs=(self.engine.heroes, self.engine.items),
+            ) as pool:
+                for chunk_index, chunk_results in pool.imap_unordered(_run_matrix_chunk, jobs):
+                    store(chunk_index, chunk_results)
+                    done_rows += len(chunk_results)
+                    if progress:
+                        progress(done_rows, total_rows)
+        else:
+            for chunk_index, row_specs, chunk_targets in jobs:
+                store(chunk_index, _compute_matrix_chunk(self.engine, row_specs, chunk_targets))
+                done_rows += len(row_specs)
+                if progress:
+                    progress(done_rows, total_rows)
+
+        self.cells = {key: value for key, value in self.cells.items() if key in live_keys}
+        return {
+            "targets": target_snapshots,
+            "rows": {
+                row_id: [
+                    dict(zip(MATRIX_METRIC_KEYS, self.cells[(row_signature, target_signature)]))
+                    for target_signature in target_signatures
+                ]
+                for (row_id, _hero_name, _state), row_signature in zip(rows, row_signatures)
+            },
+        }
@@ -1,4 +1,3 @@
-import copy
 import json
 import math
 import os
@@ -6,24 +5,27 @@ import re
 import tkinter as tk
 import uuid
 from datetime import datetime
-from difflib import get_close_matches
 from tkinter import ttk
 
-from attack_calculations import (
-    apply_magic_resistance,
-    apply_physical_reduction,
-    calculate_attack_rate,
-    calculate_dps,
-    calculate_hits_to_kill,
-    calculate_time_to_kill,
+from dataset_service import build_hero_match_index, get_dataset_service
+from hero_core_engine import (
+    HERO_CORE_MODIFIER_TYPES,
+    INVENTORY_SLOTS,
+    MAX_LEVEL,
+    TALENT_TIERS,
+    TARGET_SPELL_DAMAGE_TYPES,
+    BULK_EDIT_OPERATIONS,
+    ITEM_RANKING_METRICS,
+    HeroCoreEngine,
 )
+from hero_core_breakpoints import TalentBreakpointCache
+from hero_core_matrix import MATRIX_METRIC_KEYS, TargetMatrixCache
+from hero_core_worker import BackgroundRecomputer
 from modifiers import Modifier
-from utils import safe_eval
+from search_index import NgramSearchIndex
+from startup_profiler import profile_phase
 
 
-INVENTORY_SLOTS = 6
-MAX_LEVEL = 30
-TALENT_TIERS = ("10", "15", "20", "25")
 TALENT_CHOICES = ("None", "Left", "Right")
 
 ATTRIBUTE_DISPLAY = {
@@ -36,35 +38,30 @@ ATTRIBUTE_DISPLAY = {
 
 SETTINGS_FILENAME = "hero-core-table-settings.json"
 TARGETS_FILENAME = "hero-core-targets.json"
+BACKGROUND_REFRESH_ROW_THRESHOLD = 200
+SHOP_GRID_COLUMNS = 4
+SHOP_VISIBLE_ROWS = 12
+RECOMPUTE_POLL_MS = 30
 TARGET_METRIC_COLUMN_IDS = [
     "target_damage_per_hit",
     "target_dps",
     "target_attacks_to_kill",
     "target_time_to_kill",
 ]
-TARGET_SPELL_DAMAGE_TYPES = ("Physical", "Magical", "Pure")
-HERO_CORE_MODIFIER_TYPES = tuple(
-    modifier_type
-    for modifier_type in (
-        "Flat Damage",
-        "Percentage Damage",
-        "Strength",
-        "Agility",
-        "Intelligence",
-        "Armor",
-        "Magic Resistance",
-        "Attack Speed",
-        "BAT Reduction %",
-        "HP",
-        "Mana",
-        "HP Regen Flat",
-        "Mana Regen Flat",
-        "Movespeed Flat",
-        "Movespeed Percent",
-    )
-    if modifier_type in Modifier.get_available_types()
-)
-HERO_CORE_MODIFIER_TYPE_SET = set(HERO_CORE_MODIFIER_TYPES)
+
+TALENT_BREAKPOINT_STATS = [
+    ("Damage", "attack_damage"),
+    ("Attack Speed", "attack_speed"),
+    ("Health", "health"),
+    ("Armor", "armor"),
+]
+
+TARGET_MATRIX_METRICS = [
+    ("Dmg/Hit", "target_damage_per_hit"),
+    ("DPS", "target_dps"),
+    ("Hits", "target_attacks_to_kill"),
+    ("TTK", "target_time_to_kill"),
+]
 
 TABLE_COLUMNS = [
     ("row_label", "Row", 80, "center"),
@@ -156,8 +153,9 @@ def _load_json_file(path, default_payload):
         return default_payload
 
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        with profile_phase("json", f"load {os.path.basename(path)}"):
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
     except (OSError, json.JSONDecodeError):
         return default_payload
 
@@ -168,11 +166,6 @@ def _load_json_file(path, default_payload):
     return default_payload
 
 
-def _write_json_file(path, payload):
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=True)
-
-
 def _to_float(value, default=0.0):
     if isinstance(value, (int, float)):
         return float(value)
@@ -187,6 +180,11 @@ def _to_float(value, default=0.0):
         return default
 
 
+def _write_json_file(path, payload):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=True)
+
+
 def _format_number(value):
     if value is None:
         return ""
@@ -219,17 +217,6 @@ def _format_table_metric(value):
     return _format_number(numeric)
 
 
-def _normalize_choice(value, choices):
-    text = str(value or "").strip()
-    if not text:
-        return ""
-    return next((choice for choice in choices if choice.lower() == text.lower()), "")
-
-
-def _split_tokens(text):
-    return [token.strip() for token in re.split(r"[,;\n|]+", str(text or "")) if token.strip()]
-
-
 def _normalize_match_text(text):
     lowered = str(text or "").lower()
     cleaned = re.sub(r"[^a-z0-9]+", " ", lowered)
@@ -240,48 +227,6 @@ def _normalize_compact_text(text):
     return re.sub(r"[^a-z0-9]+", "", str(text or "").lower())
 
 
-def _empty_modifiers():
-    return {
-        "strength": 0.0,
-        "agility": 0.0,
-        "intelligence": 0.0,
-        "health_flat": 0.0,
-        "health_pct": 0.0,
-        "health_regen_flat": 0.0,
-        "mana_flat": 0.0,
-        "mana_pct": 0.0,
-        "mana_regen_flat": 0.0,
-        "armor_flat": 0.0,
-        "magic_resist_flat": 0.0,
-        "attack_damage_flat": 0.0,
-        "attack_speed_flat": 0.0,
-        "attack_speed_pct": 0.0,
-        "move_speed_flat": 0.0,
-        "move_speed_pct": 0.0,
-        "attack_range_flat": 0.0,
-        "projectile_speed_flat": 0.0,
-        "max_hp_regen_pct": 0.0,
-        "bat_reduction_pct": 0.0,
-    }
-
-
-def _merge_modifiers(target, source):
-    for key in target:
-        target[key] += source.get(key, 0.0)
-
-
-def _first_numeric_value(value_text):
-    text = str(value_text or "").strip()
-    if not text:
-        return None, False
-
-    is_percent = "%" in text
-    match = re.search(r"[+-]?\d+(?:\.\d+)?", text)
-    if not match:
-        return None, is_percent
-    return float(match.group(0)), is_percent
-
-
 def _normalize_visible_columns(value):
     if not isinstance(value, list):
         return list(DEFAULT_VISIBLE_COLUMNS)
@@ -297,19 +242,66 @@ def _normalize_visible_columns(value):
     return visible_columns or list(DEFAULT_VISIBLE_COLUMNS)
 
 
-def _timestamp():
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def _number_column(key):
+    return lambda computed, _hero_data: _format_number(computed[key])
+
+
+def _target_metric_column(key):
+    return lambda computed, _hero_data: _format_table_metric(computed[key])
+
+
+# Lazy table columns: each formats one value from the computed stats, so a
+# refresh only pays for the columns it shows. Target metric columns also
+# need compute_target_metrics; row_label, hero and level are always built.
+TABLE_COLUMN_FORMATTERS = {
+    "networth": _number_column("networth"),
+    "primary_attribute": lambda computed, _hero_data: ATTRIBUTE_DISPLAY.get(computed["primary_attribute"], "?"),
+    "attack_type": lambda _computed, hero_data: str(hero_data.get("attackType", "")),
+    "roles": lambda _computed, hero_data: ", ".join(
+        str(role) for role in hero_data.get("roles", []) if isinstance(role, str)
+    ),
+    "strength": _number_column("strength"),
+    "strength_gain": _number_column("strength_gain"),
+    "agility": _number_column("agility"),
+    "agility_gain": _number_column("agility_gain"),
+    "intelligence": _number_column("intelligence"),
+    "intelligence_gain": _number_column("intelligence_gain"),
+    "health": _number_column("health"),
+    "health_regen": _number_column("health_regen"),
+    "mana": _number_column("mana"),
+    "mana_regen": _number_column("mana_regen"),
+    "armor": _number_column("armor"),
+    "magic_resist": lambda computed, _hero_data: _format_percent_points(computed["magic_resist"]),
+    "attack_damage": _number_column("attack_damage"),
+    "damage_min": _number_column("damage_min"),
+    "damage_max": _number_column("damage_max"),
+    "attack_speed": _number_column("attack_speed"),
+    "target_damage_per_hit": _target_metric_column("target_damage_per_hit"),
+    "target_dps": _target_metric_column("target_dps"),
+    "target_attacks_to_kill": _target_metric_column("target_attacks_to_kill"),
+    "target_time_to_kill": _target_metric_column("target_time_to_kill"),
+    "move_speed": _number_column("move_speed"),
+    "attack_range": _number_column("attack_range"),
+    "projectile_speed": _number_column("projectile_speed"),
+    "bat": _number_column("bat"),
+    "animation_point": _number_column("animation_point"),
+    "animation_backswing": _number_column("animation_backswing"),
+    "turn_rate": _number_column("turn_rate"),
+    "collision_size": _number_column("collision_size"),
+    "vision_day": _number_column("vision_day"),
+    "vision_night": _number_column("vision_night"),
+    "talents": lambda computed, _hero_data: computed["talents_display"],
+    "items": lambda computed, _hero_data: computed["items_display"],
+}
+ALWAYS_BUILT_COLUMN_IDS = ("row_label", "hero", "level")
 
 
-def _as_bool(value, default=False):
-    if isinstance(value, bool):
-        return value
-    lowered = str(value or "").strip().lower()
-    if lowered in {"1", "true", "yes", "on"}:
-        return True
-    if lowered in {"0", "false", "no", "off", ""}:
-        return False
-    return default
+def _split_tokens(text):
+    return [token.strip() for token in re.split(r"[,;\n|]+", str(text or "")) if token.strip()]
+
+
+def _timestamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
 class HeroCoreTableApp:
@@ -320,42 +312,37 @@ class HeroCoreTableApp:
         self.settings_path = os.path.join(self.base_dir, SETTINGS_FILENAME)
         self.targets_path = os.path.join(self.base_dir, TARGETS_FILENAME)
 
-        self.dataset_payload = _load_json_file(self.dataset_path, {"heroesCore": {}, "items": {}})
+        self.dataset_service = get_dataset_service()
+        self.dataset_payload = self.dataset_service.load(self.dataset_path, {"heroesCore": {}, "items": {}})
         self.settings_payload = self._load_settings()
         self.heroes = self._load_heroes()
         self.items = self._load_items()
-        self.hero_names = sorted(self.heroes.keys())
-        self.item_names = [""] + sorted(self.items.keys())
+        self.engine = HeroCoreEngine(self.heroes, self.items)
+        self.target_matrix_cache = TargetMatrixCache(self.engine)
+        self.recomputer = BackgroundRecomputer(self.engine)
+        self.talent_breakpoints = TalentBreakpointCache(self.engine)
+        self.hero_names = self.engine.hero_names
+        self.item_names = self.engine.item_names
         self.item_shop_names = sorted(self.items.keys())
+        self.item_shop_order = {item_name: index for index, item_name in enumerate(self.item_shop_names)}
         self.saved_targets_data = self._load_saved_targets_data()
-        self.item_name_search_index = {
-            item_name: self._build_item_name_search_text(item_name)
-            for item_name in self.items.keys()
-        }
-        self.item_detail_search_index = {
-            item_name: self._build_item_detail_search_text(item_data)
-            for item_name, item_data in self.items.items()
-        }
+        self.item_name_search_index = NgramSearchIndex()
+        self.item_detail_search_index = NgramSearchIndex()
+        for item_name, item_data in self.items.items():
+            self.item_name_search_index.set_document(item_name, self._build_item_name_search_text(item_name))
+            self.item_detail_search_index.set_document(item_name, self._build_item_detail_search_text(item_data))
         self.hero_rows = {}
         self.row_sequence = 0
-        self.item_modifier_cache = {}
+        self.row_search_index = NgramSearchIndex()
+        self.hero_search_text_cache = {}
 
-        self.hero_match_names = {
-            hero_name: _normalize_match_text(hero_name)
-            for hero_name in self.hero_names
-        }
-        self.hero_match_lookup = {
-            normalized_name: hero_name
-            for hero_name, normalized_name in self.hero_match_names.items()
-            if normalized_name
-        }
-        self.hero_compact_lookup = {
-            _normalize_compact_text(hero_name): hero_name
-            for hero_name in self.hero_names
-            if _normalize_compact_text(hero_name)
-        }
-        self.hero_match_choices = list(self.hero_match_lookup.keys())
-        self.hero_compact_choices = list(self.hero_compact_lookup.keys())
+        hero_match_index = self.dataset_service.hero_match_index(self.dataset_path, self.hero_names)
+        if hero_match_index is None:
+            hero_match_index = build_hero_match_index(self.hero_names)
+        self.hero_match_names = hero_match_index["match_names"]
+        self.hero_match_lookup = hero_match_index["match_lookup"]
+        self.hero_compact_lookup = hero_match_index["compact_lookup"]
+        self.hero_name_matcher = hero_match_index["matcher"]
 
         self.current_selected_row_id = None
         self.loading_editor = False
@@ -383,6 +370,11 @@ class HeroCoreTableApp:
         self.active_saved_target_choice_var = tk.StringVar(value="")
         self.target_editor_saved_target_choice_var = tk.StringVar(value="")
         self.active_target_status_var = tk.StringVar(value="")
+        self.target_matrix_metric_var = tk.StringVar(value=TARGET_MATRIX_METRICS[-1][0])
+        self.target_matrix_status_var = tk.StringVar(value="")
+        self.item_ranking_metric_var = tk.StringVar(value=ITEM_RANKING_METRICS[0])
+        self.item_ranking_levels_var = tk.StringVar(value="")
+        self.item_ranking_status_var = tk.StringVar(value="")
         self.saved_target_editor_name_var = tk.StringVar(value="")
         self.saved_target_editor_hero_var = tk.StringVar(value="")
         self.saved_target_editor_level_var = tk.StringVar(value="1")
@@ -418,6 +410,7 @@ class HeroCoreTableApp:
             for tier in TALENT_TIERS
         }
         self.selected_applied_summary_var = tk.StringVar(value="")
+        self.talent_breakpoint_var = tk.StringVar(value="")
         self.shop_status_var = tk.StringVar(value="")
         self.shop_name_search_var = tk.StringVar(value="")
         self.shop_detail_search_var = tk.StringVar(value="")
@@ -434,11 +427,18 @@ class HeroCoreTableApp:
         self.duplicate_row_button = None
         self.remove_row_button = None
         self.shop_window = None
-        self.shop_canvas = None
-        self.shop_canvas_window_id = None
         self.shop_grid_frame = None
+        self.shop_scrollbar = None
+        self.shop_cell_buttons = []
+        self.shop_visible_items = []
+        self.shop_first_row = 0
         self.active_item_slot_index = None
         self.active_shop_owner = None
+        self.target_matrix_window = None
+        self.target_matrix_tree = None
+        self.recompute_progress = None
+        self.item_ranking_window = None
+        self.item_ranking_tree = None
         self.tree = None
         self.column_picker_button = None
         self.column_picker_frame = None
@@ -475,6 +475,11 @@ class HeroCoreTableApp:
             self._ensure_target_metric_columns_visible()
         self._bind_editor_vars()
         self._refresh_table()
+        self.parent.after_idle(self._start_talent_breakpoint_warming)
+
+    def _start_talent_breakpoint_warming(self):
+        row_heroes = [row_entry["hero_name"] for row_entry in self.hero_rows.values()]
+        self.talent_breakpoints.start_warming(dict.fromkeys(row_heroes + list(self.hero_names)))
 
     def _load_settings(self):
         payload = _load_json_file(
@@ -499,119 +504,9 @@ class HeroCoreTableApp:
         self.settings_payload = payload
         _write_json_file(self.settings_path, payload)
 
-    def _parse_target_items_display(self, items_display):
-        items = []
-        for token in _split_tokens(items_display):
-            item_name = str(token or "").strip()
-            if not item_name or item_name == "-":
-                continue
-            items.append(item_name)
-        return items
-
-    def _parse_target_talent_codes(self, talents_display):
-        talents = {tier: "none" for tier in TALENT_TIERS}
-        for token in _split_tokens(talents_display):
-            match = re.match(r"^(10|15|20|25)\s*([lLrR])$", str(token or "").strip())
-            if not match:
-                continue
-            talents[match.group(1)] = "left" if match.group(2).lower() == "l" else "right"
-        return talents
-
-    def _build_saved_target_state_from_record(self, record):
-        state_source = record.get("state")
-        if isinstance(state_source, dict):
-            return self._copy_hero_state(state_source)
-
-        items_source = record.get("items")
-        if not isinstance(items_source, list):
-            items_source = self._parse_target_items_display(record.get("items_display"))
-
-        talents_source = record.get("talents")
-        if not isinstance(talents_source, dict):
-            talents_source = self._parse_target_talent_codes(record.get("talents_display"))
-
-        return self._copy_hero_state(
-            {
-                "level": record.get("level", 1),
-                "items": items_source,
-                "talents": talents_source,
-            }
-        )
-
-    def _normalize_target_spell_payload(self, spell_data):
-        if not isinstance(spell_data, dict):
-            return None
-
-        damage_type = str(
-            spell_data.get("damage_type")
-            or spell_data.get("type")
-            or TARGET_SPELL_DAMAGE_TYPES[0]
-        ).strip().title()
-        if damage_type == "Magic":
-            damage_type = "Magical"
-        if damage_type not in TARGET_SPELL_DAMAGE_TYPES:
-            damage_type = TARGET_SPELL_DAMAGE_TYPES[0]
-
-        return {
-            "label": str(spell_data.get("label") or spell_data.get("name") or "").strip(),
-            "damage": str(spell_data.get("damage") or spell_data.get("value") or "").strip(),
-            "damage_type": damage_type,
-            "enabled": _as_bool(spell_data.get("enabled"), default=True),
-        }
-
-    def _copy_target_spell_payloads(self, spells):
-        if not isinstance(spells, list):
-            return []
-
-        normalized_spells = []
-        for spell_data in spells:
-            normalized_spell = self._normalize_target_spell_payload(spell_data)
-            if normalized_spell:
-                normalized_spells.append(normalized_spell)
-        return normalized_spells
-
-    def _normalize_saved_target_record(self, record):
-        if not isinstance(record, dict):
-            return None
-
-        hero_name = _normalize_choice(record.get("hero_name"), self.hero_names)
-        if not hero_name:
-            return None
-
-        state = self._build_saved_target_state_from_record(record)
-
-        return {
-            "id": str(record.get("id") or uuid.uuid4().hex),
-            "name": str(record.get("name") or "Saved Target").strip() or "Saved Target",
-            "hero_name": hero_name,
-            "state": state,
-            "incoming_spells": self._copy_target_spell_payloads(
-                record.get("incoming_spells")
-                if isinstance(record.get("incoming_spells"), list)
-                else record.get("spells")
-            ),
-            "source_row_label": str(record.get("source_row_label") or record.get("row_label") or "").strip(),
-            "saved_at": str(record.get("saved_at") or _timestamp()).strip() or _timestamp(),
-        }
-
     def _load_saved_targets_data(self):
         payload = _load_json_file(self.targets_path, {"targets": []})
-        source_targets = payload.get("targets", [])
-        if not isinstance(source_targets, list):
-            source_targets = []
-
-        normalized_targets = []
-        seen_ids = set()
-        for record in source_targets:
-            normalized = self._normalize_saved_target_record(record)
-            if not normalized:
-                continue
-            if normalized["id"] in seen_ids:
-                normalized["id"] = uuid.uuid4().hex
-            seen_ids.add(normalized["id"])
-            normalized_targets.append(normalized)
-
-        normalized_payload = {"targets": normalized_targets}
+        normalized_payload = {"targets": self.engine.normalize_saved_target_records(payload.get("targets", []))}
         if normalized_payload != payload:
             _write_json_file(self.targets_path, normalized_payload)
         return normalized_payload
@@ -630,6 +525,7 @@ class HeroCoreTableApp:
 
         if self.tree is not None:
             self.tree.configure(displaycolumns=tuple(self.visible_column_ids))
+            self._fill_visible_column_values()
 
         visible_set = set(self.visible_column_ids)
         for column_id, variable in self.column_visibility_vars.items():
@@ -654,6 +550,16 @@ class HeroCoreTableApp:
             status_text = f"{note} {status_text}"
         self.column_status_var.set(status_text)
 
+    def _fill_visible_column_values(self):
+        for row_id, row in self.table_rows_by_id.items():
+            if all(column_id in row for column_id in self.visible_column_ids):
+                continue
+            for column_id in self.visible_column_ids:
+                self._table_row_value(row, column_id)
+            if self.tree.exists(row_id):
+                values = [row.get(column_id, "") for column_id, _label, _width, _anchor in TABLE_COLUMNS]
+                self.tree.item(row_id, values=values)
+
     def _toggle_column_visibility(self, column_id):
         variable = self.column_visibility_vars.get(column_id)
         if variable is None:
@@ -746,104 +652,8 @@ class HeroCoreTableApp:
             return None
         return next((target for target in self.saved_targets if target.get("id") == target_key), None)
 
-    def _evaluate_target_spell(self, spell_payload, target_snapshot):
-        normalized_spell = self._normalize_target_spell_payload(spell_payload)
-        if not normalized_spell or not normalized_spell.get("enabled", True):
-            return None
-
-        raw_damage = safe_eval(normalized_spell.get("damage", ""), None)
-        if raw_damage is None:
-            return {
-                "label": normalized_spell["label"],
-                "damage": normalized_spell["damage"],
-                "damage_type": normalized_spell["damage_type"],
-                "raw_damage": None,
-                "effective_damage": None,
-            }
-
-        raw_damage = float(raw_damage)
-        damage_type = normalized_spell["damage_type"]
-        if damage_type == "Physical":
-            effective_damage = apply_physical_reduction(raw_damage, _to_float(target_snapshot.get("armor"), default=0.0))
-        elif damage_type == "Magical":
-            effective_damage = apply_magic_resistance(
-                raw_damage,
-                _to_float(target_snapshot.get("magic_resist"), default=0.0) / 100.0,
-            )
-        else:
-            effective_damage = raw_damage
-
-        return {
-            "label": normalized_spell["label"],
-            "damage": normalized_spell["damage"],
-            "damage_type": damage_type,
-            "raw_damage": raw_damage,
-            "effective_damage": effective_damage,
-        }
-
-    def _evaluate_target_spells(self, spell_payloads, target_snapshot):
-        entries = []
-        total_raw_damage = 0.0
-        total_effective_damage = 0.0
-
-        for spell_payload in spell_payloads or []:
-            entry = self._evaluate_target_spell(spell_payload, target_snapshot)
-            if not entry:
-                continue
-            entries.append(entry)
-            if entry["raw_damage"] is not None:
-                total_raw_damage += entry["raw_damage"]
-            if entry["effective_damage"] is not None:
-                total_effective_damage += entry["effective_damage"]
-
-        return {
-            "incoming_spell_entries": entries,
-            "incoming_spell_count": len(entries),
-            "incoming_spell_raw_damage": total_raw_damage,
-            "incoming_spell_effective_damage": total_effective_damage,
-        }
-
-    def _build_target_snapshot_from_template(self, target_record, source_type):
-        if not isinstance(target_record, dict):
-            return None
-
-        hero_name = _normalize_choice(target_record.get("hero_name"), self.hero_names)
-        if not hero_name or hero_name not in self.heroes:
-            return None
-
-        state = self._copy_hero_state(target_record.get("state"))
-        incoming_spells = self._copy_target_spell_payloads(target_record.get("incoming_spells"))
-        hero_data = self.heroes.get(hero_name, {})
-        computed = self._compute_hero_stats(hero_name, hero_data, state)
-
-        snapshot = {
-            "id": str(target_record.get("id") or ""),
-            "name": str(target_record.get("name") or "Saved Target").strip() or "Saved Target",
-            "hero_name": hero_name,
-            "row_label": str(target_record.get("source_row_label") or "").strip(),
-            "level": state["level"],
-            "health": computed["health"],
-            "health_regen": computed["health_regen"],
-            "armor": computed["armor"],
-            "magic_resist": computed["magic_resist"],
-            "evasion": 0.0,
-            "items_display": computed["items_display"],
-            "talents_display": computed["talents_display"],
-            "state": state,
-            "incoming_spells": incoming_spells,
-            "saved_at": str(target_record.get("saved_at") or "").strip(),
-            "_source_type": source_type,
-        }
-        spell_totals = self._evaluate_target_spells(incoming_spells, snapshot)
-        snapshot.update(spell_totals)
-        snapshot["remaining_health_after_spells"] = max(
-            0.0,
-            snapshot["health"] - snapshot["incoming_spell_effective_damage"],
-        )
-        return snapshot
-
     def _saved_target_choice_label(self, target):
-        snapshot = self._build_target_snapshot_from_template(target, source_type="saved")
+        snapshot = self.engine.build_target_snapshot_from_template(target, source_type="saved")
         if not snapshot:
             return str(target.get("name") or "Saved Target")
         return (
@@ -866,7 +676,7 @@ class HeroCoreTableApp:
         if not row_entry:
             return None
 
-        return self._build_target_snapshot_from_template(
+        return self.engine.build_target_snapshot_from_template(
             {
                 "id": "",
                 "name": self._default_target_name_for_row(row_id),
@@ -889,7 +699,7 @@ class HeroCoreTableApp:
         if self.active_saved_target_id:
             saved_target = self._get_saved_target_by_id(self.active_saved_target_id)
             if saved_target:
-                return self._build_target_snapshot_from_template(saved_target, source_type="saved")
+                return self.engine.build_target_snapshot_from_template(saved_target, source_type="saved")
             self.active_saved_target_id = ""
             self._save_settings()
 
@@ -1027,7 +837,7 @@ class HeroCoreTableApp:
             return
 
         target_name = str(self.target_name_var.get() or "").strip() or self._default_target_name_for_row(self.current_selected_row_id)
-        record = self._normalize_saved_target_record(
+        record = self.engine.normalize_saved_target_record(
             {
                 "id": uuid.uuid4().hex,
                 "name": target_name,
@@ -1108,8 +918,8 @@ class HeroCoreTableApp:
             self._clear_saved_target_editor()
             return
 
-        state = self._copy_hero_state(target.get("state"))
-        snapshot = self._build_target_snapshot_from_template(target, source_type="saved")
+        state = self.engine.copy_hero_state(target.get("state"))
+        snapshot = self.engine.build_target_snapshot_from_template(target, source_type="saved")
 
         self.saved_target_editor_name_var.set(str(target.get("name") or ""))
         self.saved_target_editor_hero_var.set(str(target.get("hero_name") or ""))
@@ -1138,7 +948,7 @@ class HeroCoreTableApp:
         saved_at = str(target.get("saved_at") or "-")
         items_text = snapshot["items_display"] if snapshot else "-"
         talents_text = snapshot["talents_display"] if snapshot else "-"
-        modifiers_text = self._modifier_payloads_summary_text(state.get("modifiers", []))
+        modifiers_text = self.engine.modifier_payloads_summary_text(state.get("modifiers", []))
         spell_text = (
             f"{_format_number(snapshot['incoming_spell_raw_damage'])} raw -> "
             f"{_format_number(snapshot['incoming_spell_effective_damage'])} effective"
@@ -1214,7 +1024,9 @@ class HeroCoreTableApp:
         if not row_entry:
             return
 
-        row_entry["state"]["modifiers"] = self._serialize_modifier_widgets(self.selected_modifiers)
+        row_entry["state"] = self.engine.freeze_hero_state(
+            dict(row_entry["state"], modifiers=self._serialize_modifier_widgets(self.selected_modifiers))
+        )
         self._refresh_selected_hero_summary(self.current_selected_row_id)
         row_ids_to_refresh = (
             list(self.table_rows_by_id.keys())
@@ -1265,7 +1077,7 @@ class HeroCoreTableApp:
             return
 
         name = str(self.saved_target_editor_name_var.get() or "").strip() or target["name"]
-        hero_name = _normalize_choice(self.saved_target_editor_hero_var.get(), self.hero_names)
+        hero_name = self.engine.normalize_hero_name(self.saved_target_editor_hero_var.get())
         if not hero_name:
             self._update_target_status(note="Choose a valid target hero.")
             return
@@ -1303,7 +1115,7 @@ class HeroCoreTableApp:
             self._update_target_status(note="Couldn't read the selected row.")
             return
 
-        state = self._copy_hero_state(row_entry["state"])
+        state = self.engine.copy_hero_state(row_entry["state"])
         self.saved_target_editor_name_var.set(
             str(self.saved_target_editor_name_var.get() or "").strip() or target["name"]
         )
@@ -1333,7 +1145,7 @@ class HeroCoreTableApp:
         row_snapshot = self._current_saved_target_editor_snapshot()
         items_text = row_snapshot["items_display"] if row_snapshot else "-"
         talents_text = row_snapshot["talents_display"] if row_snapshot else "-"
-        modifiers_text = self._modifier_payloads_summary_text(state.get("modifiers", []))
+        modifiers_text = self.engine.modifier_payloads_summary_text(state.get("modifiers", []))
         spell_text = (
             f"{_format_number(row_snapshot['incoming_spell_raw_damage'])} raw -> "
             f"{_format_number(row_snapshot['incoming_spell_effective_damage'])} effective"
@@ -1547,6 +1359,11 @@ class HeroCoreTableApp:
             command=self._delete_active_saved_target,
         )
         self.delete_saved_target_button.grid(row=4, column=4, columnspan=2, sticky="w", padx=(6, 0), pady=(10, 0))
+        ttk.Button(
+            controls,
+            text="Target Matrix",
+            command=self._open_target_matrix_window,
+        ).grid(row=4, column=6, sticky="w", padx=(6, 0), pady=(10, 0))
         ttk.Label(
             controls,
             textvariable=self.active_target_status_var,
@@ -1559,7 +1376,10 @@ class HeroCoreTableApp:
         controls.columnconfigure(2, weight=1)
         controls.columnconfigure(3, weight=2)
 
-        ttk.Label(container, textvariable=self.summary_var, foreground="#666").pack(anchor="w", pady=(0, 10))
+        summary_row = ttk.Frame(container)
+        summary_row.pack(fill="x", pady=(0, 10))
+        ttk.Label(summary_row, textvariable=self.summary_var, foreground="#666").pack(side="left", anchor="w")
+        self.recompute_progress = ttk.Progressbar(summary_row, mode="determinate", length=180)
 
         body = ttk.Panedwindow(container, orient="horizontal")
         body.pack(fill="both", expand=True)
@@ -1655,6 +1475,7 @@ class HeroCoreTableApp:
             state="disabled",
         )
         self.remove_row_button.pack(side="left")
+        ttk.Button(row_actions, text="Rank Items", command=self._open_item_ranking_window).pack(side="left", padx=(6, 0))
 
         items_frame = ttk.LabelFrame(editor_card, text="Items")
         items_frame.pack(fill="x", padx=10, pady=(0, 10))
@@ -1700,6 +1521,13 @@ class HeroCoreTableApp:
             meta_label.grid(row=row, column=2, sticky="w", pady=6)
             self.talent_meta_labels[tier] = meta_label
 
+        ttk.Label(
+            talents_frame,
+            textvariable=self.talent_breakpoint_var,
+            wraplength=520,
+            foreground="#666",
+            justify="left",
+        ).grid(row=len(TALENT_TIERS), column=0, columnspan=3, sticky="w", padx=8, pady=(4, 8))
         talents_frame.columnconfigure(2, weight=1)
 
         selected_modifiers_frame = ttk.LabelFrame(editor_card, text="Modifiers")
@@ -2063,55 +1891,73 @@ class HeroCoreTableApp:
         return f"Item Shop - {hero_name} ({row_label}) Slot {self.active_item_slot_index + 1}"
 
     def _filtered_shop_item_names(self):
-        name_query = _normalize_match_text(self.shop_name_search_var.get())
-        detail_query = _normalize_match_text(self.shop_detail_search_var.get())
-
-        visible_items = []
-        for item_name in self.item_shop_names:
-            if name_query and name_query not in self.item_name_search_index.get(item_name, ""):
-                continue
-            if detail_query and detail_query not in self.item_detail_search_index.get(item_name, ""):
-                continue
-            visible_items.append(item_name)
-
-        return visible_items
+        name_matches = self.item_name_search_index.search(_normalize_match_text(self.shop_name_search_var.get()))
+        detail_matches = self.item_detail_search_index.search(_normalize_match_text(self.shop_detail_search_var.get()))
+
+        if name_matches is None and detail_matches is None:
+            return list(self.item_shop_names)
+        if name_matches is None:
+            matches = detail_matches
+        elif detail_matches is None:
+            matches = name_matches
+        else:
+            matches = name_matches & detail_matches
+        return sorted(matches, key=self.item_shop_order.__getitem__)
 
     def _render_shop_items(self):
-        if not self.shop_grid_frame:
+        if not self.shop_cell_buttons:
             return
 
-        for child in self.shop_grid_frame.winfo_children():
-            child.destroy()
-
-        visible_items = self._filtered_shop_item_names()
-        if not visible_items:
+        self.shop_visible_items = self._filtered_shop_item_names()
+        self.shop_first_row = 0
+        if self.shop_visible_items:
+            self.shop_empty_var.set("")
+        else:
             self.shop_empty_var.set("No items match the current item-name and stat/effect filters.")
-            self.shop_grid_frame.columnconfigure(0, weight=1)
-            ttk.Label(
-                self.shop_grid_frame,
-                textvariable=self.shop_empty_var,
-                foreground="#666",
-                wraplength=620,
-                justify="left",
-            ).grid(row=0, column=0, sticky="w", padx=8, pady=8)
+        self._draw_shop_cells()
+
+    def _shop_max_first_row(self):
+        total_rows = -(-len(self.shop_visible_items) // SHOP_GRID_COLUMNS)
+        return max(0, total_rows - SHOP_VISIBLE_ROWS)
+
+    def _draw_shop_cells(self):
+        start_index = self.shop_first_row * SHOP_GRID_COLUMNS
+        for cell_index, button in enumerate(self.shop_cell_buttons):
+            item_index = start_index + cell_index
+            if item_index < len(self.shop_visible_items):
+                button.configure(text=self.shop_visible_items[item_index])
+                button.grid()
+            else:
+                button.grid_remove()
+
+        if self.shop_scrollbar is not None:
+            total_rows = max(1, -(-len(self.shop_visible_items) // SHOP_GRID_COLUMNS))
+            first = self.shop_first_row / total_rows
+            last = min(1.0, (self.shop_first_row + SHOP_VISIBLE_ROWS) / total_rows)
+            self.shop_scrollbar.set(first, last)
+
+    def _scroll_shop_grid(self, action, amount, unit=None):
+        if action == "moveto":
+            first_row = round(float(amount) * -(-len(self.shop_visible_items) // SHOP_GRID_COLUMNS))
         else:
-            self.shop_empty_var.set("")
-            for column in range(4):
-                self.shop_grid_frame.columnconfigure(column, weight=1)
-
-            for index, item_name in enumerate(visible_items):
-                row = index // 4
-                column = index % 4
-                ttk.Button(
-                    self.shop_grid_frame,
-                    text=item_name,
-                    command=lambda selected_item=item_name: self._choose_shop_item(selected_item),
-                    width=20,
-                ).grid(row=row, column=column, sticky="ew", padx=4, pady=4)
-
-        self._sync_shop_scroll_region()
-        if self.shop_canvas:
-            self.shop_canvas.yview_moveto(0)
+            step = SHOP_VISIBLE_ROWS - 1 if unit == "pages" else 1
+            first_row = self.shop_first_row + int(amount) * step
+        first_row = max(0, min(self._shop_max_first_row(), first_row))
+        if first_row != self.shop_first_row:
+            self.shop_first_row = first_row
+            self._draw_shop_cells()
+
+    def _handle_shop_mousewheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_shop_grid("scroll", -1, "units")
+        else:
+            self._scroll_shop_grid("scroll", 1, "units")
+        return "break"
+
+    def _choose_shop_cell(self, cell_index):
+        item_index = self.shop_first_row * SHOP_GRID_COLUMNS + cell_index
+        if item_index < len(self.shop_visible_items):
+            self._choose_shop_item(self.shop_visible_items[item_index])
 
     def _handle_shop_search_change(self, *_args):
         self._render_shop_items()
@@ -2171,11 +2017,6 @@ class HeroCoreTableApp:
         y = max(root.winfo_rooty() + 20, min(y, max_y))
         self.shop_window.geometry(f"{width}x{height}+{x}+{y}")
 
-    def _sync_shop_scroll_region(self):
-        if not self.shop_canvas or not self.shop_grid_frame:
-            return
-        self.shop_canvas.configure(scrollregion=self.shop_canvas.bbox("all"))
-
     def _match_focus_to_shop_window(self):
         if not self.shop_window or not self.shop_window.winfo_exists():
             return
@@ -2205,9 +2046,11 @@ class HeroCoreTableApp:
             self.shop_window.destroy()
 
         self.shop_window = None
-        self.shop_canvas = None
-        self.shop_canvas_window_id = None
         self.shop_grid_frame = None
+        self.shop_scrollbar = None
+        self.shop_cell_buttons = []
+        self.shop_visible_items = []
+        self.shop_first_row = 0
         self.active_item_slot_index = None
         self.active_shop_owner = None
         self.shop_name_search_var.set("")
@@ -2298,23 +2141,45 @@ class HeroCoreTableApp:
         actions.pack(fill="x", pady=(0, 8))
         ttk.Button(actions, text="Clear Active Slot", command=self._clear_active_shop_slot).pack(side="left")
 
+        ttk.Label(
+            shell,
+            textvariable=self.shop_empty_var,
+            foreground="#666",
+            wraplength=620,
+            justify="left",
+        ).pack(anchor="w")
+
         shop_body = ttk.Frame(shell)
         shop_body.pack(fill="both", expand=True)
 
-        self.shop_canvas = tk.Canvas(shop_body, highlightthickness=0)
-        shop_scrollbar = ttk.Scrollbar(shop_body, orient="vertical", command=self.shop_canvas.yview)
-        self.shop_canvas.configure(yscrollcommand=shop_scrollbar.set)
+        self.shop_scrollbar = ttk.Scrollbar(shop_body, orient="vertical", command=self._scroll_shop_grid)
+        self.shop_scrollbar.pack(side="right", fill="y")
+        self.shop_grid_frame = ttk.Frame(shop_body)
+        self.shop_grid_frame.pack(side="left", fill="both", expand=True)
+        for column in range(SHOP_GRID_COLUMNS):
+            self.shop_grid_frame.columnconfigure(column, weight=1)
 
-        self.shop_canvas.pack(side="left", fill="both", expand=True)
-        shop_scrollbar.pack(side="right", fill="y")
+        # Fixed pool of cells; scrolling and filtering only relabel them.
+        self.shop_cell_buttons = []
+        for cell_index in range(SHOP_GRID_COLUMNS * SHOP_VISIBLE_ROWS):
+            button = ttk.Button(
+                self.shop_grid_frame,
+                command=lambda selected_cell=cell_index: self._choose_shop_cell(selected_cell),
+                width=20,
+            )
+            button.grid(
+                row=cell_index // SHOP_GRID_COLUMNS,
+                column=cell_index % SHOP_GRID_COLUMNS,
+                sticky="ew",
+                padx=4,
+                pady=4,
+            )
+            self.shop_cell_buttons.append(button)
 
-        self.shop_grid_frame = ttk.Frame(self.shop_canvas)
-        self.shop_canvas_window_id = self.shop_canvas.create_window((0, 0), window=self.shop_grid_frame, anchor="nw")
-        self.shop_grid_frame.bind("<Configure>", lambda _event: self._sync_shop_scroll_region())
-        self.shop_canvas.bind(
-            "<Configure>",
-            lambda event: self.shop_canvas.itemconfigure(self.shop_canvas_window_id, width=event.width),
-        )
+        for widget in [self.shop_grid_frame, *self.shop_cell_buttons]:
+            widget.bind("<MouseWheel>", self._handle_shop_mousewheel)
+            widget.bind("<Button-4>", self._handle_shop_mousewheel)
+            widget.bind("<Button-5>", self._handle_shop_mousewheel)
 
         self._render_shop_items()
 
@@ -2322,78 +2187,254 @@ class HeroCoreTableApp:
         self.shop_window.lift()
         name_search_entry.focus_set()
 
-    def _default_hero_state(self):
-        return {
-            "level": 1,
-            "items": ["" for _ in range(INVENTORY_SLOTS)],
-            "talents": {tier: "none" for tier in TALENT_TIERS},
-            "modifiers": [],
-        }
+    def compute_target_matrix(self, row_ids=None, processes=None, progress=None):
+        """
+        Evaluate hero rows against every saved target.
+
+        Defaults to the rows currently shown in the table, in table order.
+        Cells are cached per row state and target, so only rows or targets
+        edited since the last call are recomputed.
+        """
+        if row_ids is None:
+            row_ids = list(self.table_rows_by_id.keys())
+        rows = [
+            (row_id, self.hero_rows[row_id]["hero_name"], self.hero_rows[row_id]["state"])
+            for row_id in row_ids
+            if row_id in self.hero_rows
+        ]
+        return self.target_matrix_cache.compute(rows, self.saved_targets, processes=processes, progress=progress)
 
-    def _normalize_modifier_payload(self, modifier_data):
-        if not isinstance(modifier_data, dict):
-            return None
+    def _open_target_matrix_window(self):
+        if self.target_matrix_window and self.target_matrix_window.winfo_exists():
+            self.target_matrix_window.deiconify()
+            self.target_matrix_window.lift()
+            self._refresh_target_matrix_window()
+            return
 
-        type_name = str(modifier_data.get("type") or "").strip()
-        if type_name not in HERO_CORE_MODIFIER_TYPE_SET:
-            return None
+        root = self.parent.winfo_toplevel()
+        self.target_matrix_window = tk.Toplevel(root)
+        self.target_matrix_window.title("Hero x Saved Target Matrix")
+        self.target_matrix_window.transient(root)
+        self.target_matrix_window.geometry("980x560")
+        self.target_matrix_window.protocol("WM_DELETE_WINDOW", self._close_target_matrix_window)
+        self.target_matrix_window.bind("<Escape>", lambda _event: self._close_target_matrix_window())
+
+        shell = ttk.Frame(self.target_matrix_window, padding=10)
+        shell.pack(fill="both", expand=True)
 
-        values = modifier_data.get("values", {})
-        if not isinstance(values, dict):
-            values = {}
+        header = ttk.Frame(shell)
+        header.pack(fill="x", pady=(0, 8))
+        ttk.Label(header, text="Metric").pack(side="left")
+        metric_combo = ttk.Combobox(
+            header,
+            textvariable=self.target_matrix_metric_var,
+            values=[label for label, _metric_key in TARGET_MATRIX_METRICS],
+            state="readonly",
+            width=14,
+        )
+        metric_combo.pack(side="left", padx=(6, 12))
+        metric_combo.bind("<<ComboboxSelected>>", lambda _event: self._refresh_target_matrix_window())
+        ttk.Button(header, text="Refresh", command=self._refresh_target_matrix_window).pack(side="left")
+        ttk.Label(header, textvariable=self.target_matrix_status_var, foreground="#666").pack(
+            side="left",
+            padx=(12, 0),
+        )
 
-        normalized_values = {}
-        for key, value in values.items():
-            key_text = str(key or "").strip()
-            if not key_text.endswith("_var"):
-                continue
-            if isinstance(value, bool):
-                normalized_values[key_text] = value
-            else:
-                normalized_values[key_text] = str(value)
+        tree_frame = ttk.Frame(shell)
+        tree_frame.pack(fill="both", expand=True)
+        self.target_matrix_tree = ttk.Treeview(tree_frame, show="headings", selectmode="browse")
+        y_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.target_matrix_tree.yview)
+        x_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.target_matrix_tree.xview)
+        self.target_matrix_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        self.target_matrix_tree.grid(row=0, column=0, sticky="nsew")
+        y_scrollbar.grid(row=0, column=1, sticky="ns")
+        x_scrollbar.grid(row=1, column=0, sticky="ew")
+        tree_frame.columnconfigure(0, weight=1)
+        tree_frame.rowconfigure(0, weight=1)
+
+        self._refresh_target_matrix_window()
+
+    def _close_target_matrix_window(self):
+        if self.target_matrix_window and self.target_matrix_window.winfo_exists():
+            self.target_matrix_window.destroy()
+        self.target_matrix_window = None
+        self.target_matrix_tree = None
+
+    def _refresh_target_matrix_window(self):
+        if not self.target_matrix_window or not self.target_matrix_window.winfo_exists():
+            return
+        if self.target_matrix_tree is None:
+            return
+
+        def report_progress(done_rows, total_rows):
+            self.target_matrix_status_var.set(f"Computing {done_rows}/{total_rows} row(s)...")
+            self.target_matrix_window.update_idletasks()
+
+        metric_key = dict(TARGET_MATRIX_METRICS).get(self.target_matrix_metric_var.get(), MATRIX_METRIC_KEYS[-1])
+        matrix = self.compute_target_matrix(progress=report_progress)
+        target_snapshots = matrix["targets"]
+
+        column_ids = ["row", "hero", "level"] + [f"target_{index}" for index in range(len(target_snapshots))]
+        self.target_matrix_tree.configure(columns=column_ids)
+        self.target_matrix_tree.heading("row", text="Row")
+        self.target_matrix_tree.column("row", width=180, anchor="w", stretch=False)
+        self.target_matrix_tree.heading("hero", text="Hero")
+        self.target_matrix_tree.column("hero", width=150, anchor="w", stretch=False)
+        self.target_matrix_tree.heading("level", text="Lvl")
+        self.target_matrix_tree.column("level", width=50, anchor="center", stretch=False)
+        for column_id, target_snapshot in zip(column_ids[3:], target_snapshots):
+            self.target_matrix_tree.heading(column_id, text=target_snapshot["name"])
+            self.target_matrix_tree.column(column_id, width=120, anchor="e", stretch=False)
+
+        self.target_matrix_tree.delete(*self.target_matrix_tree.get_children())
+        for row_id, cells in matrix["rows"].items():
+            table_row = self.table_rows_by_id.get(row_id, {})
+            values = [table_row.get("row_label", ""), table_row.get("hero", ""), table_row.get("level", "")]
+            values.extend(_format_table_metric(cell.get(metric_key)) for cell in cells)
+            self.target_matrix_tree.insert("", "end", iid=row_id, values=values)
+
+        if target_snapshots:
+            self.target_matrix_status_var.set(
+                f"{len(matrix['rows'])} row(s) x {len(target_snapshots)} saved target(s). "
+                f"Cached cells: {len(self.target_matrix_cache.cells)}."
+            )
+        else:
+            self.target_matrix_status_var.set("No saved targets. Save a target to fill the matrix.")
 
-        return {
-            "type": type_name,
-            "values": normalized_values,
-        }
+    def _open_item_ranking_window(self):
+        if self.item_ranking_window and self.item_ranking_window.winfo_exists():
+            self.item_ranking_window.deiconify()
+            self.item_ranking_window.lift()
+            self._refresh_item_ranking()
+            return
+
+        root = self.parent.winfo_toplevel()
+        self.item_ranking_window = tk.Toplevel(root)
+        self.item_ranking_window.title("Item Value Ranking")
+        self.item_ranking_window.transient(root)
+        self.item_ranking_window.geometry("620x560")
+        self.item_ranking_window.protocol("WM_DELETE_WINDOW", self._close_item_ranking_window)
+        self.item_ranking_window.bind("<Escape>", lambda _event: self._close_item_ranking_window())
+
+        shell = ttk.Frame(self.item_ranking_window, padding=10)
+        shell.pack(fill="both", expand=True)
+
+        header = ttk.Frame(shell)
+        header.pack(fill="x", pady=(0, 6))
+        ttk.Label(header, text="Metric").pack(side="left")
+        metric_combo = ttk.Combobox(
+            header,
+            textvariable=self.item_ranking_metric_var,
+            values=ITEM_RANKING_METRICS,
+            state="readonly",
+            width=6,
+        )
+        metric_combo.pack(side="left", padx=(6, 12))
+        metric_combo.bind("<<ComboboxSelected>>", lambda _event: self._refresh_item_ranking())
+        ttk.Label(header, text="Levels").pack(side="left")
+        levels_entry = ttk.Entry(header, textvariable=self.item_ranking_levels_var, width=16)
+        levels_entry.pack(side="left", padx=(6, 12))
+        levels_entry.bind("<Return>", lambda _event: self._refresh_item_ranking())
+        ttk.Button(header, text="Rank", command=self._refresh_item_ranking).pack(side="left")
+        ttk.Label(
+            shell,
+            textvariable=self.item_ranking_status_var,
+            foreground="#666",
+            wraplength=580,
+            justify="left",
+        ).pack(anchor="w", pady=(0, 6))
 
-    def _copy_hero_state(self, state=None):
-        source = state or self._default_hero_state()
-        items = [str(item or "").strip() for item in list(source.get("items", []))[:INVENTORY_SLOTS]]
-        if len(items) < INVENTORY_SLOTS:
-            items.extend([""] * (INVENTORY_SLOTS - len(items)))
+        tree_frame = ttk.Frame(shell)
+        tree_frame.pack(fill="both", expand=True)
+        columns = (
+            ("item", "Item", 200, "w"),
+            ("cost", "Cost", 70, "e"),
+            ("gain", "Gain", 90, "e"),
+            ("gain_per_gold", "Gain / 1000g", 100, "e"),
+        )
+        self.item_ranking_tree = ttk.Treeview(
+            tree_frame,
+            columns=[column_id for column_id, _label, _width, _anchor in columns],
+            show="headings",
+            selectmode="browse",
+        )
+        for column_id, label, width, anchor in columns:
+            self.item_ranking_tree.heading(column_id, text=label)
+            self.item_ranking_tree.column(column_id, width=width, anchor=anchor, stretch=column_id == "item")
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.item_ranking_tree.yview)
+        self.item_ranking_tree.configure(yscrollcommand=scrollbar.set)
+        self.item_ranking_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
 
-        talent_source = source.get("talents", {})
-        if not isinstance(talent_source, dict):
-            talent_source = {}
+        self._refresh_item_ranking()
 
-        modifier_source = source.get("modifiers", [])
-        if not isinstance(modifier_source, list):
-            modifier_source = []
+    def _close_item_ranking_window(self):
+        if self.item_ranking_window and self.item_ranking_window.winfo_exists():
+            self.item_ranking_window.destroy()
+        self.item_ranking_window = None
+        self.item_ranking_tree = None
 
-        normalized_modifiers = []
-        for modifier_data in modifier_source:
-            normalized_modifier = self._normalize_modifier_payload(modifier_data)
-            if normalized_modifier:
-                normalized_modifiers.append(normalized_modifier)
+    def _refresh_item_ranking(self):
+        if self.item_ranking_tree is None:
+            return
+        self.item_ranking_tree.delete(*self.item_ranking_tree.get_children())
 
-        return {
-            "level": self._parse_level_value(source.get("level", 1)),
-            "items": items,
-            "talents": {
-                tier: (
-                    str(talent_source.get(tier, "none")).strip().lower()
-                    if str(talent_source.get(tier, "none")).strip().lower() in {"none", "left", "right"}
-                    else "none"
-                )
-                for tier in TALENT_TIERS
-            },
-            "modifiers": normalized_modifiers,
-        }
+        row_id = self.current_selected_row_id
+        if row_id not in self.hero_rows:
+            self.item_ranking_status_var.set("Select a hero row to rank items for.")
+            return
+
+        metric = self.item_ranking_metric_var.get()
+        target_snapshot = self._active_target_snapshot()
+        if metric != "ehp" and not target_snapshot:
+            self.item_ranking_status_var.set("Choose an active target to rank items by TTK or DPS, or switch to ehp.")
+            return
+
+        row_entry = self.hero_rows[row_id]
+        levels = []
+        invalid_levels = []
+        for token in re.split(r"[\s,;|]+", self.item_ranking_levels_var.get().strip()):
+            if not token:
+                continue
+            if token.isdigit() and 1 <= int(token) <= MAX_LEVEL:
+                levels.append(int(token))
+            else:
+                invalid_levels.append(token)
+        if invalid_levels:
+            self.item_ranking_status_var.set(
+                f"Levels must be whole numbers from 1 to {MAX_LEVEL}: {', '.join(invalid_levels)}"
+            )
+            return
+        rankings = self.engine.rank_items_by_value(
+            row_entry["hero_name"],
+            row_entry["state"],
+            target_snapshot,
+            metric=metric,
+            levels=levels or None,
+        )
+        for ranking in rankings:
+            self.item_ranking_tree.insert(
+                "",
+                "end",
+                values=(
+                    ranking["item"],
+                    _format_number(ranking["cost"]),
+                    _format_table_metric(ranking["gain"]),
+                    _format_table_metric(ranking["gain_per_gold"] * 1000),
+                ),
+            )
+
+        level_text = ", ".join(str(level) for level in sorted(next(iter(rankings))["levels"])) if rankings else "-"
+        target_text = f" vs {target_snapshot['name']}" if target_snapshot and metric != "ehp" else ""
+        self.item_ranking_status_var.set(
+            f"{row_entry['hero_name']} ({self._row_label(row_id)}){target_text}: {len(rankings)} item(s) "
+            f"ranked by {metric} gain per gold at level(s) {level_text}."
+        )
 
     def _initialize_hero_rows(self):
         self.hero_rows = {}
         self.row_sequence = 0
+        self.row_search_index.clear()
         for hero_name in self.hero_names:
             self._create_hero_row(hero_name, is_base=True)
 
@@ -2402,18 +2443,53 @@ class HeroCoreTableApp:
         row_id = f"hero_row_{self.row_sequence}"
         self.hero_rows[row_id] = {
             "hero_name": hero_name,
-            "state": self._copy_hero_state(state),
+            "state": self.engine.freeze_hero_state(state),
             "is_base": bool(is_base),
             "custom_label": "",
         }
+        self._index_row_search_text(row_id)
         return row_id
 
+    def _hero_search_fields(self, hero_name):
+        cached = self.hero_search_text_cache.get(hero_name)
+        if cached is not None:
+            return cached
+
+        hero_data = self.heroes.get(hero_name, {})
+        fields = (
+            hero_name.lower(),
+            " ".join(
+                [
+                    str(hero_data.get("attackType", "")).lower(),
+                    " ".join(str(role).lower() for role in hero_data.get("roles", []) if isinstance(role, str)),
+                    str(hero_data.get("description", "")).lower(),
+                ]
+            ),
+        )
+        self.hero_search_text_cache[hero_name] = fields
+        return fields
+
+    def _row_search_text(self, row_id):
+        hero_text, detail_text = self._hero_search_fields(self.hero_rows[row_id]["hero_name"])
+        return " ".join([hero_text, self._row_label(row_id).lower(), detail_text])
+
+    def _index_row_search_text(self, row_id):
+        if row_id not in self.hero_rows:
+            self.row_search_index.remove_document(row_id)
+            return
+        self.row_search_index.set_document(row_id, self._row_search_text(row_id))
+
+    def _reindex_hero_row_labels(self, hero_name):
+        for row_id, row_entry in self.hero_rows.items():
+            if row_entry["hero_name"] == hero_name:
+                self._index_row_search_text(row_id)
+
     def _serialize_modifier_widget(self, mod):
         values = {}
         for key, value in mod.__dict__.items():
             if key.endswith("_var") and hasattr(value, "get"):
                 values[key] = value.get()
-        return self._normalize_modifier_payload(
+        return self.engine.normalize_modifier_payload(
             {
                 "type": getattr(mod, "TYPE_NAME", ""),
                 "values": values,
@@ -2439,7 +2515,7 @@ class HeroCoreTableApp:
             return
 
         for modifier_data in modifier_payloads or []:
-            normalized_modifier = self._normalize_modifier_payload(modifier_data)
+            normalized_modifier = self.engine.normalize_modifier_payload(modifier_data)
             if not normalized_modifier:
                 continue
 
@@ -2461,30 +2537,8 @@ class HeroCoreTableApp:
             destination.append(mod)
             mod.update_display()
 
-    def _modifier_payload_enabled(self, modifier_payload):
-        values = modifier_payload.get("values", {})
-        return _as_bool(values.get("enabled_var"), default=True)
-
-    def _modifier_payload_label(self, modifier_payload):
-        values = modifier_payload.get("values", {})
-        return str(values.get("label_var") or modifier_payload.get("type") or "Modifier").strip() or "Modifier"
-
-    def _modifier_payload_value(self, modifier_payload, key="value_var", default=0.0):
-        values = modifier_payload.get("values", {})
-        raw_value = values.get(key, "")
-        parsed = safe_eval(str(raw_value or ""), None)
-        return default if parsed is None else float(parsed)
-
-    def _modifier_payloads_summary_text(self, modifier_payloads):
-        labels = [
-            self._modifier_payload_label(modifier_payload)
-            for modifier_payload in modifier_payloads
-            if self._modifier_payload_enabled(modifier_payload)
-        ]
-        return ", ".join(labels) if labels else "-"
-
     def _current_saved_target_editor_state(self):
-        return self._copy_hero_state(
+        return self.engine.copy_hero_state(
             {
                 "level": self.saved_target_editor_level_var.get(),
                 "items": [str(item_var.get()).strip() for item_var in self.saved_target_editor_items_vars],
@@ -2503,7 +2557,7 @@ class HeroCoreTableApp:
     def _serialize_saved_target_spell_rows(self):
         payloads = []
         for row in self.saved_target_spell_rows:
-            payload = self._normalize_target_spell_payload(
+            payload = self.engine.normalize_target_spell_payload(
                 {
                     "label": row["label_var"].get(),
                     "damage": row["damage_var"].get(),
@@ -2516,11 +2570,11 @@ class HeroCoreTableApp:
         return payloads
 
     def _current_saved_target_editor_snapshot(self):
-        hero_name = _normalize_choice(self.saved_target_editor_hero_var.get(), self.hero_names)
+        hero_name = self.engine.normalize_hero_name(self.saved_target_editor_hero_var.get())
         if not hero_name:
             return None
 
-        return self._build_target_snapshot_from_template(
+        return self.engine.build_target_snapshot_from_template(
             {
                 "id": self.active_saved_target_id,
                 "name": str(self.saved_target_editor_name_var.get() or "").strip() or "Saved Target",
@@ -2541,7 +2595,7 @@ class HeroCoreTableApp:
     def _refresh_saved_target_spell_rows(self):
         snapshot = self._current_saved_target_editor_snapshot()
         for row in self.saved_target_spell_rows:
-            evaluation = self._evaluate_target_spell(
+            evaluation = self.engine.evaluate_target_spell(
                 {
                     "label": row["label_var"].get(),
                     "damage": row["damage_var"].get(),
@@ -2571,7 +2625,7 @@ class HeroCoreTableApp:
         if self.saved_target_spells_container is None:
             return
 
-        normalized_spell = self._normalize_target_spell_payload(spell_payload or {})
+        normalized_spell = self.engine.normalize_target_spell_payload(spell_payload or {})
         if not normalized_spell:
             normalized_spell = {
                 "label": "",
@@ -2671,7 +2725,7 @@ class HeroCoreTableApp:
 
         hero_name = row_entry["hero_name"]
         hero_data = self.heroes.get(hero_name, {})
-        primary_attribute = self._infer_primary_attribute(hero_name, hero_data)
+        primary_attribute = self.engine.infer_primary_attribute(hero_name, hero_data)
         role_text = ", ".join(str(role) for role in hero_data.get("roles", []) if isinstance(role, str)) or "-"
         row_label = self._row_label(row_id)
         fallback_label = self._default_row_label(row_id)
@@ -2709,27 +2763,7 @@ class HeroCoreTableApp:
             )
 
     def _match_hero_name(self, token):
-        normalized = _normalize_match_text(token)
-        compact = _normalize_compact_text(token)
-        if not normalized and not compact:
-            return None
-
-        if normalized in self.hero_match_lookup:
-            return self.hero_match_lookup[normalized]
-        if compact in self.hero_compact_lookup:
-            return self.hero_compact_lookup[compact]
-
-        if normalized:
-            close_normalized = get_close_matches(normalized, self.hero_match_choices, n=1, cutoff=0.72)
-            if close_normalized:
-                return self.hero_match_lookup[close_normalized[0]]
-
-        if compact:
-            close_compact = get_close_matches(compact, self.hero_compact_choices, n=1, cutoff=0.78)
-            if close_compact:
-                return self.hero_compact_lookup[close_compact[0]]
-
-        return None
+        return self.hero_name_matcher.match(token)
 
     def _apply_hero_pool(self):
         hero_names = []
@@ -2778,24 +2812,14 @@ class HeroCoreTableApp:
 
     def _filtered_row_ids(self):
         query = self.search_var.get().strip().lower()
+        matching_row_ids = self.row_search_index.search(query) if query else None
+        use_pool_only = self.use_pool_only_var.get() and self.hero_pool_names
         visible_row_ids = []
 
         for row_id, row_entry in self.hero_rows.items():
-            hero_name = row_entry["hero_name"]
-            if self.use_pool_only_var.get() and self.hero_pool_names and hero_name not in self.hero_pool_names:
+            if matching_row_ids is not None and row_id not in matching_row_ids:
                 continue
-
-            hero_data = self.heroes.get(hero_name, {})
-            haystack = " ".join(
-                [
-                    hero_name.lower(),
-                    self._row_label(row_id).lower(),
-                    str(hero_data.get("attackType", "")).lower(),
-                    " ".join(str(role).lower() for role in hero_data.get("roles", []) if isinstance(role, str)),
-                    str(hero_data.get("description", "")).lower(),
-                ]
-            )
-            if query and query not in haystack:
+            if use_pool_only and row_entry["hero_name"] not in self.hero_pool_names:
                 continue
             visible_row_ids.append(row_id)
 
@@ -2829,17 +2853,71 @@ class HeroCoreTableApp:
         rows.sort(key=sort_key, reverse=self.sort_reverse)
 
     def _refresh_table(self, refresh_editor=True):
+        active_target_snapshot = self._active_target_snapshot()
+        visible_row_ids = self._filtered_row_ids()
+        if len(visible_row_ids) < BACKGROUND_REFRESH_ROW_THRESHOLD:
+            self.recomputer.cancel()
+            self._hide_recompute_progress()
+            column_ids = self._table_value_column_ids()
+            rows = [
+                self._build_table_row(row_id, active_target_snapshot, column_ids=column_ids)
+                for row_id in visible_row_ids
+            ]
+            self._apply_table_rows(rows, active_target_snapshot, refresh_editor)
+            return
+
+        job = self.recomputer.submit(
+            [
+                (row_id, self.hero_rows[row_id]["hero_name"], self.hero_rows[row_id]["state"])
+                for row_id in visible_row_ids
+            ],
+            active_target_snapshot,
+        )
+        self._show_recompute_progress(job)
+        self.parent.after(RECOMPUTE_POLL_MS, lambda: self._poll_recompute_job(job, refresh_editor))
+
+    def _poll_recompute_job(self, job, refresh_editor):
+        if not self.recomputer.is_current(job):
+            return
+        if not job.finished:
+            self._show_recompute_progress(job)
+            self.parent.after(RECOMPUTE_POLL_MS, lambda: self._poll_recompute_job(job, refresh_editor))
+            return
+
+        self.recomputer.complete(job)
+        self._hide_recompute_progress()
+        if job.error is not None:
+            raise job.error
+
+        column_ids = self._table_value_column_ids()
+        rows = [
+            self._build_table_row(row_id, job.target_snapshot, computed=computed, column_ids=column_ids)
+            for row_id, computed in job.results.items()
+            if row_id in self.hero_rows
+        ]
+        self._apply_table_rows(rows, job.target_snapshot, refresh_editor)
+
+    def _show_recompute_progress(self, job):
+        if self.recompute_progress is None:
+            return
+        self.recompute_progress.configure(maximum=max(1, job.total_rows), value=job.done_rows)
+        if not self.recompute_progress.winfo_ismapped():
+            self.recompute_progress.pack(side="right")
+        self.summary_var.set(f"Recomputing {job.done_rows}/{job.total_rows} row(s)...")
+
+    def _hide_recompute_progress(self):
+        if self.recompute_progress is not None and self.recompute_progress.winfo_ismapped():
+            self.recompute_progress.pack_forget()
+
+    def _apply_table_rows(self, rows, active_target_snapshot, refresh_editor=True):
         focus_state = self._capture_focus_state() if not refresh_editor else None
         self.skip_editor_sync_row_id = self.current_selected_row_id if not refresh_editor else None
         previous_selection = [iid for iid in self.tree.selection() if iid in self.hero_rows]
         current_focus = self.tree.focus()
-        active_target_snapshot = self._active_target_snapshot()
 
         for item_id in self.tree.get_children():
             self.tree.delete(item_id)
 
-        visible_row_ids = self._filtered_row_ids()
-        rows = [self._build_table_row(row_id, active_target_snapshot) for row_id in visible_row_ids]
         self._sort_table_rows(rows)
         self.table_rows_by_id = {row["row_id"]: row for row in rows}
 
@@ -2875,6 +2953,7 @@ class HeroCoreTableApp:
             f"Active target: {active_target_snapshot['name'] if active_target_snapshot else 'none'}."
         )
         self._update_target_status()
+        self._refresh_target_matrix_window()
         if refresh_editor:
             self._handle_tree_selection()
         elif focus_state is not None:
@@ -2883,18 +2962,24 @@ class HeroCoreTableApp:
     def _refresh_tree_rows_in_place(self, row_ids):
         if self.tree is None:
             return
+        if self.recomputer.has_pending_job():
+            # The running job snapshotted the rows before this edit; recompute from current state instead.
+            self._refresh_table(refresh_editor=False)
+            return
 
         active_target_snapshot = self._active_target_snapshot()
+        column_ids = self._table_value_column_ids()
         for row_id in row_ids or []:
             if row_id not in self.hero_rows or not self.tree.exists(row_id):
                 continue
 
-            row = self._build_table_row(row_id, active_target_snapshot)
+            row = self._build_table_row(row_id, active_target_snapshot, column_ids=column_ids)
             self.table_rows_by_id[row_id] = row
             values = [row.get(column_id, "") for column_id, _label, _width, _anchor in TABLE_COLUMNS]
             self.tree.item(row_id, values=values)
 
         self._update_target_status()
+        self._refresh_target_matrix_window()
 
     def _handle_tree_selection(self, _event=None):
         if self.suppress_tree_selection_events:
@@ -3028,6 +3113,7 @@ class HeroCoreTableApp:
             return
 
         row_entry["custom_label"] = str(self.selected_row_name_var.get() or "").strip()
+        self._index_row_search_text(self.current_selected_row_id)
         self._refresh_selected_row_heading(self.current_selected_row_id)
         self._update_shop_status()
         self._refresh_selected_hero_summary(self.current_selected_row_id)
@@ -3047,42 +3133,35 @@ class HeroCoreTableApp:
         if not row_entry:
             return
 
-        state = row_entry["state"]
-        state["level"] = self._parse_level_value(self.selected_level_var.get())
-        state["items"] = [str(item_var.get()).strip() for item_var in self.selected_items_vars]
-        state["talents"] = {
-            tier: {
-                "None": "none",
-                "Left": "left",
-                "Right": "right",
-            }.get(self.selected_talent_vars[tier].get(), "none")
-            for tier in TALENT_TIERS
-        }
+        row_entry["state"] = self.engine.freeze_hero_state(
+            dict(
+                row_entry["state"],
+                level=self.engine.parse_level_value(self.selected_level_var.get()),
+                items=[str(item_var.get()).strip() for item_var in self.selected_items_vars],
+                talents={
+                    tier: {
+                        "None": "none",
+                        "Left": "left",
+                        "Right": "right",
+                    }.get(self.selected_talent_vars[tier].get(), "none")
+                    for tier in TALENT_TIERS
+                },
+            )
+        )
 
         self._refresh_selected_hero_summary(self.current_selected_row_id)
         self._refresh_table(refresh_editor=False)
 
-    def _normalize_item_name(self, value):
-        normalized = _normalize_choice(value, self.item_names)
-        return normalized or ""
-
-    def _parse_level_value(self, value):
-        try:
-            parsed = int(float(str(value or "").strip()))
-        except ValueError:
-            parsed = 1
-        return max(1, min(MAX_LEVEL, parsed))
-
     def _adjust_selected_level(self, delta):
         if not self.current_selected_row_id:
             return
-        current_level = self._parse_level_value(self.selected_level_var.get())
+        current_level = self.engine.parse_level_value(self.selected_level_var.get())
         self.selected_level_var.set(str(max(1, min(MAX_LEVEL, current_level + delta))))
 
     def _reset_selected_hero(self):
         if not self.current_selected_row_id or self.current_selected_row_id not in self.hero_rows:
             return
-        self.hero_rows[self.current_selected_row_id]["state"] = self._default_hero_state()
+        self.hero_rows[self.current_selected_row_id]["state"] = self.engine.freeze_hero_state(None)
         self._populate_editor(self.current_selected_row_id)
         self._refresh_table()
 
@@ -3104,7 +3183,7 @@ class HeroCoreTableApp:
         source_entry = self.hero_rows[self.current_selected_row_id]
         new_row_id = self._create_hero_row(
             source_entry["hero_name"],
-            state=copy.deepcopy(source_entry["state"]),
+            state=source_entry["state"],
             is_base=False,
         )
         self.current_selected_row_id = new_row_id
@@ -3120,6 +3199,8 @@ class HeroCoreTableApp:
 
         hero_name = row_entry["hero_name"]
         del self.hero_rows[self.current_selected_row_id]
+        self.row_search_index.remove_document(self.current_selected_row_id)
+        self._reindex_hero_row_labels(hero_name)
         self.current_selected_row_id = next(
             (row_id for row_id, entry in self.hero_rows.items() if entry["hero_name"] == hero_name),
             None,
@@ -3127,812 +3208,159 @@ class HeroCoreTableApp:
         self._refresh_table()
 
     def _visible_row_ids_for_bulk(self):
-        return list(self.table_rows_by_id.keys())
+        return [row_id for row_id in self.table_rows_by_id.keys() if row_id in self.hero_rows]
 
     def _adjust_visible_levels(self, delta):
-        visible_row_ids = self._visible_row_ids_for_bulk()
-        if not visible_row_ids:
-            return
+        self.bulk_edit_rows(self._visible_row_ids_for_bulk(), "level_delta", delta)
 
-        for row_id in visible_row_ids:
-            state = self.hero_rows[row_id]["state"]
-            state["level"] = max(1, min(MAX_LEVEL, state["level"] + delta))
+    def _set_visible_levels(self):
+        self.bulk_edit_rows(self._visible_row_ids_for_bulk(), "set_level", self.bulk_level_var.get())
+
+    def bulk_edit_rows(self, row_ids, operation, value):
+        """
+        Apply one edit to many rows and update the table in a single pass.
+
+        ``operation`` is one of BULK_EDIT_OPERATIONS (see
+        HeroCoreEngine.apply_state_edit). Only rows whose state changed are
+        recomputed, unless one of them is the live target, in which case
+        every row's target metrics are; tree items are rewritten and the
+        table re-sorted in place. Returns the changed row ids.
+        """
+        if operation not in BULK_EDIT_OPERATIONS:
+            raise ValueError(f"Unsupported bulk edit operation: {operation!r}")
+
+        changed_row_ids = []
+        for row_id in row_ids or []:
+            row_entry = self.hero_rows.get(row_id)
+            if not row_entry:
+                continue
+            edited_state = self.engine.apply_state_edit(row_entry["state"], operation, value)
+            if edited_state is not row_entry["state"]:
+                row_entry["state"] = edited_state
+                changed_row_ids.append(row_id)
+        if not changed_row_ids:
+            return []
 
-        if self.current_selected_row_id:
+        if self.current_selected_row_id in changed_row_ids:
             self._populate_editor(self.current_selected_row_id)
-        self._refresh_table()
+        if self.recomputer.has_pending_job():
+            self._refresh_table()
+        elif self.live_target_row_id in changed_row_ids:
+            self._apply_bulk_rows_to_tree(list(self.table_rows_by_id))
+        else:
+            self._apply_bulk_rows_to_tree(changed_row_ids)
+        return changed_row_ids
 
-    def _set_visible_levels(self):
-        visible_row_ids = self._visible_row_ids_for_bulk()
-        if not visible_row_ids:
-            return
+    def _apply_bulk_rows_to_tree(self, row_ids):
+        active_target_snapshot = self._active_target_snapshot()
+        column_ids = self._table_value_column_ids()
+        for row_id in row_ids:
+            previous_row = self.table_rows_by_id.get(row_id)
+            if previous_row is None or not self.tree.exists(row_id):
+                continue
 
-        level = self._parse_level_value(self.bulk_level_var.get())
-        for row_id in visible_row_ids:
-            state = self.hero_rows[row_id]["state"]
-            state["level"] = level
+            row = self._build_table_row(row_id, active_target_snapshot, column_ids=column_ids)
+            self.table_rows_by_id[row_id] = row
+            values = [row.get(column_id, "") for column_id, _label, _width, _anchor in TABLE_COLUMNS]
+            previous_values = [previous_row.get(column_id, "") for column_id, _label, _width, _anchor in TABLE_COLUMNS]
+            if values != previous_values:
+                self.tree.item(row_id, values=values)
 
-        if self.current_selected_row_id:
-            self._populate_editor(self.current_selected_row_id)
-        self._refresh_table()
+        rows = [self.table_rows_by_id[row_id] for row_id in self.hero_rows if row_id in self.table_rows_by_id]
+        self._sort_table_rows(rows)
+        ordered_row_ids = [row["row_id"] for row in rows]
+        if ordered_row_ids != list(self.tree.get_children()):
+            for index, row_id in enumerate(ordered_row_ids):
+                self.tree.move(row_id, "", index)
+        self.table_rows_by_id = {row["row_id"]: row for row in rows}
 
-    def _build_table_row(self, row_id, active_target_snapshot=None):
+        self._update_target_status()
+        self._refresh_target_matrix_window()
+
+    def _table_value_column_ids(self):
+        column_ids = set(self.visible_column_ids)
+        column_ids.add(self.sort_column)
+        return column_ids
+
+    def _build_table_row(self, row_id, active_target_snapshot=None, computed=None, column_ids=None):
+        """
+        Build one table row. ``column_ids`` limits which lazy columns are
+        formatted (default: all); the rest stay unset and are filled on demand
+        by _table_row_value.
+        """
         row_entry = self.hero_rows[row_id]
         hero_name = row_entry["hero_name"]
         hero_data = self.heroes.get(hero_name, {})
         state = row_entry["state"]
-        computed = self._compute_hero_stats(hero_name, hero_data, state)
-        computed.update(self._compute_target_metrics(computed, active_target_snapshot))
+        if column_ids is None:
+            column_ids = TABLE_COLUMN_FORMATTERS.keys()
+        if computed is None:
+            computed = self.engine.compute_hero_stats(hero_name, hero_data, state)
+            needs_target = any(column_id in TARGET_METRIC_COLUMN_IDS for column_id in column_ids)
+            computed.update(
+                self.engine.compute_target_metrics(computed, active_target_snapshot if needs_target else None)
+            )
 
-        return {
+        row = {
             "row_id": row_id,
             "row_label": self._row_label(row_id),
             "hero": hero_name,
             "level": state["level"],
-            "networth": _format_number(computed["networth"]),
-            "primary_attribute": ATTRIBUTE_DISPLAY.get(computed["primary_attribute"], "?"),
-            "attack_type": str(hero_data.get("attackType", "")),
-            "roles": ", ".join(str(role) for role in hero_data.get("roles", []) if isinstance(role, str)),
-            "strength": _format_number(computed["strength"]),
-            "strength_gain": _format_number(computed["strength_gain"]),
-            "agility": _format_number(computed["agility"]),
-            "agility_gain": _format_number(computed["agility_gain"]),
-            "intelligence": _format_number(computed["intelligence"]),
-            "intelligence_gain": _format_number(computed["intelligence_gain"]),
-            "health": _format_number(computed["health"]),
-            "health_regen": _format_number(computed["health_regen"]),
-            "mana": _format_number(computed["mana"]),
-            "mana_regen": _format_number(computed["mana_regen"]),
-            "armor": _format_number(computed["armor"]),
-            "magic_resist": _format_percent_points(computed["magic_resist"]),
-            "attack_damage": _format_number(computed["attack_damage"]),
-            "damage_min": _format_number(computed["damage_min"]),
-            "damage_max": _format_number(computed["damage_max"]),
-            "attack_speed": _format_number(computed["attack_speed"]),
-            "target_damage_per_hit": _format_table_metric(computed["target_damage_per_hit"]),
-            "target_dps": _format_table_metric(computed["target_dps"]),
-            "target_attacks_to_kill": _format_table_metric(computed["target_attacks_to_kill"]),
-            "target_time_to_kill": _format_table_metric(computed["target_time_to_kill"]),
-            "move_speed": _format_number(computed["move_speed"]),
-            "attack_range": _format_number(computed["attack_range"]),
-            "projectile_speed": _format_number(computed["projectile_speed"]),
-            "bat": _format_number(computed["bat"]),
-            "animation_point": _format_number(computed["animation_point"]),
-            "animation_backswing": _format_number(computed["animation_backswing"]),
-            "turn_rate": _format_number(computed["turn_rate"]),
-            "collision_size": _format_number(computed["collision_size"]),
-            "vision_day": _format_number(computed["vision_day"]),
-            "vision_night": _format_number(computed["vision_night"]),
-            "talents": computed["talents_display"],
-            "items": computed["items_display"],
             "_raw": computed,
+            "_hero_data": hero_data,
+            "_target_snapshot": active_target_snapshot,
         }
-
-    def _compute_target_metrics(self, computed, target_snapshot):
-        metrics = {
-            "target_damage_per_hit": None,
-            "target_dps": None,
-            "target_attacks_to_kill": None,
-            "target_time_to_kill": None,
-            "target_name": target_snapshot.get("name") if target_snapshot else "",
-            "incoming_spell_raw_damage": target_snapshot.get("incoming_spell_raw_damage", 0.0) if target_snapshot else 0.0,
-            "incoming_spell_effective_damage": target_snapshot.get("incoming_spell_effective_damage", 0.0) if target_snapshot else 0.0,
-            "remaining_health_after_spells": target_snapshot.get("remaining_health_after_spells", 0.0) if target_snapshot else 0.0,
-        }
-        if not target_snapshot:
-            return metrics
-
-        attack_speed = _to_float(computed.get("attack_speed"), default=0.0)
-        bat = _to_float(computed.get("bat"), default=0.0)
-        attack_rate = calculate_attack_rate(attack_speed, bat)
-
-        raw_attack_damage = _to_float(computed.get("attack_damage"), default=0.0)
-        target_armor = _to_float(target_snapshot.get("armor"), default=0.0)
-        evasion = max(0.0, _to_float(target_snapshot.get("evasion"), default=0.0)) / 100.0
-        target_health = _to_float(target_snapshot.get("health"), default=None)
-        target_regen = _to_float(target_snapshot.get("health_regen"), default=0.0)
-        incoming_spell_damage = _to_float(target_snapshot.get("incoming_spell_effective_damage"), default=0.0)
-
-        reduced_damage = apply_physical_reduction(raw_attack_damage, target_armor)
-        reduced_damage *= max(0.0, 1.0 - evasion)
-
-        metrics["target_damage_per_hit"] = reduced_damage
-        metrics["target_dps"] = calculate_dps(reduced_damage, attack_rate)
-
-        if target_health is not None and target_health > 0:
-            remaining_health = max(0.0, target_health - incoming_spell_damage)
-            if remaining_health <= 0:
-                metrics["target_attacks_to_kill"] = 0
-                metrics["target_time_to_kill"] = 0
-                return metrics
-            metrics["target_attacks_to_kill"] = calculate_hits_to_kill(
-                remaining_health,
-                reduced_damage,
-                target_regen,
-                attack_rate,
-            )
-            metrics["target_time_to_kill"] = calculate_time_to_kill(
-                remaining_health,
-                reduced_damage,
-                attack_rate,
-                target_regen,
-            )
-
-        return metrics
-
-    def _infer_primary_attribute(self, hero_name, hero_data):
-        explicit_candidates = [
-            hero_data.get("primary_attribute"),
-            hero_data.get("primaryAttribute"),
-            hero_data.get("attribute_type"),
-            hero_data.get("general", {}).get("primary_attribute") if isinstance(hero_data.get("general"), dict) else "",
-        ]
-        for candidate in explicit_candidates:
-            normalized = self._normalize_primary_attribute(candidate)
-            if normalized != "unknown":
-                return normalized
-
-        attribute_gains = hero_data.get("attributeGains", {})
-        stat_gains = hero_data.get("statGains", {})
-        main_attack_damage = stat_gains.get("mainAttackDamage")
-
-        if main_attack_damage is not None:
-            main_attack_damage = _to_float(main_attack_damage, default=None)
-            if main_attack_damage is not None:
-                strength_gain = _to_float(attribute_gains.get("strength"))
-                agility_gain = _to_float(attribute_gains.get("agility"))
-                intelligence_gain = _to_float(attribute_gains.get("intelligence"))
-                universal_gain = 0.45 * (strength_gain + agility_gain + intelligence_gain)
-                scores = {
-                    "strength": abs(main_attack_damage - strength_gain),
-                    "agility": abs(main_attack_damage - agility_gain),
-                    "intelligence": abs(main_attack_damage - intelligence_gain),
-                    "universal": abs(main_attack_damage - universal_gain),
-                }
-                return min(scores, key=scores.get)
-
-        ranked_gains = sorted(
-            [
-                ("strength", _to_float(attribute_gains.get("strength"))),
-                ("agility", _to_float(attribute_gains.get("agility"))),
-                ("intelligence", _to_float(attribute_gains.get("intelligence"))),
-            ],
-            key=lambda item: (item[1], item[0]),
-            reverse=True,
-        )
-        if ranked_gains and ranked_gains[0][1] > 0:
-            return ranked_gains[0][0]
-        return "unknown"
-
-    def _normalize_primary_attribute(self, value):
-        lowered = str(value or "").strip().lower()
-        mapping = {
-            "str": "strength",
-            "strength": "strength",
-            "agi": "agility",
-            "agility": "agility",
-            "int": "intelligence",
-            "intelligence": "intelligence",
-            "uni": "universal",
-            "universal": "universal",
-        }
-        return mapping.get(lowered, "unknown")
-
-    def _collect_state_custom_modifiers(self, state):
-        modifiers = _empty_modifiers()
-        damage_modifiers = []
-        active_labels = []
-
-        for modifier_payload in state.get("modifiers", []):
-            normalized_modifier = self._normalize_modifier_payload(modifier_payload)
-            if not normalized_modifier or not self._modifier_payload_enabled(normalized_modifier):
-                continue
-
-            type_name = normalized_modifier["type"]
-            label = self._modifier_payload_label(normalized_modifier)
-            value = self._modifier_payload_value(normalized_modifier)
-
-            if type_name == "Flat Damage":
-                if abs(value) > 1e-9:
-                    damage_modifiers.append({"kind": "flat", "value": value})
-                    active_labels.append(label)
-                continue
-
-            if type_name == "Percentage Damage":
-                pct = value / 100.0
-                if abs(pct) > 1e-9:
-                    damage_modifiers.append(
-                        {
-                            "kind": "pct",
-                            "value": pct,
-                            "apply_to_total": _as_bool(
-                                normalized_modifier.get("values", {}).get("apply_to_total_var"),
-                                default=True,
-                            ),
-                        }
-                    )
-                    active_labels.append(label)
-                continue
-
-            applied = False
-            if type_name == "Strength":
-                modifiers["strength"] += value
-                applied = True
-            elif type_name == "Agility":
-                modifiers["agility"] += value
-                applied = True
-            elif type_name == "Intelligence":
-                modifiers["intelligence"] += value
-                applied = True
-            elif type_name == "Armor":
-                modifiers["armor_flat"] += value
-                applied = True
-            elif type_name == "Magic Resistance":
-                modifiers["magic_resist_flat"] += value
-                applied = True
-            elif type_name == "Attack Speed":
-                modifiers["attack_speed_flat"] += value
-                applied = True
-            elif type_name == "BAT Reduction %":
-                modifiers["bat_reduction_pct"] += value / 100.0
-                applied = True
-            elif type_name == "HP":
-                modifiers["health_flat"] += value
-                applied = True
-            elif type_name == "Mana":
-                modifiers["mana_flat"] += value
-                applied = True
-            elif type_name == "HP Regen Flat":
-                modifiers["health_regen_flat"] += value
-                applied = True
-            elif type_name == "Mana Regen Flat":
-                modifiers["mana_regen_flat"] += value
-                applied = True
-            elif type_name == "Movespeed Flat":
-                modifiers["move_speed_flat"] += value
-                applied = True
-            elif type_name == "Movespeed Percent":
-                modifiers["move_speed_pct"] += value / 100.0
-                applied = True
-
-            if applied and abs(value) > 1e-9:
-                active_labels.append(label)
-
-        return modifiers, damage_modifiers, active_labels
-
-    def _apply_attack_damage_modifier_chain(self, base_damage, damage_modifiers):
-        damage = float(base_damage)
-        for modifier in damage_modifiers:
-            if modifier.get("kind") == "flat":
-                damage += modifier.get("value", 0.0)
-                continue
-            if modifier.get("kind") == "pct":
-                pct = modifier.get("value", 0.0)
-                if modifier.get("apply_to_total", True):
-                    damage *= max(0.0, 1 + pct)
-                else:
-                    damage += base_damage * pct
-        return damage
-
-    def _compute_hero_stats(self, hero_name, hero_data, state):
-        level = state["level"]
-        stats = hero_data.get("stats", {})
-        attributes = hero_data.get("attributes", {})
-        attribute_gains = hero_data.get("attributeGains", {})
-        stat_gains = hero_data.get("statGains", {})
-        primary_attribute = self._infer_primary_attribute(hero_name, hero_data)
-
-        item_modifiers, selected_items = self._collect_state_item_modifiers(state)
-        networth = sum(self._item_cost_value(item_name) for item_name in selected_items)
-        talent_modifiers, selected_talent_codes, applied_talent_labels = self._collect_state_talent_modifiers(
-            hero_data,
-            state,
-            level,
-        )
-        custom_modifiers, custom_damage_modifiers, custom_modifier_labels = self._collect_state_custom_modifiers(state)
-
-        total_modifiers = _empty_modifiers()
-        _merge_modifiers(total_modifiers, item_modifiers)
-        _merge_modifiers(total_modifiers, talent_modifiers)
-        _merge_modifiers(total_modifiers, custom_modifiers)
-
-        strength_base = _to_float(attributes.get("strength"))
-        agility_base = _to_float(attributes.get("agility"))
-        intelligence_base = _to_float(attributes.get("intelligence"))
-        strength_gain = _to_float(attribute_gains.get("strength"))
-        agility_gain = _to_float(attribute_gains.get("agility"))
-        intelligence_gain = _to_float(attribute_gains.get("intelligence"))
-        level_factor = max(0, level - 1)
-
-        strength = strength_base + (strength_gain * level_factor) + total_modifiers["strength"]
-        agility = agility_base + (agility_gain * level_factor) + total_modifiers["agility"]
-        intelligence = intelligence_base + (intelligence_gain * level_factor) + total_modifiers["intelligence"]
-
-        health = _to_float(stats.get("health")) + (_to_float(stat_gains.get("health")) * level_factor)
-        health += 22.0 * total_modifiers["strength"]
-        health += total_modifiers["health_flat"]
-        if total_modifiers["health_pct"]:
-            health *= max(0.0, 1 + total_modifiers["health_pct"])
-
-        health_regen = _to_float(stats.get("healthRegen")) + (_to_float(stat_gains.get("healthRegen")) * level_factor)
-        health_regen += 0.1 * total_modifiers["strength"]
-        health_regen += total_modifiers["health_regen_flat"]
-        if total_modifiers["max_hp_regen_pct"]:
-            health_regen += health * total_modifiers["max_hp_regen_pct"]
-
-        mana = _to_float(stats.get("mana")) + (_to_float(stat_gains.get("mana")) * level_factor)
-        mana += 12.0 * total_modifiers["intelligence"]
-        mana += total_modifiers["mana_flat"]
-        if total_modifiers["mana_pct"]:
-            mana *= max(0.0, 1 + total_modifiers["mana_pct"])
-
-        mana_regen = _to_float(stats.get("manaRegen")) + (_to_float(stat_gains.get("manaRegen")) * level_factor)
-        mana_regen += 0.05 * total_modifiers["intelligence"]
-        mana_regen += total_modifiers["mana_regen_flat"]
-
-        armor = _to_float(stats.get("armor")) + (_to_float(stat_gains.get("armor")) * level_factor)
-        armor += total_modifiers["agility"] / 6.0
-        armor += total_modifiers["armor_flat"]
-
-        magic_resist = _to_float(stats.get("magicResistance")) + (_to_float(stat_gains.get("magicResistance")) * level_factor)
-        magic_resist += total_modifiers["magic_resist_flat"]
-
-        attack_damage_bonus = self._base_attack_damage_gain(hero_data, primary_attribute) * level_factor
-        attack_damage_bonus += self._bonus_attribute_damage(primary_attribute, total_modifiers)
-        attack_damage_bonus += total_modifiers["attack_damage_flat"]
-
-        attack_damage = _to_float(stats.get("damageAverage")) + attack_damage_bonus
-        damage_min = _to_float(stats.get("damageMin"), default=None)
-        if damage_min is not None:
-            damage_min += attack_damage_bonus
-        damage_max = _to_float(stats.get("damageMax"), default=None)
-        if damage_max is not None:
-            damage_max += attack_damage_bonus
-
-        attack_damage = self._apply_attack_damage_modifier_chain(attack_damage, custom_damage_modifiers)
-        if damage_min is not None:
-            damage_min = self._apply_attack_damage_modifier_chain(damage_min, custom_damage_modifiers)
-        if damage_max is not None:
-            damage_max = self._apply_attack_damage_modifier_chain(damage_max, custom_damage_modifiers)
-
-        attack_speed = _to_float(stats.get("totalAttackSpeed", stats.get("attackSpeed")))
-        attack_speed += _to_float(stat_gains.get("attackSpeed")) * level_factor
-        attack_speed += total_modifiers["agility"]
-        attack_speed += total_modifiers["attack_speed_flat"]
-        if total_modifiers["attack_speed_pct"]:
-            attack_speed *= max(0.0, 1 + total_modifiers["attack_speed_pct"])
-
-        move_speed = _to_float(stats.get("moveSpeed")) + total_modifiers["move_speed_flat"]
-        if total_modifiers["move_speed_pct"]:
-            move_speed *= max(0.0, 1 + total_modifiers["move_speed_pct"])
-
-        attack_range = _to_float(stats.get("attackRange")) + total_modifiers["attack_range_flat"]
-        projectile_speed = stats.get("projectileSpeed")
-        if isinstance(projectile_speed, (int, float)):
-            projectile_speed = float(projectile_speed) + total_modifiers["projectile_speed_flat"]
-        else:
-            projectile_speed = str(projectile_speed or "")
-        bat = _to_float(stats.get("bat"))
-        if total_modifiers["bat_reduction_pct"]:
-            bat *= max(0.05, 1 - min(0.95, max(0.0, total_modifiers["bat_reduction_pct"])))
-
-        return {
-            "primary_attribute": primary_attribute,
-            "strength": strength,
-            "strength_gain": strength_gain,
-            "agility": agility,
-            "agility_gain": agility_gain,
-            "intelligence": intelligence,
-            "intelligence_gain": intelligence_gain,
-            "health": health,
-            "health_regen": health_regen,
-            "mana": mana,
-            "mana_regen": mana_regen,
-            "armor": armor,
-            "magic_resist": magic_resist,
-            "attack_damage": attack_damage,
-            "damage_min": damage_min,
-            "damage_max": damage_max,
-            "attack_speed": attack_speed,
-            "move_speed": move_speed,
-            "attack_range": attack_range,
-            "projectile_speed": projectile_speed,
-            "bat": bat,
-            "animation_point": _to_float(stats.get("animationPoint"), default=None),
-            "animation_backswing": _to_float(stats.get("animationBackswing"), default=None),
-            "turn_rate": _to_float(stats.get("turnRate")),
-            "collision_size": _to_float(stats.get("collisionSize"), default=None),
-            "vision_day": _to_float(stats.get("visionDay"), default=None),
-            "vision_night": _to_float(stats.get("visionNight"), default=None),
-            "networth": networth,
-            "talents_display": ", ".join(selected_talent_codes) if selected_talent_codes else "-",
-            "items_display": ", ".join(selected_items) if selected_items else "-",
-            "applied_talent_labels": applied_talent_labels,
-            "custom_modifier_labels": custom_modifier_labels,
-            "selected_items": selected_items,
-        }
-
-    def _base_attack_damage_gain(self, hero_data, primary_attribute):
-        stat_gains = hero_data.get("statGains", {})
-        explicit_gain = stat_gains.get("mainAttackDamage")
-        if explicit_gain is not None:
-            return _to_float(explicit_gain)
-
-        attribute_gains = hero_data.get("attributeGains", {})
-        if primary_attribute == "strength":
-            return _to_float(attribute_gains.get("strength"))
-        if primary_attribute == "agility":
-            return _to_float(attribute_gains.get("agility"))
-        if primary_attribute == "intelligence":
-            return _to_float(attribute_gains.get("intelligence"))
-        if primary_attribute == "universal":
-            return 0.45 * (
-                _to_float(attribute_gains.get("strength"))
-                + _to_float(attribute_gains.get("agility"))
-                + _to_float(attribute_gains.get("intelligence"))
-            )
-        return 0.0
-
-    def _bonus_attribute_damage(self, primary_attribute, modifiers):
-        if primary_attribute == "strength":
-            return modifiers["strength"]
-        if primary_attribute == "agility":
-            return modifiers["agility"]
-        if primary_attribute == "intelligence":
-            return modifiers["intelligence"]
-        if primary_attribute == "universal":
-            return 0.45 * (modifiers["strength"] + modifiers["agility"] + modifiers["intelligence"])
-        return 0.0
-
-    def _collect_state_item_modifiers(self, state):
-        modifiers = _empty_modifiers()
-        selected_items = []
-
-        for item_name in state["items"]:
-            normalized_name = self._normalize_item_name(item_name)
-            if not normalized_name or normalized_name not in self.items:
-                continue
-            selected_items.append(normalized_name)
-            _merge_modifiers(modifiers, self._get_item_modifiers(normalized_name))
-
-        return modifiers, selected_items
-
-    def _item_cost_value(self, item_name):
-        if not item_name or item_name not in self.items:
-            return 0.0
-
-        item_data = self.items.get(item_name, {})
-        parsed_cost = _to_float(item_data.get("cost"), default=None)
-        if parsed_cost is None:
-            return 0.0
-        return parsed_cost
-
-    def _get_item_modifiers(self, item_name):
-        if item_name in self.item_modifier_cache:
-            cached = self.item_modifier_cache[item_name]
-            fresh = _empty_modifiers()
-            _merge_modifiers(fresh, cached)
-            return fresh
-
-        item_data = self.items.get(item_name, {})
-        modifiers = _empty_modifiers()
-        has_explicit_stats = False
-
-        stats_payload = item_data.get("stats")
-        if isinstance(stats_payload, dict) and stats_payload:
-            has_explicit_stats = self._apply_stats_payload(modifiers, stats_payload)
-
-        if not has_explicit_stats:
-            parsed_passive_modifiers = self._parse_item_passive_bonuses(item_data)
-            if self._modifiers_have_value(parsed_passive_modifiers):
-                _merge_modifiers(modifiers, parsed_passive_modifiers)
-                if not self._passive_stats_are_complete(item_data):
-                    self._merge_recipe_modifiers(modifiers, item_data.get("recipe"), seen={item_name})
-            else:
-                self._merge_recipe_modifiers(modifiers, item_data.get("recipe"), seen={item_name})
-
-        self.item_modifier_cache[item_name] = modifiers
-        fresh = _empty_modifiers()
-        _merge_modifiers(fresh, modifiers)
-        return fresh
-
-    def _merge_recipe_modifiers(self, modifiers, recipe_payload, seen):
-        if not isinstance(recipe_payload, list):
+        for column_id in column_ids:
+            formatter = TABLE_COLUMN_FORMATTERS.get(column_id)
+            if formatter is not None:
+                row[column_id] = formatter(computed, hero_data)
+        return row
+
+    def _table_row_value(self, row, column_id):
+        """Return a row's formatted value, computing a skipped lazy column now."""
+        if column_id in row or column_id not in TABLE_COLUMN_FORMATTERS:
+            return row.get(column_id, "")
+
+        computed = row["_raw"]
+        if column_id in TARGET_METRIC_COLUMN_IDS and row["_target_snapshot"] and computed.get("target_dps") is None:
+            computed.update(self.engine.compute_target_metrics(computed, row["_target_snapshot"]))
+        row[column_id] = TABLE_COLUMN_FORMATTERS[column_id](computed, row["_hero_data"])
+        return row[column_id]
+
+    def _refresh_talent_breakpoints(self, row_id):
+        row_entry = self.hero_rows.get(row_id)
+        table = self.talent_breakpoints.get(row_entry["hero_name"]) if row_entry else None
+        if table is None:
+            self.talent_breakpoint_var.set("")
             return
 
-        for recipe_item_name in recipe_payload:
-            if recipe_item_name in seen or recipe_item_name not in self.items:
-                continue
-            seen.add(recipe_item_name)
-            _merge_modifiers(modifiers, self._get_item_modifiers(recipe_item_name))
-
-    def _apply_stats_payload(self, modifiers, stats_payload):
-        applied = False
-        for stat_name, stat_value in stats_payload.items():
-            if self._apply_named_stat_bonus(modifiers, stat_name, stat_value):
-                applied = True
-        return applied
-
-    def _apply_named_stat_bonus(self, modifiers, stat_name, stat_value):
-        value, is_percent = _first_numeric_value(stat_value)
-        if value is None:
-            return False
-
-        normalized_name = str(stat_name or "").strip().lower()
-        normalized_name = normalized_name.replace("+", "").replace("  ", " ")
-
-        if normalized_name in {"strength", "bonus strength"}:
-            modifiers["strength"] += value
-            return True
-        if normalized_name in {"agility", "bonus agility"}:
-            modifiers["agility"] += value
-            return True
-        if normalized_name in {"intelligence", "bonus intelligence"}:
-            modifiers["intelligence"] += value
-            return True
-        if normalized_name in {"all attributes", "attributes"}:
-            modifiers["strength"] += value
-            modifiers["agility"] += value
-            modifiers["intelligence"] += value
-            return True
-        if normalized_name in {"health", "bonus health"}:
-            if is_percent:
-                modifiers["health_pct"] += value / 100.0
-            else:
-                modifiers["health_flat"] += value
-            return True
-        if normalized_name in {"mana"}:
-            if is_percent:
-                modifiers["mana_pct"] += value / 100.0
-            else:
-                modifiers["mana_flat"] += value
-            return True
-        if normalized_name in {"health regeneration", "health regen"}:
-            modifiers["health_regen_flat"] += value
-            return True
-        if normalized_name in {"mana regeneration", "mana regen"}:
-            modifiers["mana_regen_flat"] += value
-            return True
-        if normalized_name in {"armor", "bonus armor", "bonus magic resistance"}:
-            if normalized_name in {"armor", "bonus armor"}:
-                modifiers["armor_flat"] += value
-            else:
-                modifiers["magic_resist_flat"] += value
-            return True
-        if normalized_name in {"magic resistance"}:
-            modifiers["magic_resist_flat"] += value
-            return True
-        if normalized_name in {"attack damage", "bonus attack damage"}:
-            modifiers["attack_damage_flat"] += value
-            return True
-        if normalized_name in {"attack speed"}:
-            if is_percent:
-                modifiers["attack_speed_pct"] += value / 100.0
-            else:
-                modifiers["attack_speed_flat"] += value
-            return True
-        if normalized_name in {"base attack speed"}:
-            modifiers["attack_speed_pct"] += value / 100.0
-            return True
-        if normalized_name in {"move speed", "bonus move speed"}:
-            if is_percent:
-                modifiers["move_speed_pct"] += value / 100.0
-            else:
-                modifiers["move_speed_flat"] += value
-            return True
-        if normalized_name == "attack range":
-            modifiers["attack_range_flat"] += value
-            return True
-        if normalized_name == "projectile speed":
-            modifiers["projectile_speed_flat"] += value
-            return True
-        if normalized_name == "max hp health regen":
-            modifiers["max_hp_regen_pct"] += value / 100.0
-            return True
-
-        return False
-
-    def _parse_item_passive_bonuses(self, item_data):
-        modifiers = _empty_modifiers()
-        abilities = item_data.get("abilities", [])
-        if not isinstance(abilities, list):
-            return modifiers
-
-        for ability in abilities:
-            if not isinstance(ability, dict):
-                continue
-            if str(ability.get("type", "")).strip().lower() != "passive":
-                continue
-
-            description = str(ability.get("description", "") or "").strip()
-            if not description:
-                continue
-
-            if description.startswith("+"):
-                for value_text, label in re.findall(
-                    r"([+-]\d+(?:\.\d+)?%?)\s+([A-Za-z][A-Za-z ]+?)(?=(?:\s+[+-]\d)|[.;]|$)",
-                    description,
-                ):
-                    self._apply_named_stat_bonus(modifiers, label.strip(), value_text)
-                continue
-
-            for label, modifier_key, as_percent in (
-                ("Armor Bonus", "armor_flat", False),
-                ("Attack Speed Bonus", "attack_speed_flat", False),
-                ("Mana Regeneration Bonus", "mana_regen_flat", False),
-                ("Health Regeneration Bonus", "health_regen_flat", False),
-                ("Move Speed Bonus", "move_speed_pct", True),
-                ("Agility Bonus", "agility", False),
-                ("Strength Bonus", "strength", False),
-                ("Intelligence Bonus", "intelligence", False),
-                ("Attack Range Bonus", "attack_range_flat", False),
-            ):
-                for match in re.finditer(
-                    rf"{re.escape(label)}:\s*([+-]?\d+(?:\.\d+)?)%?",
-                    description,
-                    flags=re.IGNORECASE,
-                ):
-                    value = _to_float(match.group(1), default=None)
-                    if value is None:
-                        continue
-                    if as_percent:
-                        modifiers[modifier_key] += value / 100.0
-                    else:
-                        modifiers[modifier_key] += value
-
-        return modifiers
-
-    def _passive_stats_are_complete(self, item_data):
-        abilities = item_data.get("abilities", [])
-        if not isinstance(abilities, list):
-            return False
-        return any(
-            str(ability.get("type", "")).strip().lower() == "passive"
-            and str(ability.get("description", "") or "").strip().startswith("+")
-            for ability in abilities
-            if isinstance(ability, dict)
-        )
-
-    def _modifiers_have_value(self, modifiers):
-        return any(abs(value) > 1e-9 for value in modifiers.values())
-
-    def _collect_state_talent_modifiers(self, hero_data, state, level):
-        modifiers = _empty_modifiers()
-        selected_codes = []
-        applied_labels = []
-        talent_payload = hero_data.get("talents", {})
-
-        for tier in TALENT_TIERS:
-            selection = state["talents"].get(tier, "none")
-            if selection not in {"left", "right"}:
-                continue
-
-            selected_codes.append(f"{tier}{selection[0].upper()}")
-            if level < int(tier):
-                continue
-
-            label = str(talent_payload.get(tier, {}).get(selection, "") or "").strip()
-            if not label:
-                continue
+        state = row_entry["state"]
+        level = state["level"]
+        best_parts = []
+        gain_parts = []
+        for label, stat_key in TALENT_BREAKPOINT_STATS:
+            combo, best_value = table.best_combo(stat_key, level)
+            base_value = table.value(("none",) * len(TALENT_TIERS), level, stat_key)
+            if best_value - base_value > 1e-9:
+                codes = " ".join(
+                    f"{tier}{choice[0].upper()}" for tier, choice in zip(TALENT_TIERS, combo) if choice != "none"
+                )
+                best_parts.append(f"{label} {codes} (+{_format_number(best_value - base_value)})")
+            gains = table.talent_gains(state["talents"], stat_key)
+            if any(abs(gain) > 1e-9 for _tier_level, gain in gains):
+                gain_parts.append(
+                    f"{label} " + " / ".join(f"Lv{tier_level} +{_format_number(gain)}" for tier_level, gain in gains)
+                )
 
-            talent_modifiers, parsed_text = self._parse_talent_stat_bonus(label)
-            if self._modifiers_have_value(talent_modifiers):
-                _merge_modifiers(modifiers, talent_modifiers)
-                applied_labels.append(parsed_text)
-
-        return modifiers, selected_codes, applied_labels
-
-    def _parse_talent_stat_bonus(self, label):
-        modifiers = _empty_modifiers()
-        text = str(label or "").strip()
-        if not text:
-            return modifiers, ""
-
-        match = re.match(r"^([+-])\s*(\d+(?:\.\d+)?)(%?)\s*(.+)$", text)
-        if not match:
-            return modifiers, ""
-
-        sign = -1.0 if match.group(1) == "-" else 1.0
-        value = sign * _to_float(match.group(2))
-        is_percent = bool(match.group(3))
-        remainder = match.group(4).strip().lower()
-
-        if "all attributes" in remainder:
-            modifiers["strength"] += value
-            modifiers["agility"] += value
-            modifiers["intelligence"] += value
-            return modifiers, text
-        if "health regen" in remainder or "health regeneration" in remainder:
-            modifiers["health_regen_flat"] += value
-            return modifiers, text
-        if "mana regen" in remainder or "mana regeneration" in remainder:
-            modifiers["mana_regen_flat"] += value
-            return modifiers, text
-        if "attack speed" in remainder:
-            modifiers["attack_speed_flat"] += value
-            return modifiers, text
-        if "attack damage" in remainder or "attack damage bonus" in remainder:
-            modifiers["attack_damage_flat"] += value
-            return modifiers, text
-        if "move speed" in remainder and "slow" not in remainder:
-            if is_percent:
-                modifiers["move_speed_pct"] += value / 100.0
-            else:
-                modifiers["move_speed_flat"] += value
-            return modifiers, text
-        if "magic resistance" in remainder and "reduction" not in remainder:
-            modifiers["magic_resist_flat"] += value
-            return modifiers, text
-        if "armor" in remainder and "reduction" not in remainder and "reduced" not in remainder and "steal" not in remainder:
-            modifiers["armor_flat"] += value
-            return modifiers, text
-        if "strength" in remainder and "damage" not in remainder:
-            modifiers["strength"] += value
-            return modifiers, text
-        if "agility" in remainder and "damage" not in remainder:
-            modifiers["agility"] += value
-            return modifiers, text
-        if "intelligence" in remainder and "damage" not in remainder:
-            modifiers["intelligence"] += value
-            return modifiers, text
-        if self._is_direct_health_talent(remainder):
-            if is_percent:
-                modifiers["health_pct"] += value / 100.0
-            else:
-                modifiers["health_flat"] += value
-            return modifiers, text
-        if self._is_direct_mana_talent(remainder):
-            if is_percent:
-                modifiers["mana_pct"] += value / 100.0
-            else:
-                modifiers["mana_flat"] += value
-            return modifiers, text
-        if "attack range" in remainder:
-            modifiers["attack_range_flat"] += value
-            return modifiers, text
-
-        return modifiers, ""
-
-    def _is_direct_health_talent(self, remainder):
-        if "health" not in remainder:
-            return False
-        if any(
-            blocked in remainder
-            for blocked in (
-                "regen",
-                "threshold",
-                "restore",
-                "restore amp",
-                "health/damage",
-                "max health as damage",
-                "missing health",
-                "kill threshold",
-                "damage",
-            )
-        ):
-            return False
-        return remainder == "health" or remainder.endswith(" health") or "max health" in remainder
-
-    def _is_direct_mana_talent(self, remainder):
-        if "mana" not in remainder:
-            return False
-        if any(
-            blocked in remainder
-            for blocked in (
-                "regen",
-                "cost",
-                "void",
-                "shock",
-                "break",
-                "restore",
-                "damage",
-                "radius",
-            )
-        ):
-            return False
-        return remainder == "mana" or remainder.endswith(" mana") or "max mana" in remainder
+        lines = [
+            f"Best stat talents at Lv{level} (no items): " + ("; ".join(best_parts) if best_parts else "none change stats")
+        ]
+        if gain_parts:
+            lines.append("Current picks at each talent level: " + "; ".join(gain_parts))
+        self.talent_breakpoint_var.set("\n".join(lines))
 
     def _refresh_selected_hero_summary(self, row_id):
+        self._refresh_talent_breakpoints(row_id)
         if row_id not in self.hero_rows:
             self.selected_applied_summary_var.set("")
             return
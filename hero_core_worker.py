@@ -0,0 +1,111 @@
+"""Background recompute of hero core rows off the Tk main thread"""
+
+import copy
+import threading
+
+
+RECOMPUTE_CHUNK_SIZE = 32
+
+
+class RecomputeJob:
+    """
+    One snapshot of row states queued for recomputation.
+
+    ``row_specs`` is a list of (row_id, hero_name, state) deep-copied at
+    submit time, so edits made on the main thread while the job runs never
+    leak into its results.
+    """
+
+    def __init__(self, job_id, row_specs, target_snapshot=None):
+        self.job_id = job_id
+        self.row_specs = [
+            (row_id, hero_name, copy.deepcopy(state))
+            for row_id, hero_name, state in row_specs
+        ]
+        self.target_snapshot = copy.deepcopy(target_snapshot)
+        self.total_rows = len(self.row_specs)
+        self.done_rows = 0
+        self.results = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.finished_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    @property
+    def finished(self):
+        return self.finished_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class BackgroundRecomputer:
+    """
+    Run engine recomputes on a daemon thread, one live job at a time.
+
+    Submitting a new job cancels the one in flight; a cancelled job stops at
+    its next chunk boundary and never publishes results. The worker touches
+    no Tk state, so the caller polls ``job.done_rows`` / ``job.finished``
+    from ``after()`` callbacks on the main thread and calls ``complete`` once
+    it has applied the results. Until then the job counts as pending, so a
+    row edit made meanwhile must resubmit rather than patch rows the job is
+    about to overwrite with older state.
+    """
+
+    def __init__(self, engine, chunk_size=RECOMPUTE_CHUNK_SIZE):
+        self.engine = engine
+        self.chunk_size = max(1, int(chunk_size))
+        self.active_job = None
+        self.job_sequence = 0
+        self.lock = threading.Lock()
+
+    def submit(self, row_specs, target_snapshot=None):
+        with self.lock:
+            if self.active_job is not None:
+                self.active_job.cancel()
+            self.job_sequence += 1
+            job = RecomputeJob(self.job_sequence, row_specs, target_snapshot)
+            self.active_job = job
+
+        worker = threading.Thread(target=self._run_job, args=(job,), daemon=True)
+        worker.start()
+        return job
+
+    def cancel(self):
+        with self.lock:
+            if self.active_job is not None:
+                self.active_job.cancel()
+            self.active_job = None
+
+    def complete(self, job):
+        with self.lock:
+            if self.active_job is job:
+                self.active_job = None
+
+    def is_current(self, job):
+        return job is self.active_job and not job.cancelled
+
+    def has_pending_job(self):
+        job = self.active_job
+        return job is not None and not job.cancelled
+
+    def _run_job(self, job):
+        results = {}
+        try:
+            for start in range(0, job.total_rows, self.chunk_size):
+                if job.cancelled:
+                    return
+                for row_id, hero_name, state in job.row_specs[start:start + self.chunk_size]:
+                    computed = self.engine.compute_hero_stats(hero_name, self.engine.heroes.get(hero_name, {}), state)
+                    computed.update(self.engine.compute_target_metrics(computed, job.target_snapshot))
+                    results[row_id] = computed
+                job.done_rows = min(job.total_rows, start + self.chunk_size)
+        except Exception as error:  # surfaced to the main thread by the poller
+            job.error = error
+        else:
+            job.results = results
+        finally:
+            job.finished_event.set()
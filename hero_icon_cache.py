@@ -0,0 +1,409 @@
+"""On-disk cache of cropped and tinted hero icon variants for the draft grid"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import tkinter as tk
+import zlib
+
+
+HERO_ICON_CACHE_VERSION = 2
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+HERO_ICON_ATLAS_VERSION = 1
+
+
+def encode_ppm(width, height, pixels):
+    return b"P6\n%d %d\n255\n" % (width, height) + bytes(pixels)
+
+
+def _paeth(left, up, up_left):
+    estimate = left + up - up_left
+    left_distance = abs(estimate - left)
+    up_distance = abs(estimate - up)
+    up_left_distance = abs(estimate - up_left)
+    if left_distance <= up_distance and left_distance <= up_left_distance:
+        return left
+    if up_distance <= up_left_distance:
+        return up
+    return up_left
+
+
+def parse_png_rgb(data):
+    """
+    Return (width, height, rgb bytes) from 8-bit, non-interlaced RGB or RGBA
+    PNG data, which is what Tk's PNG writer produces. Alpha is dropped: the
+    tint, like the Tk version it replaces, only reads each pixel's colour.
+    """
+    if data[:len(PNG_SIGNATURE)] != PNG_SIGNATURE:
+        raise ValueError("Not PNG data.")
+    index = len(PNG_SIGNATURE)
+    header = None
+    compressed = []
+    while index + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[index:index + 8])
+        chunk = data[index + 8:index + 8 + length]
+        index += 12 + length
+        if chunk_type == b"IHDR":
+            header = struct.unpack(">IIBBBBB", chunk)
+        elif chunk_type == b"IDAT":
+            compressed.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+    if header is None:
+        raise ValueError("PNG data has no IHDR chunk.")
+    width, height, bit_depth, color_type, _compression, _filter, interlace = header
+    if bit_depth != 8 or color_type not in (2, 6) or interlace:
+        raise ValueError("Only 8-bit non-interlaced RGB/RGBA PNG data is supported.")
+    channels = 3 if color_type == 2 else 4
+    try:
+        raw = zlib.decompress(b"".join(compressed))
+    except zlib.error as error:
+        raise ValueError(f"Corrupt PNG pixel data: {error}") from error
+    stride = width * channels
+    if len(raw) < (stride + 1) * height:
+        raise ValueError("Truncated PNG pixel data.")
+
+    previous = bytearray(stride)
+    rows = []
+    for row_index in range(height):
+        start = row_index * (stride + 1)
+        filter_type = raw[start]
+        row = bytearray(raw[start + 1:start + 1 + stride])
+        if filter_type == 1:
+            for byte_index in range(channels, stride):
+                row[byte_index] = (row[byte_index] + row[byte_index - channels]) & 0xFF
+        elif filter_type == 2:
+            for byte_index in range(stride):
+                row[byte_index] = (row[byte_index] + previous[byte_index]) & 0xFF
+        elif filter_type == 3:
+            for byte_index in range(stride):
+                left = row[byte_index - channels] if byte_index >= channels else 0
+                row[byte_index] = (row[byte_index] + ((left + previous[byte_index]) >> 1)) & 0xFF
+        elif filter_type == 4:
+            for byte_index in range(stride):
+                left = row[byte_index - channels] if byte_index >= channels else 0
+                up_left = previous[byte_index - channels] if byte_index >= channels else 0
+                row[byte_index] = (row[byte_index] + _paeth(left, previous[byte_index], up_left)) & 0xFF
+        elif filter_type != 0:
+            raise ValueError(f"Unknown PNG filter type {filter_type}.")
+        rows.append(row)
+        previous = row
+
+    pixels = bytearray().join(rows)
+    if channels == 4:
+        rgb = bytearray(width * height * 3)
+        rgb[0::3] = pixels[0::4]
+        rgb[1::3] = pixels[1::4]
+        rgb[2::3] = pixels[2::4]
+        pixels = rgb
+    return width, height, bytes(pixels)
+
+
+def tint_pixels(pixels, overlay_rgb, blend, desaturate):
+    """
+    Desaturate toward luma, then blend toward ``overlay_rgb``, over a packed
+    RGB buffer. Matches the per-pixel float math of the old Tk tint exactly;
+    the blend step is three byte-translate tables and desaturation uses
+    precomputed per-value products.
+    """
+    keep = 1.0 - blend
+    blend_tables = [
+        bytes(max(0, min(255, int((value * keep) + (overlay * blend)))) for value in range(256))
+        for overlay in overlay_rgb
+    ]
+
+    reds = pixels[0::3]
+    greens = pixels[1::3]
+    blues = pixels[2::3]
+    if desaturate > 0.0:
+        inverse = 1.0 - desaturate
+        red_luma = [0.299 * value for value in range(256)]
+        green_luma = [0.587 * value for value in range(256)]
+        blue_luma = [0.114 * value for value in range(256)]
+        channel_part = [value * inverse for value in range(256)]
+        gray_part = [value * desaturate for value in range(256)]
+
+        count = len(reds)
+        desaturated_reds = bytearray(count)
+        desaturated_greens = bytearray(count)
+        desaturated_blues = bytearray(count)
+        for index, (red, green, blue) in enumerate(zip(reds, greens, blues)):
+            gray = gray_part[int((red_luma[red] + green_luma[green]) + blue_luma[blue])]
+            desaturated_reds[index] = int(channel_part[red] + gray)
+            desaturated_greens[index] = int(channel_part[green] + gray)
+            desaturated_blues[index] = int(channel_part[blue] + gray)
+        reds, greens, blues = desaturated_reds, desaturated_greens, desaturated_blues
+
+    tinted = bytearray(len(pixels))
+    tinted[0::3] = reds.translate(blend_tables[0])
+    tinted[1::3] = greens.translate(blend_tables[1])
+    tinted[2::3] = blues.translate(blend_tables[2])
+    return bytes(tinted)
+
+
+def center_crop_photoimage(master, source_image, target_width, target_height):
+    """Subsample ``source_image`` to roughly the target size, then center-crop it into a new PhotoImage."""
+    source_width = int(source_image.width())
+    source_height = int(source_image.height())
+    subsample_factor = max(
+        1,
+        min(
+            max(1, source_width // max(1, int(target_width))),
+            max(1, source_height // max(1, int(target_height))),
+        ),
+    )
+    working_image = (
+        source_image.subsample(subsample_factor, subsample_factor)
+        if subsample_factor > 1
+        else source_image
+    )
+
+    source_width = int(working_image.width())
+    source_height = int(working_image.height())
+    copy_width = min(source_width, int(target_width))
+    copy_height = min(source_height, int(target_height))
+
+    source_x0 = max(0, (source_width - copy_width) // 2)
+    source_y0 = max(0, (source_height - copy_height) // 2)
+    source_x1 = source_x0 + copy_width
+    source_y1 = source_y0 + copy_height
+
+    target_x = max(0, (int(target_width) - copy_width) // 2)
+    target_y = max(0, (int(target_height) - copy_height) // 2)
+
+    cropped_image = tk.PhotoImage(master=master, width=target_width, height=target_height)
+    cropped_image.tk.call(
+        str(cropped_image),
+        "copy",
+        str(working_image),
+        "-from",
+        source_x0,
+        source_y0,
+        source_x1,
+        source_y1,
+        "-to",
+        target_x,
+        target_y,
+    )
+    return cropped_image
+
+
+def _style_key(style):
+    overlay = style.get("overlay")
+    payload = repr(
+        (
+            tuple(overlay) if overlay else None,
+            float(style.get("blend", 0.0) or 0.0),
+            float(style.get("desaturate", 0.0) or 0.0),
+        )
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:10]
+
+
+class HeroIconCache:
+    """
+    Cropped base icons (PNG, so transparency survives) and tinted variants
+    (PPM; the tint yields opaque pixels) as files under ``cache_dir``.
+
+    File names carry the source icon's content hash, the crop size and a
+    hash of the style parameters, so editing an icon or a style simply
+    misses the cache. Base crops are written from Tk images on the main
+    thread; tinted variants are pure byte work and can be built on any
+    thread, which is what ``start_prewarming`` does.
+    """
+
+    def __init__(self, cache_dir, width, height):
+        self.cache_dir = cache_dir
+        self.width = int(width)
+        self.height = int(height)
+        self.source_digests = {}
+        self.lock = threading.Lock()
+        self.prewarm_stop_event = threading.Event()
+
+    def source_digest(self, icon_path):
+        if not icon_path:
+            return None
+        try:
+            stat = os.stat(icon_path)
+        except OSError:
+            return None
+        stat_key = (icon_path, stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            digest = self.source_digests.get(stat_key)
+        if digest is None:
+            try:
+                with open(icon_path, "rb") as handle:
+                    digest = hashlib.sha1(handle.read()).hexdigest()[:20]
+            except OSError:
+                return None
+            with self.lock:
+                self.source_digests[stat_key] = digest
+        return digest
+
+    def _cache_path(self, icon_path, variant_key, extension):
+        digest = self.source_digest(icon_path)
+        if digest is None:
+            return None
+        return os.path.join(
+            self.cache_dir,
+            f"{digest}-{self.width}x{self.height}-v{HERO_ICON_CACHE_VERSION}-{variant_key}.{extension}",
+        )
+
+    def base_path(self, icon_path):
+        return self._cache_path(icon_path, "base", "png")
+
+    def variant_path(self, icon_path, state_key, style):
+        return self._cache_path(icon_path, f"{state_key}-{_style_key(style)}", "ppm")
+
+    def store_base(self, icon_path, image):
+        """Write a cropped Tk PhotoImage as the base crop; failures only cost the cache."""
+        base_path = self.base_path(icon_path)
+        if base_path is None:
+            return None
+        temp_path = f"{base_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            image.write(temp_path, format="png")
+            os.replace(temp_path, base_path)
+        except Exception:  # Tcl or filesystem errors leave the icon uncached.
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return None
+        return base_path
+
+    def ensure_variant(self, icon_path, state_key, style):
+        """Return the tinted variant's path, building it from the cached base crop if needed."""
+        variant_path = self.variant_path(icon_path, state_key, style)
+        if variant_path is None:
+            return None
+        if os.path.exists(variant_path):
+            return variant_path
+
+        base_path = self.base_path(icon_path)
+        try:
+            with open(base_path, "rb") as handle:
+                width, height, pixels = parse_png_rgb(handle.read())
+        except (OSError, ValueError, TypeError):
+            return None
+
+        tinted = tint_pixels(
+            pixels,
+            style["overlay"],
+            float(style.get("blend", 0.0) or 0.0),
+            float(style.get("desaturate", 0.0) or 0.0),
+        )
+        temp_path = f"{variant_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(encode_ppm(width, height, tinted))
+            os.replace(temp_path, variant_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return None
+        return variant_path
+
+    def start_prewarming(self, icon_paths, styles):
+        """
+        Build missing tinted variants for ``icon_paths`` x ``styles``
+        ({state_key: style}) on a daemon thread. Icons without a cached base
+        crop are skipped; they are tinted on demand instead.
+        """
+        self.prewarm_stop_event.set()
+        self.prewarm_stop_event = threading.Event()
+        stop_event = self.prewarm_stop_event
+        icon_paths = list(icon_paths)
+        styles = dict(styles)
+
+        def prewarm():
+            for icon_path in icon_paths:
+                base_path = self.base_path(icon_path)
+                if base_path is None or not os.path.exists(base_path):
+                    continue
+                for state_key, style in styles.items():
+                    if stop_event.is_set():
+                        return
+                    self.ensure_variant(icon_path, state_key, style)
+
+        threading.Thread(target=prewarm, daemon=True).start()
+
+    def stop_prewarming(self):
+        self.prewarm_stop_event.set()
+
+
+class HeroIconAtlas:
+    """
+    Cell lookup for the packed icon atlas written by
+    ``scripts/build_hero_icon_atlas.py``: one row per icon file, one column
+    per draft button state, every cell already cropped (and tinted).
+
+    ``load`` returns None when the atlas is missing or was built for another
+    button size. States whose style changed since the build, and icons whose
+    file size no longer matches, have no cell, so callers fall back to
+    per-icon loading for just those.
+    """
+
+    def __init__(self, atlas_path, cells, sizes):
+        self.atlas_path = atlas_path
+        self.cells = cells
+        self.sizes = sizes
+        self.source_sizes = {}
+
+    @classmethod
+    def load(cls, index_path, width, height, styles):
+        try:
+            with open(index_path, "r", encoding="utf-8") as handle:
+                index = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or index.get("version") != HERO_ICON_ATLAS_VERSION:
+            return None
+        if index.get("cell_width") != int(width) or index.get("cell_height") != int(height):
+            return None
+        atlas_path = os.path.join(os.path.dirname(index_path), str(index.get("image") or ""))
+        if not os.path.isfile(atlas_path):
+            return None
+
+        built_styles = index.get("styles") or {}
+        valid_states = {
+            state_key
+            for state_key, style in styles.items()
+            if built_styles.get(state_key) == _style_key(style)
+        }
+        cells = {}
+        sizes = {}
+        for file_name, entry in (index.get("icons") or {}).items():
+            sizes[file_name] = entry.get("size")
+            cells[file_name] = {
+                state_key: tuple(position)
+                for state_key, position in (entry.get("cells") or {}).items()
+                if state_key in valid_states
+            }
+        return cls(atlas_path, cells, sizes)
+
+    def cell(self, icon_path, state_key):
+        """Return the (x, y) of ``icon_path``'s cell for ``state_key``, or None."""
+        if not icon_path:
+            return None
+        file_name = os.path.basename(icon_path)
+        position = self.cells.get(file_name, {}).get(state_key)
+        if position is None:
+            return None
+        if file_name not in self.source_sizes:
+            try:
+                self.source_sizes[file_name] = os.path.getsize(icon_path)
+            except OSError:
+                self.source_sizes[file_name] = None
+        if self.source_sizes[file_name] != self.sizes.get(file_name):
+            return None
+        return position
+
+
+def atlas_style_keys(styles):
+    return {state_key: _style_key(style) for state_key, style in styles.items()}
@@ -0,0 +1,174 @@
+"""Typed/voice hero-name matching with difflib-identical fuzzy fallbacks"""
+
+import re
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+
+
+HERO_NAME_CUTOFF = 0.72
+HERO_COMPACT_CUTOFF = 0.78
+HERO_MATCH_CACHE_SIZE = 4096
+CLOSE_MATCHER_CACHE_SIZE = 16
+
+
+def normalize_match_text(text):
+    lowered = str(text or "").lower()
+    cleaned = re.sub(r"[^a-z0-9]+", " ", lowered)
+    return re.sub(r"\s+", " ", cleaned).strip()
+
+
+def normalize_compact_text(text):
+    return re.sub(r"[^a-z0-9]+", "", str(text or "").lower())
+
+
+def _calculate_ratio(matches, length):
+    # Same expression difflib uses, so bounds compare exactly against ratio().
+    if length:
+        return 2.0 * matches / length
+    return 1.0
+
+
+def _char_counts(text):
+    counts = {}
+    for char in text:
+        counts[char] = counts.get(char, 0) + 1
+    return counts
+
+
+class CloseMatcher:
+    """
+    ``difflib.get_close_matches(word, choices, n=1, cutoff)`` over a fixed
+    choice list, returning the single best choice or None.
+
+    difflib's real_quick_ratio/quick_ratio upper bounds come from a
+    character -> (choice, count) index built once, so one pass over the
+    word's characters bounds every choice. Survivors are scored with
+    SequenceMatcher in descending bound order and the scan stops once no
+    remaining bound can reach the best score, which keeps difflib's
+    (score, choice) tie-breaking exact.
+    """
+
+    def __init__(self, choices):
+        self.choices = list(choices)
+        self.choice_lengths = [len(choice) for choice in self.choices]
+        self.char_index = {}
+        for choice_index, choice in enumerate(self.choices):
+            for char, count in _char_counts(choice).items():
+                self.char_index.setdefault(char, []).append((choice_index, count))
+
+    def best(self, word, cutoff):
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError(f"cutoff must be in [0.0, 1.0]: {cutoff!r}")
+        word_length = len(word)
+
+        shared_counts = [0] * len(self.choices)
+        for char, word_count in _char_counts(word).items():
+            for choice_index, count in self.char_index.get(char, ()):
+                shared_counts[choice_index] += count if count < word_count else word_count
+
+        candidates = []
+        for choice_index, shared in enumerate(shared_counts):
+            choice_length = self.choice_lengths[choice_index]
+            total_length = word_length + choice_length
+            if _calculate_ratio(shared, total_length) < cutoff:
+                continue
+            if _calculate_ratio(min(word_length, choice_length), total_length) < cutoff:
+                continue
+            candidates.append((_calculate_ratio(shared, total_length), self.choices[choice_index]))
+        if not candidates:
+            return None
+
+        candidates.sort(reverse=True)
+        sequence_matcher = SequenceMatcher()
+        sequence_matcher.set_seq2(word)
+        best = None
+        for bound, choice in candidates:
+            if best is not None and bound < best[0]:
+                break
+            sequence_matcher.set_seq1(choice)
+            score = sequence_matcher.ratio()
+            if score >= cutoff and (best is None or (score, choice) > best):
+                best = (score, choice)
+        return best[1] if best is not None else None
+
+
+class HeroNameMatcher:
+    """
+    Resolve free text to a hero name: exact spaced/compact lookups first,
+    then the closest spaced name (cutoff 0.72), then the closest compact
+    name (cutoff 0.78), exactly as the apps' difflib fallback did.
+
+    Results, misses included, are kept in an LRU keyed by the raw token,
+    since score texts and hero pools repeat the same few tokens. Safe to
+    share between tabs and threads.
+    """
+
+    def __init__(self, match_lookup, compact_lookup, cache_size=HERO_MATCH_CACHE_SIZE):
+        self.match_lookup = match_lookup
+        self.compact_lookup = compact_lookup
+        self.match_matcher = CloseMatcher(match_lookup.keys())
+        self.compact_matcher = CloseMatcher(compact_lookup.keys())
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def match(self, token):
+        cache_key = str(token or "")
+        with self.lock:
+            if cache_key in self.cache:
+                self.cache.move_to_end(cache_key)
+                return self.cache[cache_key]
+
+        hero_name = self._match_uncached(cache_key)
+        with self.lock:
+            self.cache[cache_key] = hero_name
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return hero_name
+
+    def _match_uncached(self, token):
+        normalized = normalize_match_text(token)
+        compact = normalize_compact_text(token)
+        if not normalized and not compact:
+            return None
+
+        if normalized in self.match_lookup:
+            return self.match_lookup[normalized]
+        if compact in self.compact_lookup:
+            return self.compact_lookup[compact]
+
+        if normalized:
+            close_normalized = self.match_matcher.best(normalized, HERO_NAME_CUTOFF)
+            if close_normalized is not None:
+                return self.match_lookup[close_normalized]
+
+        if compact:
+            close_compact = self.compact_matcher.best(compact, HERO_COMPACT_CUTOFF)
+            if close_compact is not None:
+                return self.compact_lookup[close_compact]
+
+        return None
+
+
+_close_matchers = OrderedDict()
+_close_matchers_lock = threading.Lock()
+
+
+def best_close_match(word, choices, cutoff):
+    """
+    ``get_close_matches(word, choices, n=1, cutoff)`` as a single value or
+    None, reusing the precomputed CloseMatcher for recently seen choice lists.
+    """
+    choices_key = tuple(choices)
+    with _close_matchers_lock:
+        matcher = _close_matchers.get(choices_key)
+        if matcher is not None:
+            _close_matchers.move_to_end(choices_key)
+    if matcher is None:
+        matcher = CloseMatcher(choices_key)
+        with _close_matchers_lock:
+            _close_matchers[choices_key] = matcher
+            while len(_close_matchers) > CLOSE_MATCHER_CACHE_SIZE:
+                _close_matchers.popitem(last=False)
+    return matcher.best(word, cutoff)
@@ -0,0 +1,156 @@
+"""Character trie over hero aliases for prefix and token-by-token prefix matching"""
+
+from array import array
+
+ROOT_NODE = 0
+
+
+class AliasPrefixTrie:
+    """
+    Trie over normalized alias strings, one node per distinct alias prefix.
+
+    Nodes are numbered breadth-first with each node's children contiguous,
+    so a node is just its sorted edge characters (``edge_chars``) plus the
+    index of its first child (``first_child``); a step is one ``str.find``.
+    Every node also references the frozenset of owners (heroes) whose
+    aliases pass through it, with identical sets shared.
+
+    Two kinds of lookup are supported:
+
+    * plain prefixes, ``prefix_owners("anti ma")``;
+    * token prefixes, where each spoken/typed token only has to be a prefix
+      of the alias token in the same position (``"ant ma"`` -> "anti mage").
+      This is streamable: ``start`` gives a frontier, ``advance`` feeds one
+      character (a space moves every frontier node to the start of its next
+      alias token) and ``frontier_owners`` reports who is still possible,
+      so the ambiguity count is ``len(frontier_owners(frontier))``.
+    """
+
+    def __init__(self, aliases_by_owner):
+        build_children = [{}]
+        build_owners = [set()]
+        for owner, aliases in aliases_by_owner.items():
+            for alias in aliases:
+                if not alias:
+                    continue
+                node = ROOT_NODE
+                build_owners[node].add(owner)
+                for char in alias:
+                    child = build_children[node].get(char)
+                    if child is None:
+                        child = len(build_children)
+                        build_children[node][char] = child
+                        build_children.append({})
+                        build_owners.append(set())
+                    node = child
+                    build_owners[node].add(owner)
+
+        # Renumber breadth-first so every node's children sit next to each other.
+        order = [ROOT_NODE]
+        for build_node in order:
+            order.extend(build_children[build_node][char] for char in sorted(build_children[build_node]))
+        new_ids = {build_node: new_id for new_id, build_node in enumerate(order)}
+
+        shared_sets = {}
+        self.edge_chars = []
+        self.first_child = array("I", [0]) * len(order)
+        self.owners = []
+        for new_id, build_node in enumerate(order):
+            children = build_children[build_node]
+            edge_chars = "".join(sorted(children))
+            self.edge_chars.append(edge_chars)
+            if edge_chars:
+                self.first_child[new_id] = new_ids[children[edge_chars[0]]]
+            owners = frozenset(build_owners[build_node])
+            self.owners.append(shared_sets.setdefault(owners, owners))
+        self.next_token_cache = {}
+
+    def __len__(self):
+        return len(self.edge_chars)
+
+    def child(self, node, char):
+        position = self.edge_chars[node].find(char)
+        if position < 0:
+            return None
+        return self.first_child[node] + position
+
+    def walk(self, text, node=ROOT_NODE):
+        """Return the node reached by ``text`` from ``node``, or None."""
+        for char in text:
+            node = self.child(node, char)
+            if node is None:
+                return None
+        return node
+
+    def prefix_owners(self, text):
+        node = self.walk(text)
+        return self.owners[node] if node is not None else frozenset()
+
+    def unique_owner(self, text):
+        """Return the only owner with an alias starting with ``text``, else None."""
+        owners = self.prefix_owners(text)
+        if len(owners) == 1:
+            return next(iter(owners))
+        return None
+
+    def next_token_nodes(self, node):
+        """Nodes just past the next space below ``node``, i.e. the starts of the following alias token."""
+        cached = self.next_token_cache.get(node)
+        if cached is not None:
+            return cached
+
+        found = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            first_child = self.first_child[current]
+            for position, char in enumerate(self.edge_chars[current]):
+                if char == " ":
+                    found.append(first_child + position)
+                else:
+                    stack.append(first_child + position)
+        result = tuple(found)
+        self.next_token_cache[node] = result
+        return result
+
+    def start(self):
+        return (ROOT_NODE,)
+
+    def advance(self, frontier, char):
+        """Feed one character of normalized text (single spaces between tokens) into ``frontier``."""
+        if char == " ":
+            successors = []
+            seen = set()
+            for node in frontier:
+                for successor in self.next_token_nodes(node):
+                    if successor not in seen:
+                        seen.add(successor)
+                        successors.append(successor)
+            return tuple(successors)
+
+        advanced = []
+        for node in frontier:
+            child = self.child(node, char)
+            if child is not None:
+                advanced.append(child)
+        return tuple(advanced)
+
+    def frontier_owners(self, frontier):
+        if len(frontier) == 1:
+            return self.owners[frontier[0]]
+        owners = set()
+        for node in frontier:
+            owners.update(self.owners[node])
+        return frozenset(owners)
+
+    def token_prefix_owners(self, tokens):
+        """Owners with an alias whose leading tokens each start with the matching entry of ``tokens``."""
+        frontier = self.start()
+        for index, token in enumerate(tokens):
+            if index:
+                frontier = self.advance(frontier, " ")
+            for char in token:
+                frontier = self.advance(frontier, char)
+                if not frontier:
+                    return frozenset()
+        return self.frontier_owners(frontier)
@@ -1,39 +1,129 @@
+import argparse
+import importlib
+import time
 import tkinter as tk
 from tkinter import ttk
 
-from calculator import DotaCalculator
-from build_planner_app import BuildPlannerApp
-from dataset_hero_app import DatasetHeroApp
-from draft_library_app import HeroDraftLibraryApp
-from hero_core_table_app import HeroCoreTableApp
+from startup_profiler import get_startup_profiler, profile_phase
+
+
+# (tab title, module, app class); modules are imported when the tab is first built.
+TAB_SPECS = (
+    ("Damage Calculator", "calculator", "DotaCalculator"),
+    ("Hero Stats Lab", "dataset_hero_app", "DatasetHeroApp"),
+    ("Draft Library", "draft_library_app", "HeroDraftLibraryApp"),
+    ("Build Planner", "build_planner_app", "BuildPlannerApp"),
+    ("Hero Core Table", "hero_core_table_app", "HeroCoreTableApp"),
+)
+DEFAULT_TAB_INDEX = 2
+PREWARM_DELAY_MS = 250
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Dota 2 Tools")
+    parser.add_argument(
+        "--prewarm-tabs",
+        action="store_true",
+        help="Build the other tabs one at a time in idle time after the first tab is shown.",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Time imports, JSON loads, tab builds and icon creation until the first tab is shown, then print a breakdown.",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        default="",
+        help="With --profile-startup, also write a Chrome trace-event JSON file to this path.",
+    )
+    return parser.parse_args()
+
+
+class LazyTab:
+    """Notebook page that shows a placeholder until its app is first needed."""
+
+    def __init__(self, notebook, title, module_name, class_name):
+        self.title = title
+        self.module_name = module_name
+        self.class_name = class_name
+        self.frame = ttk.Frame(notebook)
+        self.placeholder = ttk.Label(self.frame, text=f"{title} loads when opened.", foreground="#666")
+        self.placeholder.pack(expand=True)
+        self.app = None
+        notebook.add(self.frame, text=title)
+
+    @property
+    def built(self):
+        return self.app is not None
+
+    def build(self):
+        if self.app is not None:
+            return self.app
+        self.placeholder.configure(text=f"Loading {self.title}...")
+        self.placeholder.update_idletasks()
+        with profile_phase("tab", f"build {self.title}"):
+            with profile_phase("tab", f"import {self.module_name}"):
+                app_class = getattr(importlib.import_module(self.module_name), self.class_name)
+            self.placeholder.destroy()
+            self.app = app_class(self.frame)
+        return self.app
+
+
+def finish_startup_profile(trace_path):
+    profiler = get_startup_profiler()
+    profiler.disable()
+    print(profiler.report())
+    if trace_path:
+        try:
+            profiler.write_chrome_trace(trace_path)
+        except OSError as error:
+            print(f"Could not write startup trace to {trace_path}: {error}")
+        else:
+            print(f"Wrote startup trace to {trace_path}")
 
 
 def main():
-    root = tk.Tk()
-    root.title("Dota 2 Tools")
-    root.geometry("1150x1300")
-
-    notebook = ttk.Notebook(root)
-    notebook.pack(fill="both", expand=True)
-
-    calculator_tab = ttk.Frame(notebook)
-    hero_stats_tab = ttk.Frame(notebook)
-    draft_library_tab = ttk.Frame(notebook)
-    build_planner_tab = ttk.Frame(notebook)
-    hero_core_table_tab = ttk.Frame(notebook)
-
-    notebook.add(calculator_tab, text="Damage Calculator")
-    notebook.add(hero_stats_tab, text="Hero Stats Lab")
-    notebook.add(draft_library_tab, text="Draft Library")
-    notebook.add(build_planner_tab, text="Build Planner")
-    notebook.add(hero_core_table_tab, text="Hero Core Table")
-    notebook.select(2)
-
-    DotaCalculator(calculator_tab)
-    DatasetHeroApp(hero_stats_tab)
-    HeroDraftLibraryApp(draft_library_tab)
-    BuildPlannerApp(build_planner_tab)
-    HeroCoreTableApp(hero_core_table_tab)
+    args = parse_args()
+    if args.profile_startup:
+        get_startup_profiler().enable()
+
+    with profile_phase("startup", "create window"):
+        root = tk.Tk()
+        root.title("Dota 2 Tools")
+        root.geometry("1150x1300")
+
+        notebook = ttk.Notebook(root)
+        notebook.pack(fill="both", expand=True)
+
+        tabs = [LazyTab(notebook, title, module_name, class_name) for title, module_name, class_name in TAB_SPECS]
+
+    def prewarm_next_tab():
+        pending = next((tab for tab in tabs if not tab.built), None)
+        if pending is None:
+            return
+        pending.build()
+        root.after(PREWARM_DELAY_MS, lambda: root.after_idle(prewarm_next_tab))
+
+    startup_profile_pending = args.profile_startup
+
+    def handle_tab_changed(_event=None):
+        nonlocal startup_profile_pending
+        tabs[notebook.index(notebook.select())].build()
+        if startup_profile_pending:
+            startup_profile_pending = False
+            first_paint_start = time.perf_counter()
+
+            def record_first_paint():
+                profiler = get_startup_profiler()
+                profiler.record("startup", "first paint", first_paint_start, time.perf_counter())
+                finish_startup_profile(args.profile_trace)
+
+            root.after_idle(record_first_paint)
+
+    notebook.bind("<<NotebookTabChanged>>", handle_tab_changed)
+    notebook.select(DEFAULT_TAB_INDEX)
+    if args.prewarm_tabs:
+        root.after(PREWARM_DELAY_MS, lambda: root.after_idle(prewarm_next_tab))
     root.mainloop()
 
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Pack every draft-grid hero icon variant into one atlas image plus a JSON index.
+
+Each icon in assets/hero-icons is center-cropped to the draft button size and
+tinted for every draft button state, then copied into one row of
+assets/hero-icon-atlas.png (one column per state). The Draft Library tab loads
+that single PNG and slices cells out of it instead of decoding and cropping
+each icon separately. Re-run after adding icons or changing button styles;
+stale cells are ignored by the app and loaded per icon instead.
+
+Needs a Tk display, since Tk decodes and crops the source PNGs exactly as the
+app does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tkinter as tk
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from draft_library_app import (  # noqa: E402
+    DRAFT_BUTTON_STYLE_MAP,
+    DRAFT_GRID_BUTTON_PIXEL_HEIGHT,
+    DRAFT_GRID_BUTTON_PIXEL_WIDTH,
+)
+from hero_icon_cache import (  # noqa: E402
+    HERO_ICON_ATLAS_VERSION,
+    HeroIconCache,
+    atlas_style_keys,
+    center_crop_photoimage,
+)
+
+DEFAULT_ICONS_DIR = PROJECT_ROOT / "assets" / "hero-icons"
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "assets" / "hero-icon-cache"
+DEFAULT_INDEX_PATH = PROJECT_ROOT / "assets" / "hero-icon-atlas.json"
+ATLAS_IMAGE_NAME = "hero-icon-atlas.png"
+ICON_SUFFIX = "_icon_dota2_gameasset.png"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Pack cropped and tinted draft-grid hero icons into one atlas image.",
+    )
+    parser.add_argument(
+        "--icons-dir",
+        default=str(DEFAULT_ICONS_DIR),
+        help="Directory of source hero icons. Default: assets/hero-icons in the project root.",
+    )
+    parser.add_argument(
+        "--index",
+        default=str(DEFAULT_INDEX_PATH),
+        help="Where to write the atlas JSON index; the PNG is written next to it. Default: assets/hero-icon-atlas.json.",
+    )
+    return parser.parse_args()
+
+
+def build_atlas(root: tk.Tk, icon_paths: list[Path], index_path: Path) -> dict:
+    width = DRAFT_GRID_BUTTON_PIXEL_WIDTH
+    height = DRAFT_GRID_BUTTON_PIXEL_HEIGHT
+    state_keys = list(DRAFT_BUTTON_STYLE_MAP.keys())
+    icon_cache = HeroIconCache(str(DEFAULT_CACHE_DIR), width, height)
+
+    atlas_image = tk.PhotoImage(master=root, width=width * len(state_keys), height=height * len(icon_paths))
+    icons = {}
+    for row, icon_path in enumerate(icon_paths):
+        try:
+            source_image = tk.PhotoImage(master=root, file=str(icon_path))
+        except tk.TclError as error:
+            print(f"Skipping {icon_path.name}: {error}")
+            continue
+        cropped_image = center_crop_photoimage(root, source_image, width, height)
+        if icon_cache.store_base(str(icon_path), cropped_image) is None:
+            print(f"Skipping {icon_path.name}: could not write the cropped icon to {DEFAULT_CACHE_DIR}")
+            continue
+
+        cells = {}
+        for column, state_key in enumerate(state_keys):
+            style = DRAFT_BUTTON_STYLE_MAP[state_key]
+            if style.get("overlay") is None:
+                cell_image = cropped_image
+            else:
+                variant_path = icon_cache.ensure_variant(str(icon_path), state_key, style)
+                if variant_path is None:
+                    continue
+                cell_image = tk.PhotoImage(master=root, file=variant_path)
+            x = column * width
+            y = row * height
+            atlas_image.tk.call(str(atlas_image), "copy", str(cell_image), "-to", x, y)
+            cells[state_key] = [x, y]
+
+        icons[icon_path.name] = {
+            "size": os.path.getsize(icon_path),
+            "cells": cells,
+        }
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    atlas_image.write(str(index_path.parent / ATLAS_IMAGE_NAME), format="png")
+    index = {
+        "version": HERO_ICON_ATLAS_VERSION,
+        "image": ATLAS_IMAGE_NAME,
+        "cell_width": width,
+        "cell_height": height,
+        "styles": atlas_style_keys(DRAFT_BUTTON_STYLE_MAP),
+        "icons": icons,
+    }
+    index_path.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return index
+
+
+def main() -> int:
+    args = parse_args()
+    icons_dir = Path(args.icons_dir)
+    index_path = Path(args.index)
+    icon_paths = sorted(icons_dir.glob(f"*{ICON_SUFFIX}"))
+    if not icon_paths:
+        print(f"No hero icons found in {icons_dir}")
+        return 1
+
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        index = build_atlas(root, icon_paths, index_path)
+    finally:
+        root.destroy()
+
+    print(
+        f"Packed {len(index['icons'])} icons x {len(index['styles'])} states "
+        f"into {index_path.parent / ATLAS_IMAGE_NAME}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -464,347 +464,179 @@ def build_combined_view_payload(score: dict | None) -> dict:
     }
 
 
-def score_candidate(
+PAIR_GROUP_BY_TARGET_GROUP = {
+    "enemy": ("vs", True),
+    "ally": ("with", False),
+    "ban": ("vs", True),
+}
+
+
+def _score_raw(score: dict | None) -> float:
+    return score["raw"] if score and score.get("raw") is not None else 0.0
+
+
+def score_candidate_target(
     scores_payload: dict,
     hero_name: str,
     candidate_role_key: str,
-    allies: list[tuple[str, str | None]],
-    enemies: list[tuple[str, str | None]],
-    bans: list[tuple[str, str | None]],
+    target_group: str,
+    target_hero: str,
+    target_role_key: str | None,
 ) -> dict | None:
-    hero_data = scores_payload["heroes"].get(hero_name)
-    if not hero_data:
-        return None
-
-    role_data = hero_data.get("roles", {}).get(candidate_role_key)
+    """
+    Resolve one enemy, ally or ban target's contribution to a candidate.
+
+    Returns {"win", "winDirect", "winReciprocal", "lane", "laneDirect",
+    "laneReciprocal", "detail"} (relief values for bans), or None when the
+    candidate has no data for ``candidate_role_key``. The result depends
+    only on this one candidate/target pair, so callers may cache it.
+    """
+    role_data = scores_payload["heroes"].get(hero_name, {}).get("roles", {}).get(candidate_role_key)
     if not role_data:
         return None
 
-    overall = role_data["overall"]
-    baseline_win_raw = overall["compositeWin"]["raw"] or 0.0
-    baseline_win_conf = overall["compositeWin"]["confidence"] or 0.0
-
-    baseline_lane_raw = (
-        DRAFT_WEIGHTS["lane_baseline_matchup"] * (overall["matchupLane"]["raw"] or 0.0)
-        + DRAFT_WEIGHTS["lane_baseline_synergy"] * (overall["synergyLane"]["raw"] or 0.0)
-    )
-    baseline_lane_conf = (
-        DRAFT_WEIGHTS["lane_baseline_matchup"] * (overall["matchupLane"]["confidence"] or 0.0)
-        + DRAFT_WEIGHTS["lane_baseline_synergy"] * (overall["synergyLane"]["confidence"] or 0.0)
-    )
-
-    enemy_win_contribs = []
-    enemy_win_direct_contribs = []
-    enemy_win_reverse_contribs = []
-    enemy_lane_contribs = []
-    enemy_lane_direct_contribs = []
-    enemy_lane_reverse_contribs = []
-    enemy_details = []
-    for target_hero, target_role_key in enemies:
-        direct_win_score = resolve_pair_score(
+    pair_group, invert_raw = PAIR_GROUP_BY_TARGET_GROUP[target_group]
+    views = {}
+    for score_name in ("win", "lane"):
+        direct_score = resolve_pair_score(
             scores_payload,
             role_data,
-            "vs",
+            pair_group,
             target_hero,
-            "win",
+            score_name,
             target_role_key=target_role_key,
         )
-        reciprocal_win_score = adapt_score_perspective(
+        reciprocal_score = adapt_score_perspective(
             resolve_reverse_pair_score(
                 scores_payload,
                 hero_name,
                 candidate_role_key,
-                "vs",
+                pair_group,
                 target_hero,
-                "win",
+                score_name,
                 target_role_key=target_role_key,
             ),
-            invert_raw=True,
-        )
-        combined_win_score = combine_score_views(direct_win_score, reciprocal_win_score)
-
-        direct_lane_score = resolve_pair_score(
-            scores_payload,
-            role_data,
-            "vs",
-            target_hero,
-            "lane",
-            target_role_key=target_role_key,
-        )
-        reciprocal_lane_score = adapt_score_perspective(
-            resolve_reverse_pair_score(
-                scores_payload,
-                hero_name,
-                candidate_role_key,
-                "vs",
-                target_hero,
-                "lane",
-                target_role_key=target_role_key,
-            ),
-            invert_raw=True,
-        )
-        combined_lane_score = combine_score_views(direct_lane_score, reciprocal_lane_score)
-
-        win_raw = combined_win_score["raw"] if combined_win_score and combined_win_score.get("raw") is not None else 0.0
-        lane_raw = combined_lane_score["raw"] if combined_lane_score and combined_lane_score.get("raw") is not None else 0.0
-        enemy_win_contribs.append(win_raw)
-        enemy_lane_contribs.append(lane_raw)
-        enemy_win_direct_contribs.append(
-            direct_win_score["raw"] if direct_win_score and direct_win_score.get("raw") is not None else 0.0
-        )
-        enemy_win_reverse_contribs.append(
-            reciprocal_win_score["raw"] if reciprocal_win_score and reciprocal_win_score.get("raw") is not None else 0.0
-        )
-        enemy_lane_direct_contribs.append(
-            direct_lane_score["raw"] if direct_lane_score and direct_lane_score.get("raw") is not None else 0.0
-        )
-        enemy_lane_reverse_contribs.append(
-            reciprocal_lane_score["raw"] if reciprocal_lane_score and reciprocal_lane_score.get("raw") is not None else 0.0
+            invert_raw=invert_raw,
         )
-        enemy_details.append(
-            {
-                "hero": target_hero,
-                "roleKey": target_role_key,
-                "role": ROLE_BY_KEY.get(target_role_key) if target_role_key else None,
-                "winRaw": round(win_raw, 4),
-                "laneRaw": round(lane_raw, 4),
-                "winViews": {
-                    "direct": build_score_view_payload(direct_win_score),
-                    "reciprocal": build_score_view_payload(reciprocal_win_score),
-                    "combined": build_combined_view_payload(combined_win_score),
-                },
-                "laneViews": {
-                    "direct": build_score_view_payload(direct_lane_score),
-                    "reciprocal": build_score_view_payload(reciprocal_lane_score),
-                    "combined": build_combined_view_payload(combined_lane_score),
-                },
-            }
+        views[score_name] = (
+            direct_score,
+            reciprocal_score,
+            combine_score_views(direct_score, reciprocal_score),
         )
 
-    ally_win_contribs = []
-    ally_win_direct_contribs = []
-    ally_win_reverse_contribs = []
-    ally_lane_contribs = []
-    ally_lane_direct_contribs = []
-    ally_lane_reverse_contribs = []
-    ally_details = []
-    for target_hero, target_role_key in allies:
-        direct_win_score = resolve_pair_score(
-            scores_payload,
-            role_data,
-            "with",
-            target_hero,
-            "win",
-            target_role_key=target_role_key,
-        )
-        reciprocal_win_score = adapt_score_perspective(
-            resolve_reverse_pair_score(
-                scores_payload,
-                hero_name,
-                candidate_role_key,
-                "with",
-                target_hero,
-                "win",
-                target_role_key=target_role_key,
-            ),
-            invert_raw=False,
-        )
-        combined_win_score = combine_score_views(direct_win_score, reciprocal_win_score)
+    view_payloads = {
+        f"{score_name}Views": {
+            "direct": build_score_view_payload(direct_score),
+            "reciprocal": build_score_view_payload(reciprocal_score),
+            "combined": build_combined_view_payload(combined_score),
+        }
+        for score_name, (direct_score, reciprocal_score, combined_score) in views.items()
+    }
+    win_direct, win_reciprocal, win_combined = (_score_raw(score) for score in views["win"])
+    lane_direct, lane_reciprocal, lane_combined = (_score_raw(score) for score in views["lane"])
 
-        direct_lane_score = resolve_pair_score(
-            scores_payload,
-            role_data,
-            "with",
-            target_hero,
-            "lane",
-            target_role_key=target_role_key,
-        )
-        reciprocal_lane_score = adapt_score_perspective(
-            resolve_reverse_pair_score(
-                scores_payload,
-                hero_name,
-                candidate_role_key,
-                "with",
-                target_hero,
-                "lane",
-                target_role_key=target_role_key,
-            ),
-            invert_raw=False,
-        )
-        combined_lane_score = combine_score_views(direct_lane_score, reciprocal_lane_score)
-
-        win_raw = combined_win_score["raw"] if combined_win_score and combined_win_score.get("raw") is not None else 0.0
-        lane_raw = combined_lane_score["raw"] if combined_lane_score and combined_lane_score.get("raw") is not None else 0.0
-        ally_win_contribs.append(win_raw)
-        ally_lane_contribs.append(lane_raw)
-        ally_win_direct_contribs.append(
-            direct_win_score["raw"] if direct_win_score and direct_win_score.get("raw") is not None else 0.0
-        )
-        ally_win_reverse_contribs.append(
-            reciprocal_win_score["raw"] if reciprocal_win_score and reciprocal_win_score.get("raw") is not None else 0.0
-        )
-        ally_lane_direct_contribs.append(
-            direct_lane_score["raw"] if direct_lane_score and direct_lane_score.get("raw") is not None else 0.0
-        )
-        ally_lane_reverse_contribs.append(
-            reciprocal_lane_score["raw"] if reciprocal_lane_score and reciprocal_lane_score.get("raw") is not None else 0.0
-        )
-        ally_details.append(
-            {
+    if target_group != "ban":
+        return {
+            "win": win_combined,
+            "winDirect": win_direct,
+            "winReciprocal": win_reciprocal,
+            "lane": lane_combined,
+            "laneDirect": lane_direct,
+            "laneReciprocal": lane_reciprocal,
+            "detail": {
                 "hero": target_hero,
                 "roleKey": target_role_key,
                 "role": ROLE_BY_KEY.get(target_role_key) if target_role_key else None,
-                "winRaw": round(win_raw, 4),
-                "laneRaw": round(lane_raw, 4),
-                "winViews": {
-                    "direct": build_score_view_payload(direct_win_score),
-                    "reciprocal": build_score_view_payload(reciprocal_win_score),
-                    "combined": build_combined_view_payload(combined_win_score),
+                "winRaw": round(win_combined, 4),
+                "laneRaw": round(lane_combined, 4),
+                **view_payloads,
+            },
+        }
+
+    relief_win_raw = max(0.0, -win_combined)
+    relief_lane_raw = max(0.0, -lane_combined)
+    direct_relief_win_raw = max(0.0, -win_direct)
+    reciprocal_relief_win_raw = max(0.0, -win_reciprocal)
+    direct_relief_lane_raw = max(0.0, -lane_direct)
+    reciprocal_relief_lane_raw = max(0.0, -lane_reciprocal)
+    return {
+        "win": relief_win_raw,
+        "winDirect": direct_relief_win_raw,
+        "winReciprocal": reciprocal_relief_win_raw,
+        "lane": relief_lane_raw,
+        "laneDirect": direct_relief_lane_raw,
+        "laneReciprocal": reciprocal_relief_lane_raw,
+        "detail": {
+            "hero": target_hero,
+            "roleKey": target_role_key,
+            "role": ROLE_BY_KEY.get(target_role_key) if target_role_key else None,
+            "baseWinRaw": round(win_combined, 4),
+            "baseLaneRaw": round(lane_combined, 4),
+            "reliefWinRaw": round(relief_win_raw, 4),
+            "reliefLaneRaw": round(relief_lane_raw, 4),
+            **view_payloads,
+            "reliefViews": {
+                "win": {
+                    "direct": round_optional(direct_relief_win_raw),
+                    "reciprocal": round_optional(reciprocal_relief_win_raw),
+                    "combined": round_optional(relief_win_raw),
                 },
-                "laneViews": {
-                    "direct": build_score_view_payload(direct_lane_score),
-                    "reciprocal": build_score_view_payload(reciprocal_lane_score),
-                    "combined": build_combined_view_payload(combined_lane_score),
+                "lane": {
+                    "direct": round_optional(direct_relief_lane_raw),
+                    "reciprocal": round_optional(reciprocal_relief_lane_raw),
+                    "combined": round_optional(relief_lane_raw),
                 },
-            }
-        )
+            },
+        },
+    }
 
-    ban_relief_win_contribs = []
-    ban_relief_win_direct_contribs = []
-    ban_relief_win_reverse_contribs = []
-    ban_relief_lane_contribs = []
-    ban_relief_lane_direct_contribs = []
-    ban_relief_lane_reverse_contribs = []
-    ban_details = []
-    for target_hero, target_role_key in bans:
-        direct_win_score = resolve_pair_score(
-            scores_payload,
-            role_data,
-            "vs",
-            target_hero,
-            "win",
-            target_role_key=target_role_key,
-        )
-        reciprocal_win_score = adapt_score_perspective(
-            resolve_reverse_pair_score(
-                scores_payload,
-                hero_name,
-                candidate_role_key,
-                "vs",
-                target_hero,
-                "win",
-                target_role_key=target_role_key,
-            ),
-            invert_raw=True,
-        )
-        combined_win_score = combine_score_views(direct_win_score, reciprocal_win_score)
 
-        direct_lane_score = resolve_pair_score(
-            scores_payload,
-            role_data,
-            "vs",
-            target_hero,
-            "lane",
-            target_role_key=target_role_key,
-        )
-        reciprocal_lane_score = adapt_score_perspective(
-            resolve_reverse_pair_score(
-                scores_payload,
-                hero_name,
-                candidate_role_key,
-                "vs",
-                target_hero,
-                "lane",
-                target_role_key=target_role_key,
-            ),
-            invert_raw=True,
-        )
-        combined_lane_score = combine_score_views(direct_lane_score, reciprocal_lane_score)
-
-        direct_base_win_raw = direct_win_score["raw"] if direct_win_score and direct_win_score.get("raw") is not None else 0.0
-        reciprocal_base_win_raw = reciprocal_win_score["raw"] if reciprocal_win_score and reciprocal_win_score.get("raw") is not None else 0.0
-        base_win_raw = combined_win_score["raw"] if combined_win_score and combined_win_score.get("raw") is not None else 0.0
-
-        direct_base_lane_raw = direct_lane_score["raw"] if direct_lane_score and direct_lane_score.get("raw") is not None else 0.0
-        reciprocal_base_lane_raw = reciprocal_lane_score["raw"] if reciprocal_lane_score and reciprocal_lane_score.get("raw") is not None else 0.0
-        base_lane_raw = combined_lane_score["raw"] if combined_lane_score and combined_lane_score.get("raw") is not None else 0.0
-
-        relief_win_raw = max(0.0, -base_win_raw)
-        relief_lane_raw = max(0.0, -base_lane_raw)
-        direct_relief_win_raw = max(0.0, -direct_base_win_raw)
-        reciprocal_relief_win_raw = max(0.0, -reciprocal_base_win_raw)
-        direct_relief_lane_raw = max(0.0, -direct_base_lane_raw)
-        reciprocal_relief_lane_raw = max(0.0, -reciprocal_base_lane_raw)
-        ban_relief_win_contribs.append(relief_win_raw)
-        ban_relief_lane_contribs.append(relief_lane_raw)
-        ban_relief_win_direct_contribs.append(direct_relief_win_raw)
-        ban_relief_win_reverse_contribs.append(reciprocal_relief_win_raw)
-        ban_relief_lane_direct_contribs.append(direct_relief_lane_raw)
-        ban_relief_lane_reverse_contribs.append(reciprocal_relief_lane_raw)
-        ban_details.append(
-            {
-                "hero": target_hero,
-                "roleKey": target_role_key,
-                "role": ROLE_BY_KEY.get(target_role_key) if target_role_key else None,
-                "baseWinRaw": round(base_win_raw, 4),
-                "baseLaneRaw": round(base_lane_raw, 4),
-                "reliefWinRaw": round(relief_win_raw, 4),
-                "reliefLaneRaw": round(relief_lane_raw, 4),
-                "winViews": {
-                    "direct": build_score_view_payload(direct_win_score),
-                    "reciprocal": build_score_view_payload(reciprocal_win_score),
-                    "combined": build_combined_view_payload(combined_win_score),
-                },
-                "laneViews": {
-                    "direct": build_score_view_payload(direct_lane_score),
-                    "reciprocal": build_score_view_payload(reciprocal_lane_score),
-                    "combined": build_combined_view_payload(combined_lane_score),
-                },
-                "reliefViews": {
-                    "win": {
-                        "direct": round_optional(direct_relief_win_raw),
-                        "reciprocal": round_optional(reciprocal_relief_win_raw),
-                        "combined": round_optional(relief_win_raw),
-                    },
-                    "lane": {
-                        "direct": round_optional(direct_relief_lane_raw),
-                        "reciprocal": round_optional(reciprocal_relief_lane_raw),
-                        "combined": round_optional(relief_lane_raw),
-                    },
-                },
-            }
-        )
+def assemble_candidate_score(
+    scores_payload: dict,
+    hero_name: str,
+    candidate_role_key: str,
+    enemy_terms: list[dict],
+    ally_terms: list[dict],
+    ban_terms: list[dict],
+) -> dict | None:
+    """Combine a candidate's baseline with per-target terms from score_candidate_target."""
+    hero_data = scores_payload["heroes"].get(hero_name)
+    if not hero_data:
+        return None
+
+    role_data = hero_data.get("roles", {}).get(candidate_role_key)
+    if not role_data:
+        return None
 
-    enemy_win_avg = average_or_zero(enemy_win_contribs)
-    enemy_win_direct_avg = average_or_zero(enemy_win_direct_contribs)
-    enemy_win_reverse_avg = average_or_zero(enemy_win_reverse_contribs)
-    enemy_lane_avg = average_or_zero(enemy_lane_contribs)
-    enemy_lane_direct_avg = average_or_zero(enemy_lane_direct_contribs)
-    enemy_lane_reverse_avg = average_or_zero(enemy_lane_reverse_contribs)
-    ally_win_avg = average_or_zero(ally_win_contribs)
-    ally_win_direct_avg = average_or_zero(ally_win_direct_contribs)
-    ally_win_reverse_avg = average_or_zero(ally_win_reverse_contribs)
-    ally_lane_avg = average_or_zero(ally_lane_contribs)
-    ally_lane_direct_avg = average_or_zero(ally_lane_direct_contribs)
-    ally_lane_reverse_avg = average_or_zero(ally_lane_reverse_contribs)
-    ban_relief_win_avg = average_or_zero(ban_relief_win_contribs)
-    ban_relief_win_direct_avg = average_or_zero(ban_relief_win_direct_contribs)
-    ban_relief_win_reverse_avg = average_or_zero(ban_relief_win_reverse_contribs)
-    ban_relief_lane_avg = average_or_zero(ban_relief_lane_contribs)
-    ban_relief_lane_direct_avg = average_or_zero(ban_relief_lane_direct_contribs)
-    ban_relief_lane_reverse_avg = average_or_zero(ban_relief_lane_reverse_contribs)
+    overall = role_data["overall"]
+    baseline_win_raw = overall["compositeWin"]["raw"] or 0.0
+    baseline_win_conf = overall["compositeWin"]["confidence"] or 0.0
+
+    baseline_lane_raw = (
+        DRAFT_WEIGHTS["lane_baseline_matchup"] * (overall["matchupLane"]["raw"] or 0.0)
+        + DRAFT_WEIGHTS["lane_baseline_synergy"] * (overall["synergyLane"]["raw"] or 0.0)
+    )
+    baseline_lane_conf = (
+        DRAFT_WEIGHTS["lane_baseline_matchup"] * (overall["matchupLane"]["confidence"] or 0.0)
+        + DRAFT_WEIGHTS["lane_baseline_synergy"] * (overall["synergyLane"]["confidence"] or 0.0)
+    )
+
+    averages = {}
+    for group_name, terms in (("enemy", enemy_terms), ("ally", ally_terms), ("ban", ban_terms)):
+        for term_key in ("win", "winDirect", "winReciprocal", "lane", "laneDirect", "laneReciprocal"):
+            averages[(group_name, term_key)] = average_or_zero([term[term_key] for term in terms])
 
     draft_win_raw = (
         baseline_win_raw
-        + DRAFT_WEIGHTS["enemy"] * enemy_win_avg
-        + DRAFT_WEIGHTS["ally"] * ally_win_avg
-        + DRAFT_WEIGHTS["ban_relief"] * ban_relief_win_avg
+        + DRAFT_WEIGHTS["enemy"] * averages[("enemy", "win")]
+        + DRAFT_WEIGHTS["ally"] * averages[("ally", "win")]
+        + DRAFT_WEIGHTS["ban_relief"] * averages[("ban", "win")]
     )
     draft_lane_raw = (
         baseline_lane_raw
-        + DRAFT_WEIGHTS["enemy"] * enemy_lane_avg
-        + DRAFT_WEIGHTS["ally_lane"] * ally_lane_avg
-        + DRAFT_WEIGHTS["ban_relief_lane"] * ban_relief_lane_avg
+        + DRAFT_WEIGHTS["enemy"] * averages[("enemy", "lane")]
+        + DRAFT_WEIGHTS["ally_lane"] * averages[("ally", "lane")]
+        + DRAFT_WEIGHTS["ban_relief_lane"] * averages[("ban", "lane")]
     )
     draft_composite_raw = (
         DRAFT_WEIGHTS["composite_win"] * draft_win_raw
@@ -812,14 +644,26 @@ def score_candidate(
     )
 
     confidence_terms = [baseline_win_conf, baseline_lane_conf]
-    for details in (enemy_details, ally_details, ban_details):
-        for detail in details:
+    for terms in (enemy_terms, ally_terms, ban_terms):
+        for term in terms:
             for view_key in ("winViews", "laneViews"):
-                combined_view = detail.get(view_key, {}).get("combined", {})
+                combined_view = term["detail"].get(view_key, {}).get("combined", {})
                 if combined_view.get("available") and combined_view.get("confidence") is not None:
                     confidence_terms.append(float(combined_view["confidence"]))
     draft_confidence = sum(confidence_terms) / len(confidence_terms) if confidence_terms else 0.0
 
+    components = {}
+    for group_name, label in (("enemy", "enemy"), ("ally", "ally"), ("ban", "banRelief")):
+        for term_key, suffix in (
+            ("win", "WinRaw"),
+            ("winDirect", "WinDirectRaw"),
+            ("winReciprocal", "WinReciprocalRaw"),
+            ("lane", "LaneRaw"),
+            ("laneDirect", "LaneDirectRaw"),
+            ("laneReciprocal", "LaneReciprocalRaw"),
+        ):
+            components[f"{label}{suffix}"] = round(averages[(group_name, term_key)], 4)
+
     return {
         "hero": hero_name,
         "roleKey": candidate_role_key,
@@ -831,26 +675,7 @@ def score_candidate(
             "laneRaw": round(baseline_lane_raw, 4),
             "laneConfidence": round(baseline_lane_conf, 4),
         },
-        "components": {
-            "enemyWinRaw": round(enemy_win_avg, 4),
-            "enemyWinDirectRaw": round(enemy_win_direct_avg, 4),
-            "enemyWinReciprocalRaw": round(enemy_win_reverse_avg, 4),
-            "enemyLaneRaw": round(enemy_lane_avg, 4),
-            "enemyLaneDirectRaw": round(enemy_lane_direct_avg, 4),
-            "enemyLaneReciprocalRaw": round(enemy_lane_reverse_avg, 4),
-            "allyWinRaw": round(ally_win_avg, 4),
-            "allyWinDirectRaw": round(ally_win_direct_avg, 4),
-            "allyWinReciprocalRaw": round(ally_win_reverse_avg, 4),
-            "allyLaneRaw": round(ally_lane_avg, 4),
-            "allyLaneDirectRaw": round(ally_lane_direct_avg, 4),
-            "allyLaneReciprocalRaw": round(ally_lane_reverse_avg, 4),
-            "banReliefWinRaw": round(ban_relief_win_avg, 4),
-            "banReliefWinDirectRaw": round(ban_relief_win_direct_avg, 4),
-            "banReliefWinReciprocalRaw": round(ban_relief_win_reverse_avg, 4),
-            "banReliefLaneRaw": round(ban_relief_lane_avg, 4),
-            "banReliefLaneDirectRaw": round(ban_relief_lane_direct_avg, 4),
-            "banReliefLaneReciprocalRaw": round(ban_relief_lane_reverse_avg, 4),
-        },
+        "components": components,
         "draft": {
             "winRaw": round(draft_win_raw, 4),
             "laneRaw": round(draft_lane_raw, 4),
@@ -861,13 +686,114 @@ def score_candidate(
             "compositeNormalized": None,
         },
         "details": {
-            "enemy": enemy_details,
-            "ally": ally_details,
-            "ban": ban_details,
+            "enemy": [term["detail"] for term in enemy_terms],
+            "ally": [term["detail"] for term in ally_terms],
+            "ban": [term["detail"] for term in ban_terms],
         },
     }
 
 
+def score_candidate(
+    scores_payload: dict,
+    hero_name: str,
+    candidate_role_key: str,
+    allies: list[tuple[str, str | None]],
+    enemies: list[tuple[str, str | None]],
+    bans: list[tuple[str, str | None]],
+) -> dict | None:
+    hero_data = scores_payload["heroes"].get(hero_name)
+    if not hero_data or not hero_data.get("roles", {}).get(candidate_role_key):
+        return None
+
+    def terms(target_group, targets):
+        return [
+            score_candidate_target(
+                scores_payload,
+                hero_name,
+                candidate_role_key,
+                target_group,
+                target_hero,
+                target_role_key,
+            )
+            for target_hero, target_role_key in targets
+        ]
+
+    return assemble_candidate_score(
+        scores_payload,
+        hero_name,
+        candidate_role_key,
+        terms("enemy", enemies),
+        terms("ally", allies),
+        terms("ban", bans),
+    )
+
+
+class IncrementalDraftScorer:
+    """
+    score_candidate with per-(candidate, target) terms kept between calls.
+
+    A pick, ban or removal only resolves the terms of the target that
+    changed; every other term is reused and each candidate is re-assembled
+    from its current terms, so results match score_candidate exactly.
+    Terms for targets that leave the draft are dropped on the next call.
+    """
+
+    def __init__(self, scores_payload: dict):
+        self.scores_payload = scores_payload
+        self.terms = {}
+
+    def score(
+        self,
+        hero_name: str,
+        candidate_role_key: str,
+        allies: list[tuple[str, str | None]],
+        enemies: list[tuple[str, str | None]],
+        bans: list[tuple[str, str | None]],
+    ) -> dict | None:
+        hero_data = self.scores_payload["heroes"].get(hero_name)
+        if not hero_data or not hero_data.get("roles", {}).get(candidate_role_key):
+            return None
+
+        def terms(target_group, targets):
+            group_terms = []
+            for target_hero, target_role_key in targets:
+                key = (hero_name, candidate_role_key, target_group, target_hero, target_role_key)
+                term = self.terms.get(key)
+                if term is None:
+                    term = score_candidate_target(
+                        self.scores_payload,
+                        hero_name,
+                        candidate_role_key,
+                        target_group,
+                        target_hero,
+                        target_role_key,
+                    )
+                    self.terms[key] = term
+                group_terms.append(term)
+            return group_terms
+
+        return assemble_candidate_score(
+            self.scores_payload,
+            hero_name,
+            candidate_role_key,
+            terms("enemy", enemies),
+            terms("ally", allies),
+            terms("ban", bans),
+        )
+
+    def retain_targets(self, allies, enemies, bans) -> None:
+        """Drop cached terms for targets no longer in the draft."""
+        live_targets = (
+            {("ally", target_hero, target_role_key) for target_hero, target_role_key in allies}
+            | {("enemy", target_hero, target_role_key) for target_hero, target_role_key in enemies}
+            | {("ban", target_hero, target_role_key) for target_hero, target_role_key in bans}
+        )
+        self.terms = {
+            key: term for key, term in self.terms.items()
+            if (key[2], key[3], key[4]) in live_targets
+        }
+
+
 def finalize_candidate_normalization(rows: list[dict]) -> None:
     win_scale = family_scale([row["draft"]["winRaw"] for row in rows])
     lane_scale = family_scale([row["draft"]["laneRaw"] for row in rows])
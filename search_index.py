@@ -0,0 +1,129 @@
+"""Prebuilt n-gram indexes for instant substring search over table rows"""
+
+
+NGRAM_SIZE = 3
+
+
+def _text_ngrams(text, size):
+    grams = set()
+    length = len(text)
+    for gram_size in range(1, size + 1):
+        for start in range(0, length - gram_size + 1):
+            grams.add(text[start:start + gram_size])
+    return grams
+
+
+class NgramSearchIndex:
+    """
+    Substring index over per-document search text.
+
+    Every document is lowercased and broken into all 1..NGRAM_SIZE character
+    grams. A query resolves by intersecting the posting sets of its query
+    tokens' grams, so only candidate documents are verified against the full
+    text. Results are exactly the documents where ``query in text`` holds.
+    """
+
+    def __init__(self, ngram_size=NGRAM_SIZE):
+        self.ngram_size = max(1, int(ngram_size))
+        self.texts = {}
+        self.postings = {}
+        self.token_cache = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.texts
+
+    def clear(self):
+        self.texts = {}
+        self.postings = {}
+        self.token_cache = {}
+
+    def set_document(self, doc_id, text):
+        """Add or replace the searchable text for a document."""
+        normalized = str(text or "").lower()
+        previous = self.texts.get(doc_id)
+        if previous == normalized:
+            return
+
+        if previous is not None:
+            self._unindex(doc_id, previous)
+
+        self.texts[doc_id] = normalized
+        for gram in _text_ngrams(normalized, self.ngram_size):
+            postings = self.postings.get(gram)
+            if postings is None:
+                postings = self.postings[gram] = set()
+            postings.add(doc_id)
+        self.token_cache = {}
+
+    def remove_document(self, doc_id):
+        previous = self.texts.pop(doc_id, None)
+        if previous is None:
+            return
+        self._unindex(doc_id, previous)
+        self.token_cache = {}
+
+    def _unindex(self, doc_id, text):
+        for gram in _text_ngrams(text, self.ngram_size):
+            postings = self.postings.get(gram)
+            if postings is None:
+                continue
+            postings.discard(doc_id)
+            if not postings:
+                del self.postings[gram]
+
+    def _token_candidates(self, token):
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+
+        if len(token) <= self.ngram_size:
+            candidates = self.postings.get(token, set())
+        else:
+            gram_sets = []
+            for start in range(0, len(token) - self.ngram_size + 1):
+                postings = self.postings.get(token[start:start + self.ngram_size])
+                if not postings:
+                    gram_sets = []
+                    break
+                gram_sets.append(postings)
+            if not gram_sets:
+                candidates = set()
+            else:
+                gram_sets.sort(key=len)
+                candidates = set(gram_sets[0])
+                for postings in gram_sets[1:]:
+                    candidates &= postings
+                    if not candidates:
+                        break
+                candidates = {doc_id for doc_id in candidates if token in self.texts[doc_id]}
+
+        self.token_cache[token] = candidates
+        return candidates
+
+    def search(self, query):
+        """
+        Return the set of document ids whose text contains ``query``.
+
+        Returns None for an empty query so callers can tell "no filter"
+        apart from "no matches".
+        """
+        normalized = str(query or "").lower()
+        if not normalized.strip():
+            return None
+
+        tokens = sorted(set(normalized.split()), key=len, reverse=True)
+        candidates = None
+        for token in tokens:
+            token_candidates = self._token_candidates(token)
+            candidates = set(token_candidates) if candidates is None else candidates & token_candidates
+            if not candidates:
+                return set()
+
+        if candidates is None:
+            candidates = set(self.texts)
+        if len(tokens) == 1 and normalized == tokens[0]:
+            return candidates
+        return {doc_id for doc_id in candidates if normalized in self.texts[doc_id]}
@@ -0,0 +1,136 @@
+"""Opt-in wall-clock phase profiler for app startup (main.py --profile-startup)"""
+
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+IMPORT_EVENT_MIN_MS = 0.5
+
+
+class StartupProfiler:
+    """
+    Collect (category, name, start, duration) phases while enabled.
+
+    Disabled profilers cost one attribute check per ``phase``. Phases may
+    nest; ``report`` groups them by category and name, and
+    ``write_chrome_trace`` emits complete ("X") events that chrome://tracing
+    and Perfetto can open.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events = []
+        self.lock = threading.Lock()
+        self._original_import = None
+
+    def enable(self, track_imports=True):
+        self.enabled = True
+        self.origin = time.perf_counter()
+        self.events = []
+        if track_imports and self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def disable(self):
+        self.enabled = False
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def record(self, category, name, start, end, args=None):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.events.append(
+                {
+                    "category": category,
+                    "name": name,
+                    "start": start - self.origin,
+                    "duration": end - start,
+                    "thread": threading.get_ident(),
+                    "args": args or {},
+                }
+            )
+
+    @contextmanager
+    def phase(self, category, name, **args):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, start, time.perf_counter(), args)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            end = time.perf_counter()
+            if (end - start) * 1000.0 >= IMPORT_EVENT_MIN_MS:
+                self.record("import", name, start, end)
+
+    def summary(self):
+        """Return [(category, name, total_seconds, count)] sorted by total time, longest first."""
+        totals = {}
+        for event in self.events:
+            key = (event["category"], event["name"])
+            total, count = totals.get(key, (0.0, 0))
+            totals[key] = (total + event["duration"], count + 1)
+        return sorted(
+            ((category, name, total, count) for (category, name), (total, count) in totals.items()),
+            key=lambda entry: entry[2],
+            reverse=True,
+        )
+
+    def report(self, limit=40):
+        """
+        Sorted breakdown text. Times are inclusive, so nested phases (an
+        import inside a tab build, say) also count toward their parent.
+        """
+        rows = self.summary()
+        lines = [f"{'ms':>9}  {'count':>5}  {'category':<8}  name"]
+        for category, name, total, count in rows[:limit]:
+            lines.append(f"{total * 1000.0:9.1f}  {count:5d}  {category:<8}  {name}")
+        if len(rows) > limit:
+            lines.append(f"... {len(rows) - limit} more phase(s)")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        process_id = os.getpid()
+        trace_events = [
+            {
+                "name": event["name"],
+                "cat": event["category"],
+                "ph": "X",
+                "ts": round(event["start"] * 1_000_000.0, 3),
+                "dur": round(event["duration"] * 1_000_000.0, 3),
+                "pid": process_id,
+                "tid": event["thread"],
+                "args": event["args"],
+            }
+            for event in sorted(self.events, key=lambda event: (event["start"], -event["duration"]))
+        ]
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, handle)
+
+
+_startup_profiler = StartupProfiler()
+
+
+def get_startup_profiler():
+    return _startup_profiler
+
+
+def profile_phase(category, name, **args):
+    return _startup_profiler.phase(category, name, **args)
@@ -0,0 +1,171 @@
+"""Row models and windowed Treeviews for large, filterable read-only tables"""
+
+from tkinter import ttk
+
+
+class TableModel:
+    """
+    Display rows for one table, kept in their default order.
+
+    ``search_texts[index]`` is the lowercase text a filter is matched
+    against. Sort keys are computed once per column and each (column,
+    reverse) order is cached, so re-sorting or re-filtering never touches
+    the row values again. Typing a longer filter only rescans the previous
+    matches.
+    """
+
+    def __init__(self, rows, search_texts, sort_key):
+        self.rows = rows
+        self.search_texts = search_texts
+        self.sort_key = sort_key
+        self.column_keys = {}
+        self.orders = {}
+        self.filter_text = ""
+        self.filter_matches = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def set_filter(self, filter_text):
+        if filter_text == self.filter_text:
+            return
+        if not filter_text:
+            self.filter_matches = None
+        else:
+            if self.filter_matches is not None and self.filter_text and filter_text.startswith(self.filter_text):
+                candidates = self.filter_matches
+            else:
+                candidates = range(len(self.rows))
+            search_texts = self.search_texts
+            self.filter_matches = [index for index in candidates if filter_text in search_texts[index]]
+        self.filter_text = filter_text
+
+    def view(self, column_index=None, reverse=False):
+        """Return the filtered rows, in default order or sorted by ``column_index``."""
+        if column_index is None:
+            order = self.filter_matches if self.filter_matches is not None else range(len(self.rows))
+            return [self.rows[index] for index in order]
+
+        order_key = (column_index, bool(reverse))
+        order = self.orders.get(order_key)
+        if order is None:
+            keys = self.column_keys.get(column_index)
+            if keys is None:
+                keys = [self.sort_key(row[column_index]) for row in self.rows]
+                self.column_keys[column_index] = keys
+            order = sorted(range(len(self.rows)), key=keys.__getitem__, reverse=bool(reverse))
+            self.orders[order_key] = order
+
+        if self.filter_matches is not None:
+            mask = bytearray(len(self.rows))
+            for index in self.filter_matches:
+                mask[index] = 1
+            order = [index for index in order if mask[index]]
+        return [self.rows[index] for index in order]
+
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    Treeview that holds every row in Python and inserts only the rows that
+    fit on screen.
+
+    ``yview`` and friends scroll the window instead of the widget, so
+    scrollbars wired to ``tree.yview`` and wheel handlers that call
+    ``yview_scroll`` keep working. Connect the vertical scrollbar with
+    ``set_yscroll_callback`` rather than ``yscrollcommand``.
+    """
+
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.virtual_rows = []
+        self.first_row = 0
+        self.visible_rows = max(1, int(self.cget("height") or 1))
+        self.yscroll_callback = None
+        self.bind("<Configure>", self._handle_configure, add="+")
+        self.bind("<Down>", lambda _event: self._handle_step(1), add="+")
+        self.bind("<Up>", lambda _event: self._handle_step(-1), add="+")
+        self.bind("<Next>", lambda _event: self._handle_page(1), add="+")
+        self.bind("<Prior>", lambda _event: self._handle_page(-1), add="+")
+
+    def set_yscroll_callback(self, callback):
+        self.yscroll_callback = callback
+        self._report_scroll()
+
+    def set_rows(self, rows, keep_position=False):
+        self.virtual_rows = list(rows)
+        if not keep_position:
+            self.first_row = 0
+        self._render()
+
+    def yview(self, *args):
+        total = len(self.virtual_rows)
+        if not args:
+            if total <= self.visible_rows:
+                return 0.0, 1.0
+            return self.first_row / total, min(1.0, (self.first_row + self.visible_rows) / total)
+
+        if args[0] == "moveto":
+            self._scroll_to(int(round(float(args[1]) * total)))
+        elif args[0] == "scroll":
+            step = self.visible_rows if str(args[2]).startswith("page") else 1
+            self._scroll_to(self.first_row + int(args[1]) * step)
+        return None
+
+    def yview_moveto(self, fraction):
+        self.yview("moveto", fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview("scroll", number, what)
+
+    def _scroll_to(self, first_row):
+        first_row = max(0, min(int(first_row), len(self.virtual_rows) - self.visible_rows))
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self._render()
+
+    def _render(self):
+        self.first_row = max(0, min(self.first_row, len(self.virtual_rows) - self.visible_rows))
+        children = self.get_children("")
+        if children:
+            self.delete(*children)
+        for row in self.virtual_rows[self.first_row:self.first_row + self.visible_rows]:
+            self.insert("", "end", values=row)
+        self._report_scroll()
+
+    def _report_scroll(self):
+        if self.yscroll_callback is not None:
+            first, last = self.yview()
+            self.yscroll_callback(first, last)
+
+    def _handle_configure(self, _event=None):
+        children = self.get_children("")
+        bbox = self.bbox(children[0]) if children else ""
+        if not bbox:
+            return
+        _x, header_height, _width, row_height = bbox
+        visible_rows = max(1, (self.winfo_height() - header_height) // max(1, row_height))
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self._render()
+
+    def _handle_step(self, direction):
+        children = self.get_children("")
+        focus_item = self.focus()
+        if not children or focus_item not in children:
+            return None
+        edge_item = children[-1] if direction > 0 else children[0]
+        if focus_item != edge_item:
+            return None
+        previous_first = self.first_row
+        self._scroll_to(self.first_row + direction)
+        if self.first_row == previous_first:
+            return "break"
+        children = self.get_children("")
+        edge_item = children[-1] if direction > 0 else children[0]
+        self.selection_set(edge_item)
+        self.focus(edge_item)
+        return "break"
+
+    def _handle_page(self, direction):
+        self.yview_scroll(direction, "pages")
+        return "break"